@@ -0,0 +1,69 @@
+"""
+Compares the insert throughput of random (UUIDv4) and time-ordered (UUIDv7) primary keys.
+
+Rows shaped like the ticket items are inserted in batches into a local SQLite store, whose
+`WITHOUT ROWID` tables are clustered on the primary key like the collections' primary index.
+
+    python benchmarks/ordered_keys.py --rows 500000 --batch 1000
+"""
+
+from piracyshield_service.identifier import OrderedIdentifier
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+
+def measure(generate: callable, rows: int, batch_size: int, path: str) -> dict:
+    connection = sqlite3.connect(path)
+
+    connection.execute('PRAGMA journal_mode = WAL')
+
+    # small page cache, so the cost of touching scattered pages shows up as with a real store
+    connection.execute('PRAGMA cache_size = -8000')
+
+    connection.execute('CREATE TABLE ticket_item (ticket_item_id TEXT PRIMARY KEY, provider_id TEXT, value TEXT) WITHOUT ROWID')
+
+    elapsed = 0
+
+    for start in range(0, rows, batch_size):
+        count = min(batch_size, rows - start)
+
+        batch = [(identifier, 'provider', f'{start + position}.example.org') for position, identifier in enumerate(generate(count))]
+
+        begin = time.perf_counter()
+
+        with connection:
+            connection.executemany('INSERT INTO ticket_item VALUES (?, ?, ?)', batch)
+
+        elapsed += time.perf_counter() - begin
+
+    connection.close()
+
+    return {
+        'rows_per_second': round(rows / elapsed)
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--rows', type = int, default = 500000)
+    parser.add_argument('--batch', type = int, default = 1000)
+
+    arguments = parser.parse_args()
+
+    ordered_identifier = OrderedIdentifier()
+
+    generators = {
+        'random': lambda count: [uuid.uuid4().hex for _ in range(count)],
+        'ordered': ordered_identifier.generate_batch
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, generate in generators.items():
+            result = measure(generate, arguments.rows, arguments.batch, os.path.join(directory, f'{name}.db'))
+
+            print(json.dumps({'keys': name, 'rows': arguments.rows, 'batch': arguments.batch, **result}))
@@ -0,0 +1,84 @@
+"""
+Compares the scalar and the vectorised whitelist flags of the relation step.
+
+Random IPv4/IPv6 tickets are flagged against random whitelists; both paths must return the same flags.
+The packed networks are built once per cache revision, so their build time is reported apart.
+Duplicates are exact string matches and stay on the hashed sets. Requires NumPy (the `vectorized` extra).
+
+    python benchmarks/relation_flags.py --items 3000 --networks 2000
+"""
+
+from piracyshield_service import packed
+
+from piracyshield_service.whitelist.matcher import WhitelistMatcher
+
+import argparse
+import ipaddress
+import json
+import random
+import time
+
+def random_addresses(version: int, count: int) -> list:
+    address_class = ipaddress.IPv4Address if version == 4 else ipaddress.IPv6Address
+
+    bits = 32 if version == 4 else 128
+
+    return [str(address_class(random.getrandbits(bits))) for _ in range(count)]
+
+def random_networks(version: int, count: int) -> list:
+    bits = 32 if version == 4 else 128
+
+    return [str(ipaddress.ip_network((random.getrandbits(bits), random.randint(bits // 4, bits)), strict = False)) for _ in range(count)]
+
+def measure(callable: callable, repeat: int) -> tuple:
+    result = None
+
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        result = callable()
+
+    return (result, (time.perf_counter() - start) * 1000 / repeat)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--items', type = int, default = 3000)
+    parser.add_argument('--networks', type = int, default = 2000)
+    parser.add_argument('--repeat', type = int, default = 5)
+
+    arguments = parser.parse_args()
+
+    if not packed.is_available():
+        raise SystemExit('NumPy is not installed.')
+
+    random.seed(0)
+
+    for genre, version in (('ipv4', 4), ('ipv6', 6)):
+        items = random_addresses(version, arguments.items)
+
+        whitelist = {
+            genre: random_addresses(version, arguments.networks) + random.sample(items, arguments.items // 10),
+            f'cidr_{genre}': random_networks(version, arguments.networks)
+        }
+
+        whitelist_matcher = WhitelistMatcher(whitelist)
+
+        (_, build_ms) = measure(lambda: packed.PackedNetworkSet(version, whitelist.get(f'cidr_{genre}')), 1)
+
+        # builds the packed networks outside of the measures
+        whitelist_matcher.is_whitelisted_many(genre, items)
+
+        (scalar_whitelisted, scalar_whitelisted_ms) = measure(lambda: [whitelist_matcher.is_whitelisted(genre, value) for value in items], arguments.repeat)
+        (vectorised_whitelisted, vectorised_whitelisted_ms) = measure(lambda: whitelist_matcher.is_whitelisted_many(genre, items), arguments.repeat)
+
+        print(json.dumps({
+            'genre': genre,
+            'items': len(items),
+            'networks': arguments.networks,
+            'build_ms': round(build_ms, 2),
+            'scalar_whitelist_ms': round(scalar_whitelisted_ms, 2),
+            'vectorised_whitelist_ms': round(vectorised_whitelisted_ms, 2),
+            'whitelisted': sum(scalar_whitelisted),
+            'identical': scalar_whitelisted == vectorised_whitelisted
+        }))
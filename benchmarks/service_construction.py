@@ -0,0 +1,91 @@
+"""
+Measures the construction cost of the services and the number of sockets they keep open.
+
+Requires a reachable Redis instance and the application configs, then run:
+
+    python benchmarks/service_construction.py --iterations 100 --baseline <revision>
+
+The `baseline` run extracts the sources of the given git revision (ie. the commit before the shared connections
+and the lazy task service) and measures them in a separate interpreter, so both runs build `TicketCreateService`
+with the code of their own revision: eagerly, with a Redis client per service, or lazily with shared connections.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+def count_open_sockets() -> int:
+    count = 0
+
+    for fd in os.listdir('/proc/self/fd'):
+        try:
+            if os.readlink(f'/proc/self/fd/{fd}').startswith('socket:'):
+                count += 1
+
+        except OSError:
+            continue
+
+    return count
+
+def run(iterations: int) -> dict:
+    # imported here, so the sources of the revision set in `PYTHONPATH` are used
+    from piracyshield_service.ticket.create import TicketCreateService
+
+    sockets_before = count_open_sockets()
+
+    services = []
+
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        services.append(TicketCreateService())
+
+    construction_time = time.perf_counter() - start
+
+    # simulate a scheduled task for every instance
+    for service in services:
+        service.task_service.redis_connection.ping()
+
+    return {
+        'iterations': iterations,
+        'construction_ms': round(construction_time * 1000 / iterations, 3),
+        'open_sockets': count_open_sockets() - sockets_before
+    }
+
+def run_revision(revision: str, iterations: int) -> dict:
+    root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'], text = True).strip()
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = subprocess.run(['git', 'archive', revision, 'src'], cwd = root, check = True, capture_output = True)
+
+        subprocess.run(['tar', '-x', '-C', directory], input = archive.stdout, check = True)
+
+        output = subprocess.check_output(
+            [sys.executable, os.path.abspath(__file__), '--iterations', str(iterations), '--json'],
+            env = {**os.environ, 'PYTHONPATH': os.path.join(directory, 'src')},
+            text = True
+        )
+
+    return json.loads(output.strip().splitlines()[-1])
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--iterations', type = int, default = 100)
+    parser.add_argument('--baseline', help = 'git revision to compare with')
+    parser.add_argument('--json', action = 'store_true', help = 'only measure the importable sources')
+
+    arguments = parser.parse_args()
+
+    if arguments.json:
+        print(json.dumps(run(arguments.iterations)))
+
+    else:
+        if arguments.baseline:
+            print({'revision': arguments.baseline, **run_revision(arguments.baseline, arguments.iterations)})
+
+        print({'revision': 'current', **run(arguments.iterations)})
@@ -0,0 +1,74 @@
+"""
+Measures the cold start of the API-facing services and of the task worker.
+
+Every target runs in a fresh interpreter, reporting the time needed to import its module
+and the time needed to build the first instance (the first request of a freshly deployed process).
+
+    python benchmarks/startup.py --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+TARGETS = [
+    'piracyshield_service.ticket.create.TicketCreateService',
+    'piracyshield_service.ticket.remove.TicketRemoveService',
+    'piracyshield_service.ticket.get_all_by_provider.TicketGetAllByProviderService',
+    'piracyshield_service.ticket.item.fqdn.get_all_by_provider.TicketItemFQDNGetAllByProviderService',
+    'piracyshield_service.ticket.item.set_processed.TicketItemSetProcessedService',
+    'piracyshield_service.forensic.create_archive.ForensicCreateArchiveService',
+    'piracyshield_service.authentication.authenticate.AuthenticationAuthenticateService',
+    'piracyshield_service.task.worker.TaskWorkerService'
+]
+
+PROBE = """
+import importlib, json, sys, time
+
+(module_name, class_name) = sys.argv[1].rsplit('.', 1)
+
+start = time.perf_counter()
+
+module = importlib.import_module(module_name)
+
+imported = time.perf_counter()
+
+getattr(module, class_name)()
+
+built = time.perf_counter()
+
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'first_instance_ms': (built - imported) * 1000,
+    'modules': len(sys.modules)
+}))
+"""
+
+def probe(target: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE, target],
+        capture_output = True,
+        text = True,
+        check = True
+    )
+
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--repeat', type = int, default = 5)
+
+    arguments = parser.parse_args()
+
+    for target in TARGETS:
+        samples = [probe(target) for _ in range(arguments.repeat)]
+
+        print(json.dumps({
+            'target': target,
+            'import_ms': round(statistics.median(s.get('import_ms') for s in samples), 2),
+            'first_instance_ms': round(statistics.median(s.get('first_instance_ms') for s in samples), 2),
+            'modules': samples[-1].get('modules')
+        }))
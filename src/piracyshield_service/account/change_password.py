@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.security.hasher import Hasher, HasherNonValidException
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_model.account.model import (
     AccountModel,
     AccountModelPasswordException,
@@ -41,7 +44,7 @@ class AccountChangePasswordService(BaseService):
         # child data storage class
         self.data_storage = data_storage()
 
-        self.account_set_flag_service = AccountSetFlagService(data_storage)
+        self.account_set_flag_service = ServiceFactory.get(AccountSetFlagService, data_storage)
 
         self._prepare_configs()
 
@@ -149,7 +152,7 @@ class AccountChangePasswordService(BaseService):
         Loads the configs.
         """
 
-        self.hasher_config = Config('security/token').get('hasher')
+        self.hasher_config = ConfigCache.get('security/token').get('hasher')
 
     def _prepare_modules(self):
         """
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.security.hasher import Hasher, HasherGenericException
 from piracyshield_component.security.identifier import Identifier
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_model.account.model import (
     AccountModel,
     AccountModelNameException,
@@ -222,7 +225,7 @@ class AccountCreateService(BaseService):
         Loads the configs.
         """
 
-        self.hasher_config = Config('security/token').get('hasher')
+        self.hasher_config = ConfigCache.get('security/token').get('hasher')
 
     def _prepare_modules(self):
         """
@@ -243,4 +246,4 @@ class AccountCreateService(BaseService):
 
         self.authentication_storage = AuthenticationStorage()
 
-        self.authentication_exists_by_email_service = AuthenticationExistsByEmailService()
+        self.authentication_exists_by_email_service = ServiceFactory.get(AuthenticationExistsByEmailService)
@@ -29,6 +29,8 @@ class AccountErrorCode:
 
     PASSWORD_DIFF = '3014'
 
+    NON_VALID_CURSOR = '3015'
+
 class AccountErrorMessage:
 
     GENERIC = 'Error during the creation of the account.'
@@ -58,3 +60,5 @@ class AccountErrorMessage:
     PASSWORD_CHANGE_MISMATCH = 'Current password is wrong.'
 
     PASSWORD_DIFF = 'The new password should be different from the current password.'
+
+    NON_VALID_CURSOR = 'Non valid pagination cursor.'
@@ -44,6 +44,34 @@ class AccountExistsByIdentifierService(BaseService):
 
             raise ApplicationException(AccountErrorCode.GENERIC, AccountErrorMessage.GENERIC, e)
 
+    def execute_many(self, account_ids: list) -> list | Exception:
+        """
+        Checks multiple identifiers with a single query, by identifier when the storage supports it.
+
+        :param account_ids: list of account identifiers.
+        :return: the identifiers not found.
+        """
+
+        try:
+            get_all_by_identifiers = getattr(self.data_storage, 'get_all_by_identifiers', None)
+
+            if get_all_by_identifiers is not None:
+                response = get_all_by_identifiers(
+                    identifiers = list(account_ids)
+                )
+
+            else:
+                response = self.data_storage.get_all()
+
+            existent = {account.get('account_id') for account in response.batch()}
+
+        except AccountStorageGetException as e:
+            self.logger.error(f'Could not verify if the accounts exist with the identifiers `{list(account_ids)}`')
+
+            raise ApplicationException(AccountErrorCode.GENERIC, AccountErrorMessage.GENERIC, e)
+
+        return [account_id for account_id in account_ids if account_id not in existent]
+
     def _schedule_task(self):
         pass
 
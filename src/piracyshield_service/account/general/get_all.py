@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_component.exception import ApplicationException
+
 from piracyshield_data_storage.account.general.storage import GeneralAccountStorage, GeneralAccountStorageGetException
 
+from piracyshield_service.pagination import KeysetPaginator, PaginationCursorException, PaginationKeyException
+
 from piracyshield_service.account.errors import AccountErrorCode, AccountErrorMessage
 
 class GeneralAccountGetAllService(BaseService):
@@ -14,6 +18,8 @@ class GeneralAccountGetAllService(BaseService):
 
     data_storage = None
 
+    paginator = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -41,6 +47,38 @@ class GeneralAccountGetAllService(BaseService):
 
             raise ApplicationException(AccountErrorCode.GENERIC, AccountErrorMessage.GENERIC)
 
+    def execute_page(self, cursor: str = None, limit: int = None, fields: list = None) -> dict | Exception:
+        """
+        Returns a page of accounts, to go through them without reading them all.
+
+        :param cursor: the cursor of the previous page, None for the first page.
+        :param limit: number of accounts of the page.
+        :param fields: optional list of fields to return (ie. `account_id`, `name`).
+        :return: the `items` of the page and the `cursor` of the next page, None if this is the last one.
+        """
+
+        try:
+            return self.paginator.paginate_storage(
+                self.data_storage,
+                'get_all',
+                cursor = cursor,
+                limit = limit,
+                fields = fields
+            )
+
+        except PaginationCursorException:
+            raise ApplicationException(AccountErrorCode.NON_VALID_CURSOR, AccountErrorMessage.NON_VALID_CURSOR)
+
+        except PaginationKeyException as e:
+            self.logger.error(f'Could not paginate, a document has no `{e}`')
+
+            raise ApplicationException(AccountErrorCode.GENERIC, AccountErrorMessage.GENERIC, e)
+
+        except GeneralAccountStorageGetException as e:
+            self.logger.error(f'Could not retrieve any account')
+
+            raise ApplicationException(AccountErrorCode.GENERIC, AccountErrorMessage.GENERIC, e)
+
     def _schedule_task(self):
         pass
 
@@ -52,3 +90,5 @@ class GeneralAccountGetAllService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = GeneralAccountStorage()
+
+        self.paginator = KeysetPaginator(key = ('account_id',))
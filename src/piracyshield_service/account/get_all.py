@@ -6,6 +6,8 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.account.storage import AccountStorageGetException
 
+from piracyshield_service.pagination import KeysetPaginator, PaginationCursorException, PaginationKeyException
+
 from piracyshield_service.account.errors import AccountErrorCode, AccountErrorMessage
 
 class AccountGetAllService(BaseService):
@@ -16,6 +18,8 @@ class AccountGetAllService(BaseService):
 
     data_storage = None
 
+    paginator = None
+
     def __init__(self, data_storage: AccountStorage):
         """
         Inizialize logger and required modules.
@@ -24,6 +28,8 @@ class AccountGetAllService(BaseService):
         # child data storage class
         self.data_storage = data_storage()
 
+        self.paginator = KeysetPaginator(key = ('account_id',))
+
         super().__init__()
 
     def execute(self) -> list | Exception:
@@ -44,6 +50,38 @@ class AccountGetAllService(BaseService):
 
             raise ApplicationException(AccountErrorCode.GENERIC, AccountErrorMessage.GENERIC, e)
 
+    def execute_page(self, cursor: str = None, limit: int = None, fields: list = None) -> dict | Exception:
+        """
+        Returns a page of accounts, to go through them without reading them all.
+
+        :param cursor: the cursor of the previous page, None for the first page.
+        :param limit: number of accounts of the page.
+        :param fields: optional list of fields to return (ie. `account_id`, `name`).
+        :return: the `items` of the page and the `cursor` of the next page, None if this is the last one.
+        """
+
+        try:
+            return self.paginator.paginate_storage(
+                self.data_storage,
+                'get_all',
+                cursor = cursor,
+                limit = limit,
+                fields = fields
+            )
+
+        except PaginationCursorException:
+            raise ApplicationException(AccountErrorCode.NON_VALID_CURSOR, AccountErrorMessage.NON_VALID_CURSOR)
+
+        except PaginationKeyException as e:
+            self.logger.error(f'Could not paginate, a document has no `{e}`')
+
+            raise ApplicationException(AccountErrorCode.GENERIC, AccountErrorMessage.GENERIC, e)
+
+        except AccountStorageGetException as e:
+            self.logger.error(f'Could not retrieve any account')
+
+            raise ApplicationException(AccountErrorCode.GENERIC, AccountErrorMessage.GENERIC, e)
+
     def _schedule_task(self):
         pass
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.config import Config
 from piracyshield_component.exception import ApplicationException
 
@@ -64,6 +66,6 @@ class AccountSessionCreateService(BaseService):
         Initialize and set the instances.
         """
 
-        self.account_session_create_long_session_service = AccountSessionCreateLongSessionService()
+        self.account_session_create_long_session_service = ServiceFactory.get(AccountSessionCreateLongSessionService)
 
-        self.account_session_create_short_session_service = AccountSessionCreateShortSessionService()
+        self.account_session_create_short_session_service = ServiceFactory.get(AccountSessionCreateShortSessionService)
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_storage.account.session.memory import AccountSessionMemory, AccountSessionMemorySetException, AccountSessionMemoryGetException
 
+from piracyshield_service.connection import ConnectionRegistry
+
 from piracyshield_service.account.errors import AccountErrorCode, AccountErrorMessage
 
 from datetime import timedelta
@@ -72,15 +75,16 @@ class AccountSessionCreateLongSessionService(BaseService):
         Loads the configs.
         """
 
-        self.session_config = Config('security/session')
+        self.session_config = ConfigCache.get('security/session')
 
-        self.jwt_token_config = Config('security/token').get('jwt_token')
+        self.jwt_token_config = ConfigCache.get('security/token').get('jwt_token')
 
     def _prepare_modules(self) -> None:
         """
         Initialize and set the instances.
         """
 
-        self.data_memory = AccountSessionMemory(
+        self.data_memory = ConnectionRegistry.get_memory(
+            memory_class = AccountSessionMemory,
             database = self.session_config.get('database').get('memory_database')
         )
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_storage.account.session.memory import AccountSessionMemory, AccountSessionMemorySetException, AccountSessionMemoryGetException
 
+from piracyshield_service.connection import ConnectionRegistry
+
 from piracyshield_service.account.session.get_current_by_account import AccountSessionGetCurrentByAccountService
 from piracyshield_service.account.session.remove_long_session import AccountSessionRemoveLongSessionService
 from piracyshield_service.account.session.remove_short_session import AccountSessionRemoveShortSessionService
@@ -98,23 +103,24 @@ class AccountSessionDestroyCurrentSessionsService(BaseService):
         Loads the configs.
         """
 
-        self.session_config = Config('security/session')
+        self.session_config = ConfigCache.get('security/session')
 
     def _prepare_modules(self) -> None:
         """
         Initialize and set the instances.
         """
 
-        self.data_memory = AccountSessionMemory(
+        self.data_memory = ConnectionRegistry.get_memory(
+            memory_class = AccountSessionMemory,
             database = self.session_config.get('database').get('memory_database')
         )
 
-        self.account_session_get_current_by_account_service = AccountSessionGetCurrentByAccountService()
+        self.account_session_get_current_by_account_service = ServiceFactory.get(AccountSessionGetCurrentByAccountService)
 
-        self.account_session_remove_long_session_service = AccountSessionRemoveLongSessionService()
+        self.account_session_remove_long_session_service = ServiceFactory.get(AccountSessionRemoveLongSessionService)
 
-        self.account_session_remove_short_session_service = AccountSessionRemoveShortSessionService()
+        self.account_session_remove_short_session_service = ServiceFactory.get(AccountSessionRemoveShortSessionService)
 
-        self.security_blacklist_add_refresh_token_service = SecurityBlacklistAddRefreshTokenService()
+        self.security_blacklist_add_refresh_token_service = ServiceFactory.get(SecurityBlacklistAddRefreshTokenService)
 
-        self.security_blacklist_add_access_token_service = SecurityBlacklistAddAccessTokenService()
+        self.security_blacklist_add_access_token_service = ServiceFactory.get(SecurityBlacklistAddAccessTokenService)
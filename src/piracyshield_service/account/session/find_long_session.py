@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_storage.account.session.memory import AccountSessionMemory, AccountSessionMemorySetException, AccountSessionMemoryGetException
 
+from piracyshield_service.connection import ConnectionRegistry
+
 class AccountSessionFindLongSessionService(BaseService):
 
     """
@@ -44,13 +47,14 @@ class AccountSessionFindLongSessionService(BaseService):
         Loads the configs.
         """
 
-        self.session_config = Config('security/session')
+        self.session_config = ConfigCache.get('security/session')
 
     def _prepare_modules(self) -> None:
         """
         Initialize and set the instances.
         """
 
-        self.data_memory = AccountSessionMemory(
+        self.data_memory = ConnectionRegistry.get_memory(
+            memory_class = AccountSessionMemory,
             database = self.session_config.get('database').get('memory_database')
         )
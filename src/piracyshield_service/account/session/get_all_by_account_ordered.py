@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_storage.account.session.memory import AccountSessionMemory, AccountSessionMemorySetException, AccountSessionMemoryGetException
 
+from piracyshield_service.connection import ConnectionRegistry
+
 class AccountSessionGetAllByAccountOrderedService(BaseService):
 
     """
@@ -84,13 +87,14 @@ class AccountSessionGetAllByAccountOrderedService(BaseService):
         Loads the configs.
         """
 
-        self.session_config = Config('security/session')
+        self.session_config = ConfigCache.get('security/session')
 
     def _prepare_modules(self) -> None:
         """
         Initialize and set the instances.
         """
 
-        self.data_memory = AccountSessionMemory(
+        self.data_memory = ConnectionRegistry.get_memory(
+            memory_class = AccountSessionMemory,
             database = self.session_config.get('database').get('memory_database')
         )
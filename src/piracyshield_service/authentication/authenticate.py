@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.exception import ApplicationException
 from piracyshield_component.security.hasher import Hasher, HasherNonValidException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_model.authentication.model import AuthenticationModel, AuthenticationModelEmailException, AuthenticationModelPasswordException
 
 from piracyshield_data_storage.authentication.storage import AuthenticationStorage, AuthenticationStorageGetException
@@ -150,9 +153,9 @@ class AuthenticationAuthenticateService(BaseService):
         Loads the configs.
         """
 
-        self.hasher_config = Config('security/token').get('hasher')
+        self.hasher_config = ConfigCache.get('security/token').get('hasher')
 
-        self.security_anti_brute_force_config = Config('security/anti_brute_force').get('general')
+        self.security_anti_brute_force_config = ConfigCache.get('security/anti_brute_force').get('general')
 
     def _prepare_modules(self) -> None:
         """
@@ -171,12 +174,12 @@ class AuthenticationAuthenticateService(BaseService):
             salt_length = self.hasher_config.get('salt_length')
         )
 
-        self.authentication_get_service = AuthenticationGetService()
+        self.authentication_get_service = ServiceFactory.get(AuthenticationGetService)
 
-        self.authentication_generate_access_token_service = AuthenticationGenerateAccessTokenService()
+        self.authentication_generate_access_token_service = ServiceFactory.get(AuthenticationGenerateAccessTokenService)
 
-        self.authentication_generate_refresh_token_service = AuthenticationGenerateRefreshTokenService()
+        self.authentication_generate_refresh_token_service = ServiceFactory.get(AuthenticationGenerateRefreshTokenService)
 
-        self.account_session_create_service = AccountSessionCreateService()
+        self.account_session_create_service = ServiceFactory.get(AccountSessionCreateService)
 
-        self.security_anti_brute_force_service = SecurityAntiBruteForceService()
+        self.security_anti_brute_force_service = ServiceFactory.get(SecurityAntiBruteForceService)
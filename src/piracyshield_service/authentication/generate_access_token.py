@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
 from piracyshield_component.exception import ApplicationException
 from piracyshield_component.security.token import JWTToken, JWTTokenGenericException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_service.authentication.errors import AuthenticationErrorCode, AuthenticationErrorMessage
 
 class AuthenticationGenerateAccessTokenService(BaseService):
@@ -49,7 +50,7 @@ class AuthenticationGenerateAccessTokenService(BaseService):
         Loads the configs.
         """
 
-        self.jwt_token_config = Config('security/token').get('jwt_token')
+        self.jwt_token_config = ConfigCache.get('security/token').get('jwt_token')
 
     def _prepare_modules(self) -> None:
         """
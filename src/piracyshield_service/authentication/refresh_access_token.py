@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_service.authentication.verify_refresh_token import AuthenticationVerifyRefreshTokenService
 from piracyshield_service.authentication.generate_access_token import AuthenticationGenerateAccessTokenService
 
@@ -88,17 +91,17 @@ class AuthenticationRefreshAccessTokenService(BaseService):
         Loads the configs.
         """
 
-        self.jwt_token_config = Config('security/token').get('jwt_token')
+        self.jwt_token_config = ConfigCache.get('security/token').get('jwt_token')
 
     def _prepare_modules(self) -> None:
         """
         Initialize and set the instances.
         """
 
-        self.authentication_verify_refresh_token_service = AuthenticationVerifyRefreshTokenService()
+        self.authentication_verify_refresh_token_service = ServiceFactory.get(AuthenticationVerifyRefreshTokenService)
 
-        self.authentication_generate_access_token_service = AuthenticationGenerateAccessTokenService()
+        self.authentication_generate_access_token_service = ServiceFactory.get(AuthenticationGenerateAccessTokenService)
 
-        self.account_session_find_long_session_service = AccountSessionFindLongSessionService()
+        self.account_session_find_long_session_service = ServiceFactory.get(AccountSessionFindLongSessionService)
 
-        self.account_session_create_short_session_service = AccountSessionCreateShortSessionService()
+        self.account_session_create_short_session_service = ServiceFactory.get(AccountSessionCreateShortSessionService)
@@ -1,19 +1,46 @@
 from piracyshield_component.log.logger import Logger
 
-from piracyshield_service.task.service import TaskService
+from piracyshield_service.factory import ServiceFactory, import_class
+
+from piracyshield_service.metrics import ServiceMetrics
+
+from piracyshield_service.profiler import StorageProfiler
 
 from abc import ABC, abstractmethod
 
 class BaseService(ABC):
 
-    task_service = None
+    _task_service = None
 
     logger = None
 
     def __init__(self):
         self.logger = Logger('service')
 
-        self.task_service = TaskService()
+    def __init_subclass__(cls, **kwargs):
+        """
+        Instruments the `execute()` of each service.
+        Both layers stay disabled unless `ServiceMetrics.enable()` or `StorageProfiler.enable()` are called.
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        execute = cls.__dict__.get('execute')
+
+        if execute is not None and not getattr(execute, '__instrumented__', False):
+            cls.execute = ServiceMetrics.instrument(StorageProfiler.instrument(execute))
+
+    @property
+    def task_service(self) -> 'TaskService':
+        """
+        Lazily builds the task service, as most of the services never schedule anything.
+        This also keeps rq out of the import of every service.
+        """
+
+        if self._task_service is None:
+            self._task_service = ServiceFactory.get(import_class('piracyshield_service.task.service.TaskService'))
+
+        return self._task_service
 
     @abstractmethod
     def execute(self, *args, **kwargs):
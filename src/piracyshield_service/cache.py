@@ -0,0 +1,112 @@
+from collections import OrderedDict
+
+import threading
+import time
+
+class LocalCache:
+
+    """
+    Thread-safe in-process cache with optional expiration and LRU bound.
+    """
+
+    ttl = None
+
+    max_size = None
+
+    def __init__(self, ttl: float = None, max_size: int = None):
+        """
+        :param ttl: optional seconds before an entry expires.
+        :param max_size: optional maximum number of entries, the least recently used ones are evicted first.
+        """
+
+        self.ttl = ttl
+
+        self.max_size = max_size
+
+        self._entries = OrderedDict()
+
+        self._lock = threading.Lock()
+
+        self.hits = 0
+
+        self.misses = 0
+
+    def get(self, key: any, default: any = None) -> any:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or (self.ttl is not None and entry[1] < time.monotonic()):
+                self.misses += 1
+
+                return default
+
+            self._entries.move_to_end(key)
+
+            self.hits += 1
+
+            return entry[0]
+
+    def set(self, key: any, value: any) -> None:
+        with self._lock:
+            expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+            self._entries[key] = (value, expires_at)
+
+            self._entries.move_to_end(key)
+
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last = False)
+
+    def get_or_set(self, key: any, builder: callable) -> any:
+        """
+        Returns the cached value or builds and stores it.
+
+        :param key: the cache key.
+        :param builder: a function returning the value.
+        :return: the value.
+        """
+
+        missing = object()
+
+        value = self.get(key, missing)
+
+        if value is missing:
+            value = builder()
+
+            self.set(key, value)
+
+        return value
+
+    def invalidate(self, key: any = None) -> None:
+        """
+        Drops a single entry or the whole cache.
+
+        :param key: optional cache key.
+        """
+
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate_matching(self, predicate: callable) -> None:
+        """
+        Drops every entry whose key satisfies the predicate.
+
+        :param predicate: a function receiving the key.
+        """
+
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries)
+            }
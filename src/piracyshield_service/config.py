@@ -0,0 +1,146 @@
+from piracyshield_component.config import Config
+from piracyshield_component.environment import Environment
+
+import copy
+import os
+import threading
+import time
+
+class ConfigSnapshot:
+
+    """
+    Parsed config file, shared by every service of the process.
+    """
+
+    config = None
+
+    mtime = None
+
+    def __init__(self, config: Config, mtime: int = None):
+        self.config = config
+
+        self.mtime = mtime
+
+        self._sections = {}
+
+    def get(self, key: str, default: any = None) -> any:
+        """
+        Returns a copy of a config section, with the same types returned by `Config`.
+        Callers may change it without affecting the shared snapshot.
+
+        :param key: the section name.
+        :param default: value returned when the section is missing.
+        :return: the section value.
+        """
+
+        if key not in self._sections:
+            try:
+                self._sections[key] = self.config.get(key)
+
+            # optional sections
+            except KeyError:
+                self._sections[key] = None
+
+        value = self._sections[key]
+
+        return default if value is None else copy.deepcopy(value)
+
+class ConfigCache:
+
+    """
+    Process-wide cache of the parsed config files.
+
+    Each file is parsed once and read again only when its modification time changes.
+    """
+
+    # seconds between two modification time checks of the same file
+    check_interval = 1.0
+
+    _snapshots = {}
+
+    _last_check = {}
+
+    _hits = 0
+
+    _misses = 0
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, name: str) -> ConfigSnapshot:
+        """
+        Returns the snapshot of a config file.
+
+        :param name: the config name (ie. `security/token`).
+        :return: a read-only config snapshot.
+        """
+
+        now = time.monotonic()
+
+        with cls._lock:
+            snapshot = cls._snapshots.get(name)
+
+            if snapshot is not None:
+                if now - cls._last_check.get(name, 0) < cls.check_interval:
+                    cls._hits += 1
+
+                    return snapshot
+
+                cls._last_check[name] = now
+
+                if cls._get_mtime(name) == snapshot.mtime:
+                    cls._hits += 1
+
+                    return snapshot
+
+            cls._misses += 1
+
+            snapshot = ConfigSnapshot(
+                config = Config(name),
+                mtime = cls._get_mtime(name)
+            )
+
+            cls._snapshots[name] = snapshot
+
+            cls._last_check[name] = now
+
+            return snapshot
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """
+        Returns the cache counters.
+
+        :return: hits, misses and number of cached files.
+        """
+
+        with cls._lock:
+            return {
+                'hits': cls._hits,
+                'misses': cls._misses,
+                'size': len(cls._snapshots)
+            }
+
+    @classmethod
+    def invalidate(cls, name: str = None) -> None:
+        """
+        Drops a single snapshot or the whole cache.
+
+        :param name: optional config name.
+        """
+
+        with cls._lock:
+            if name:
+                cls._snapshots.pop(name, None)
+
+                cls._last_check.pop(name, None)
+
+            else:
+                cls._snapshots = {}
+
+                cls._last_check = {}
+
+    @classmethod
+    def _get_mtime(cls, name: str) -> int:
+        # same location `Config` reads the file from, a missing file must not go unnoticed
+        return os.stat(os.path.join(Environment.CONFIG_PATH, f'{name}.toml')).st_mtime_ns
@@ -0,0 +1,117 @@
+from piracyshield_service.config import ConfigCache
+
+from redis import Redis, ConnectionPool
+
+import threading
+
+class ConnectionRegistry:
+
+    """
+    Process-wide registry of the memory connections.
+
+    Services are built several times per request, so every connection is kept here and shared instead of being opened by each instance.
+    """
+
+    _pools = {}
+
+    _memories = {}
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_redis(cls, host: str, port: int, database: int) -> Redis:
+        """
+        Returns a Redis client backed by the shared pool of the requested database.
+
+        :param host: Redis host.
+        :param port: Redis port.
+        :param database: Redis database number.
+        :return: a Redis client instance.
+        """
+
+        key = (host, port, database)
+
+        with cls._lock:
+            pool = cls._pools.get(key)
+
+            if pool is None:
+                pool = ConnectionPool(
+                    host = host,
+                    port = port,
+                    db = database
+                )
+
+                cls._pools[key] = pool
+
+        return Redis(connection_pool = pool)
+
+    @classmethod
+    def get_task_redis(cls) -> Redis:
+        """
+        Returns a Redis client for the task database, also used for the state shared by the workers.
+
+        :return: a Redis client instance.
+        """
+
+        task_config = ConfigCache.get('application').get('task')
+
+        database_redis_config = ConfigCache.get('database/redis').get('connection')
+
+        return cls.get_redis(
+            host = database_redis_config.get('host'),
+            port = database_redis_config.get('port'),
+            database = task_config.get('database')
+        )
+
+    @classmethod
+    def get_memory(cls, memory_class: type, database: int) -> object:
+        """
+        Returns the shared instance of a memory storage class for the requested database.
+
+        :param memory_class: a memory storage class (ie. `SecurityBlacklistMemory`).
+        :param database: the memory database number.
+        :return: the memory storage instance.
+        """
+
+        key = (memory_class, database)
+
+        with cls._lock:
+            memory = cls._memories.get(key)
+
+            if memory is None:
+                memory = memory_class(
+                    database = database
+                )
+
+                cls._memories[key] = memory
+
+        return memory
+
+    @classmethod
+    def get_open_connections(cls) -> int:
+        """
+        Counts the connections currently opened by the shared pools.
+
+        :return: the number of opened connections.
+        """
+
+        with cls._lock:
+            pools = list(cls._pools.values())
+
+        # NOTE: this relies on the pool internals, but it's only used for diagnostics.
+        return sum(len(pool._available_connections) + len(pool._in_use_connections) for pool in pools)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Disconnects and drops every registered connection.
+        Must be called in a forked process before reusing the registry.
+        """
+
+        with cls._lock:
+            for pool in cls._pools.values():
+                pool.disconnect()
+
+            cls._pools = {}
+
+            cls._memories = {}
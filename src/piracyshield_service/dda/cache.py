@@ -0,0 +1,43 @@
+from piracyshield_service.cache import LocalCache
+
+class DDACache:
+
+    """
+    Assignments of the DDA identifiers to the reporter accounts, shared by the whole process.
+
+    Only the assignments found are kept, so a DDA created by another process is never refused.
+    Invalidated by the DDA creation, removal and status changes, other processes are aligned by the expiration time.
+    """
+
+    cache = LocalCache(ttl = 30, max_size = 10000)
+
+    @classmethod
+    def is_assigned_to_account(cls, dda_id: str, account_id: str, builder: callable) -> bool:
+        """
+        :param dda_id: the DDA identifier.
+        :param account_id: the reporter account identifier.
+        :param builder: a function returning the assignment status.
+        :return: true if assigned.
+        """
+
+        if cls.cache.get((dda_id, account_id)):
+            return True
+
+        is_assigned = builder()
+
+        if is_assigned:
+            cls.cache.set((dda_id, account_id), True)
+
+        return is_assigned
+
+    @classmethod
+    def invalidate(cls, dda_id: str = None) -> None:
+        """
+        :param dda_id: optional DDA identifier, everything is dropped if not specified.
+        """
+
+        if dda_id:
+            cls.cache.invalidate_matching(lambda key: key[0] == dda_id)
+
+        else:
+            cls.cache.invalidate()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.security.identifier import Identifier
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
@@ -25,6 +27,8 @@ from piracyshield_service.account.general.get import GeneralAccountGetService
 
 from piracyshield_service.dda.exists_by_instance import DDAExistsByInstanceService
 
+from piracyshield_service.dda.cache import DDACache
+
 from piracyshield_service.dda.errors import DDAErrorCode, DDAErrorMessage
 
 class DDACreateService(BaseService):
@@ -93,6 +97,8 @@ class DDACreateService(BaseService):
 
         self.logger.info(f'DDA instance `{document.get("instance")}` created by `{document.get("metadata").get("created_by")}`')
 
+        DDACache.invalidate(model.get('dda_id'))
+
         return True
 
     def _generate_dda_id(self) -> str:
@@ -169,6 +175,6 @@ class DDACreateService(BaseService):
 
         self.identifier = Identifier()
 
-        self.dda_exists_by_instance_service = DDAExistsByInstanceService()
+        self.dda_exists_by_instance_service = ServiceFactory.get(DDAExistsByInstanceService)
 
-        self.general_account_get_service = GeneralAccountGetService()
+        self.general_account_get_service = ServiceFactory.get(GeneralAccountGetService)
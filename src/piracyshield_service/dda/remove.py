@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.dda.storage import DDAStorage, DDAStorageRemoveException
 
 from piracyshield_service.ticket.has_dda_id import TicketHasDDAIdService
 
+from piracyshield_service.dda.cache import DDACache
+
 from piracyshield_service.dda.errors import DDAErrorCode, DDAErrorMessage
 
 class DDARemoveService(BaseService):
@@ -44,6 +48,8 @@ class DDARemoveService(BaseService):
             if not affected_rows:
                 raise ApplicationException(DDAErrorCode.CANNOT_REMOVE, DDAErrorMessage.CANNOT_REMOVE)
 
+            DDACache.invalidate(dda_id)
+
         except DDAStorageRemoveException as e:
             self.logger.error(f'Cannot remove DDA `{value}`')
 
@@ -61,4 +67,4 @@ class DDARemoveService(BaseService):
     def _prepare_modules(self):
         self.data_storage = DDAStorage()
 
-        self.ticket_has_dda_id_service = TicketHasDDAIdService()
+        self.ticket_has_dda_id_service = ServiceFactory.get(TicketHasDDAIdService)
@@ -6,6 +6,8 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.dda.storage import DDAStorage, DDAStorageUpdateException
 
+from piracyshield_service.dda.cache import DDACache
+
 from piracyshield_service.dda.errors import DDAErrorCode, DDAErrorMessage
 
 class DDASetStatusService(BaseService):
@@ -42,6 +44,8 @@ class DDASetStatusService(BaseService):
 
             raise ApplicationException(DDAErrorCode.GENERIC, DDAErrorMessage.GENERIC, e)
 
+        DDACache.invalidate(dda_id)
+
         return True
 
     def _schedule_task(self):
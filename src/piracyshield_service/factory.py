@@ -0,0 +1,102 @@
+import importlib
+import threading
+
+class ServiceFactory:
+
+    """
+    Process-wide container of the service instances.
+
+    Services don't keep any per-call state, so each one is built once (with its whole dependency tree)
+    and shared across requests and threads.
+    """
+
+    _instances = {}
+
+    # reentrant as building a service builds its nested services as well
+    _lock = threading.RLock()
+
+    @classmethod
+    def get(cls, service_class: type, *args: any) -> object:
+        """
+        Returns the shared instance of a service, building it on first use.
+
+        :param service_class: the service class.
+        :param *args: arguments to pass to the service class (ie. the data storage class).
+        :return: the service instance.
+        """
+
+        key = (service_class, *args)
+
+        instance = cls._instances.get(key)
+
+        if instance is not None:
+            return instance
+
+        with cls._lock:
+            instance = cls._instances.get(key)
+
+            if instance is None:
+                instance = service_class(*args)
+
+                cls._instances[key] = instance
+
+        return instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Drops every built instance.
+        """
+
+        with cls._lock:
+            cls._instances = {}
+
+class LazyService:
+
+    """
+    Service dependency resolved on first use.
+
+    The module of the service is imported only when the attribute is accessed the first time,
+    then the shared instance is stored on the owner so next accesses don't go through here.
+    """
+
+    path = None
+
+    args = None
+
+    name = None
+
+    def __init__(self, path: str, *args: any):
+        """
+        :param path: dotted path of the service class (ie. `piracyshield_service.ticket.get.TicketGetService`).
+        :param *args: arguments to pass to the service class.
+        """
+
+        self.path = path
+
+        self.args = args
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object, owner: type) -> object:
+        if instance is None:
+            return self
+
+        service = ServiceFactory.get(import_class(self.path), *self.args)
+
+        instance.__dict__[self.name] = service
+
+        return service
+
+def import_class(path: str) -> type:
+    """
+    Imports a class from its dotted path.
+
+    :param path: dotted path of the class.
+    :return: the class.
+    """
+
+    (module_name, class_name) = path.rsplit('.', 1)
+
+    return getattr(importlib.import_module(module_name), class_name)
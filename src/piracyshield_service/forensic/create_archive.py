@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_model.forensic.archive.model import ForensicArchiveModel, ForensicArchiveModelNameException
 
 from piracyshield_data_storage.forensic.storage import ForensicStorage, ForensicStorageCreateException, ForensicStorageGetException, ForensicStorageUpdateException
@@ -14,8 +17,6 @@ from piracyshield_data_storage.cache.storage import CacheStorage
 
 from piracyshield_service.log.ticket.create import LogTicketCreateService
 
-from piracyshield_service.forensic.tasks.analyze_forensic_archive import analyze_forensic_archive_task_caller
-
 from piracyshield_service.forensic.errors import ForensicErrorCode, ForensicErrorMessage
 
 import os
@@ -161,7 +162,7 @@ class ForensicCreateArchiveService(BaseService):
         try:
             # schedule package analysis and upload to storage.
             analysis_task_id = self.task_service.create(
-                task_caller = analyze_forensic_archive_task_caller,
+                task_caller = 'piracyshield_service.forensic.tasks.analyze_forensic_archive.analyze_forensic_archive_task_caller',
                 delay = 1,
                 ticket_id = ticket_id
             )
@@ -198,7 +199,7 @@ class ForensicCreateArchiveService(BaseService):
         Loads the configs.
         """
 
-        self.application_archive_config = Config('application').get('archive')
+        self.application_archive_config = ConfigCache.get('application').get('archive')
 
     def _prepare_modules(self):
         """
@@ -211,4 +212,4 @@ class ForensicCreateArchiveService(BaseService):
 
         self.data_storage_cache = CacheStorage()
 
-        self.log_ticket_create_service = LogTicketCreateService()
+        self.log_ticket_create_service = ServiceFactory.get(LogTicketCreateService)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.security.identifier import Identifier
+from piracyshield_service.identifier import OrderedIdentifier
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
@@ -55,14 +56,7 @@ class ForensicCreateHashService(BaseService):
 
             # we got one, let's update our new entry with those values
             if existent_hash:
-                if 'archive_name' in existent_hash:
-                    document['archive_name'] = existent_hash.get('archive_name')
-
-                if 'status' in existent_hash:
-                    document['status'] = existent_hash.get('status')
-
-                if 'reason' in existent_hash:
-                    document['reason'] = existent_hash.get('reason')
+                self._merge_existent_hash(document, existent_hash)
 
             try:
                 self.data_storage.insert(document)
@@ -76,6 +70,18 @@ class ForensicCreateHashService(BaseService):
 
         return True
 
+    def _merge_existent_hash(self, document: dict, existent_hash: dict) -> dict:
+        if 'archive_name' in existent_hash:
+            document['archive_name'] = existent_hash.get('archive_name')
+
+        if 'status' in existent_hash:
+            document['status'] = existent_hash.get('status')
+
+        if 'reason' in existent_hash:
+            document['reason'] = existent_hash.get('reason')
+
+        return document
+
     def _hash_string_exists(self, hash_string: str) -> bool | Exception:
         try:
             response = self.data_storage.exists_hash_string(
@@ -111,9 +117,9 @@ class ForensicCreateHashService(BaseService):
 
     def _generate_forensic_id(self) -> str:
         """
-        Generates a UUIDv4.
+        Generates a time-ordered UUIDv7.
 
-        :return: a randomly generated 32 characters string.
+        :return: a 32 characters string.
         """
 
         return self.identifier.generate()
@@ -159,4 +165,4 @@ class ForensicCreateHashService(BaseService):
 
         self.data_storage = ForensicStorage()
 
-        self.identifier = Identifier()
+        self.identifier = OrderedIdentifier()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from piracyshield_service.forensic.create_hash import ForensicCreateHashService
+
+from piracyshield_component.utils.time import Time
+from piracyshield_component.exception import ApplicationException
+
+from piracyshield_data_storage.forensic.storage import ForensicStorageCreateException
+
+from piracyshield_service.writer import insert_documents
+
+from piracyshield_service.forensic.errors import ForensicErrorCode, ForensicErrorMessage
+
+class ForensicCreateHashBatchService(ForensicCreateHashService):
+
+    """
+    Stores the evidence's hashes of multiple tickets in a single batch.
+    """
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+    def execute(self, hash_lists: dict, reporter_id: str) -> bool | Exception:
+        """
+        :param hash_lists: a dictionary of ticket identifiers and their hash list.
+        :param reporter_id: the reporter account identifier.
+        :return: true if everything is successful.
+        """
+
+        batch = []
+
+        # the same evidence is often shared by the tickets of a burst, so each hash is searched once
+        existent_hashes = {}
+
+        now = Time.now_iso8601()
+
+        forensic_ids = iter(self.identifier.generate_batch(sum(len(hash_list) for hash_list in hash_lists.values())))
+
+        for ticket_id, hash_list in hash_lists.items():
+            for hash_type, hash_string in hash_list.items():
+                model = self._validate_parameters(
+                    hash_type = hash_type,
+                    hash_string = hash_string
+                )
+
+                document = self._build_document(
+                    model = model,
+                    forensic_id = next(forensic_ids),
+                    ticket_id = ticket_id,
+                    created_by = reporter_id,
+                    now = now
+                )
+
+                if hash_string not in existent_hashes:
+                    existent_hashes[hash_string] = self._hash_string_exists(hash_string)
+
+                if existent_hashes[hash_string]:
+                    self._merge_existent_hash(document, existent_hashes[hash_string])
+
+                batch.append(document)
+
+        if not batch:
+            return True
+
+        try:
+            insert_documents(self.data_storage, batch)
+
+        except ForensicStorageCreateException as e:
+            self.logger.error(f"Could not create the tickets' forensic archive hashes")
+
+            raise ApplicationException(ForensicErrorCode.GENERIC, ForensicErrorMessage.GENERIC, e)
+
+        self.logger.info(f'Created {len(batch)} hashes for {len(hash_lists)} tickets')
+
+        return True
+
+    def validate(self, hash_list: dict) -> bool | Exception:
+        """
+        Validates the hashes of a single ticket, before the batch is stored.
+
+        :param hash_list: a dictionary of hash types and strings.
+        :return: true if correct, exception if not.
+        """
+
+        for hash_type, hash_string in hash_list.items():
+            self._validate_parameters(
+                hash_type = hash_type,
+                hash_string = hash_string
+            )
+
+        return True
@@ -1,5 +1,7 @@
 from piracyshield_service.task.base import BaseTask
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
@@ -123,13 +125,13 @@ class AnalyzeForensicArchiveTask(BaseTask):
 
         self.data_storage = ForensicStorage()
 
-        self.log_ticket_create_service = LogTicketCreateService()
+        self.log_ticket_create_service = ServiceFactory.get(LogTicketCreateService)
 
         self.forensic_analysis = ForensicAnalysis()
 
-        self.get_by_ticket_service = ForensicGetByTicketService()
+        self.get_by_ticket_service = ServiceFactory.get(ForensicGetByTicketService)
 
-        self.update_archive_status_service = ForensicUpdateArchiveStatusService()
+        self.update_archive_status_service = ServiceFactory.get(ForensicUpdateArchiveStatusService)
 
     def after_run(self):
         pass
@@ -3,10 +3,11 @@ from __future__ import annotations
 from piracyshield_service.base import BaseService
 
 from piracyshield_component.environment import Environment
-from piracyshield_component.config import Config
 from piracyshield_component.security.identifier import Identifier
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_storage.cache.storage import CacheStorage
 
 from piracyshield_service.importer.errors import ImporterErrorCode, ImporterErrorMessage
@@ -129,7 +130,7 @@ class ImporterSaveFileService(BaseService):
         Loads the configs.
         """
 
-        self.application_archive_config = Config('application').get('archive')
+        self.application_archive_config = ConfigCache.get('application').get('archive')
 
     def _prepare_modules(self) -> None:
         """
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from piracyshield_service.log.ticket.create import LogTicketCreateService
+
+from piracyshield_component.utils.time import Time
+from piracyshield_component.exception import ApplicationException
+
+from piracyshield_data_storage.log.ticket.storage import LogTicketStorageCreateException
+
+from piracyshield_service.writer import insert_documents
+
+from piracyshield_service.log.ticket.errors import LogTicketErrorCode, LogTicketErrorMessage
+
+class LogTicketCreateBatchService(LogTicketCreateService):
+
+    """
+    Creates multiple ticket log records in a single batch.
+    """
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+    def execute(self, entries: list) -> bool | Exception:
+        """
+        :param entries: a list of dictionaries with the `ticket_id` and `message` keys.
+        :return: true if everything is successful.
+        """
+
+        now = Time.now_iso8601()
+
+        batch = [
+            self._build_document(
+                model = self._validate_parameters(
+                    ticket_id = entry.get('ticket_id'),
+                    message = entry.get('message')
+                ),
+                now = now
+            ) for entry in entries
+        ]
+
+        if not batch:
+            return True
+
+        try:
+            insert_documents(self.data_storage, batch)
+
+            return True
+
+        except LogTicketStorageCreateException as e:
+            self.logger.error(f'Could not create the log entries')
+
+            raise ApplicationException(LogTicketErrorCode.GENERIC, LogTicketErrorMessage.GENERIC, e)
@@ -13,6 +13,8 @@ class LogTicketErrorCode:
 
     CANNOT_REMOVE = '5106'
 
+    NON_VALID_CURSOR = '5107'
+
 class LogTicketErrorMessage:
 
     GENERIC = 'Generic error.'
@@ -26,3 +28,5 @@ class LogTicketErrorMessage:
     NON_VALID_MESSAGE = 'Non valid message.'
 
     CANNOT_REMOVE = 'The items could not be removed. Ensure you have proper permissions to perform this operation.'
+
+    NON_VALID_CURSOR = 'Non valid pagination cursor.'
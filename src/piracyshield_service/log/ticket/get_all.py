@@ -6,6 +6,8 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.log.ticket.storage import LogTicketStorage, LogTicketStorageGetException
 
+from piracyshield_service.pagination import KeysetPaginator, PaginationCursorException, PaginationKeyException
+
 from piracyshield_service.log.ticket.errors import LogTicketErrorCode, LogTicketErrorMessage
 
 class LogTicketGetAllService(BaseService):
@@ -16,6 +18,8 @@ class LogTicketGetAllService(BaseService):
 
     data_storage = None
 
+    paginator = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -43,6 +47,40 @@ class LogTicketGetAllService(BaseService):
 
             raise ApplicationException(LogTicketErrorCode.GENERIC, LogTicketErrorMessage.GENERIC, e)
 
+    def execute_page(self, ticket_id: str, cursor: str = None, limit: int = None, fields: list = None) -> dict | Exception:
+        """
+        Returns a page of logs, to go through them without reading them all.
+
+        :param ticket_id: the ticket identifier.
+        :param cursor: the cursor of the previous page, None for the first page.
+        :param limit: number of logs of the page.
+        :param fields: optional list of fields to return (ie. `message`, `metadata.created_at`).
+        :return: the `items` of the page and the `cursor` of the next page, None if this is the last one.
+        """
+
+        try:
+            return self.paginator.paginate_storage(
+                self.data_storage,
+                'get_all',
+                ticket_id = ticket_id,
+                cursor = cursor,
+                limit = limit,
+                fields = fields
+            )
+
+        except PaginationCursorException:
+            raise ApplicationException(LogTicketErrorCode.NON_VALID_CURSOR, LogTicketErrorMessage.NON_VALID_CURSOR)
+
+        except PaginationKeyException as e:
+            self.logger.error(f'Could not paginate, a document has no `{e}`')
+
+            raise ApplicationException(LogTicketErrorCode.GENERIC, LogTicketErrorMessage.GENERIC, e)
+
+        except LogTicketStorageGetException as e:
+            self.logger.error(f'Could not get all the logs for ticket `{ticket_id}`')
+
+            raise ApplicationException(LogTicketErrorCode.GENERIC, LogTicketErrorMessage.GENERIC, e)
+
     def _schedule_task(self):
         pass
 
@@ -54,3 +92,6 @@ class LogTicketGetAllService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = LogTicketStorage()
+
+        # by time, the document key of the storage breaks the ties as several logs of a ticket can share the time and the message
+        self.paginator = KeysetPaginator(key = ('metadata.created_at', '_key'))
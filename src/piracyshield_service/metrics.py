@@ -0,0 +1,180 @@
+from contextvars import ContextVar
+
+import functools
+import threading
+import time
+
+class ServiceMetrics:
+
+    """
+    Opt-in latency and throughput counters of the services and tasks `execute()` calls.
+
+    Each call is labelled by its class and by the class of the service that called it (if any),
+    so nested calls are attributed to their parent.
+    """
+
+    enabled = False
+
+    # label of the running execute() in the current thread/context
+    _current = ContextVar('piracyshield_service_metrics_current', default = None)
+
+    _stats = {}
+
+    _in_flight = {}
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def enable(cls) -> None:
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        cls.enabled = False
+
+    @classmethod
+    def reset(cls) -> None:
+        # the calls in flight are still running, so they're kept
+        with cls._lock:
+            cls._stats = {}
+
+    @classmethod
+    def instrument(cls, execute: callable) -> callable:
+        """
+        Wraps an `execute()` method.
+
+        :param execute: the unbound method.
+        :return: the wrapped method.
+        """
+
+        @functools.wraps(execute)
+        def wrapper(self, *args, **kwargs):
+            if not cls.enabled:
+                return execute(self, *args, **kwargs)
+
+            name = self.__class__.__name__
+
+            parent = cls._current.get()
+
+            # a subclass calling its parent's execute() is the same call
+            if parent == name:
+                return execute(self, *args, **kwargs)
+
+            token = cls._current.set(name)
+
+            cls._begin(name)
+
+            start = time.perf_counter()
+
+            failed = False
+
+            try:
+                return execute(self, *args, **kwargs)
+
+            except Exception:
+                failed = True
+
+                raise
+
+            finally:
+                cls._end(
+                    name = name,
+                    parent = parent,
+                    elapsed = time.perf_counter() - start,
+                    failed = failed
+                )
+
+                cls._current.reset(token)
+
+        wrapper.__instrumented__ = True
+
+        return wrapper
+
+    @classmethod
+    def get_snapshot(cls) -> list:
+        """
+        Returns the current counters.
+
+        :return: a list of dictionaries, one for each service and parent pair.
+        """
+
+        with cls._lock:
+            snapshot = []
+
+            for (name, parent), stats in cls._stats.items():
+                snapshot.append({
+                    'service': name,
+                    'parent': parent,
+                    'calls': stats.get('calls'),
+                    'errors': stats.get('errors'),
+                    'seconds': stats.get('seconds'),
+                    'max_seconds': stats.get('max_seconds'),
+                    'in_flight': cls._in_flight.get(name, 0)
+                })
+
+            return snapshot
+
+    @classmethod
+    def to_prometheus(cls) -> str:
+        """
+        Renders the counters in the Prometheus text exposition format.
+
+        :return: the text snapshot.
+        """
+
+        snapshot = cls.get_snapshot()
+
+        lines = []
+
+        for metric, field, genre, description in (
+            ('piracyshield_service_execute_calls_total', 'calls', 'counter', 'Number of execute() calls.'),
+            ('piracyshield_service_execute_errors_total', 'errors', 'counter', 'Number of execute() calls raising an exception.'),
+            ('piracyshield_service_execute_seconds_total', 'seconds', 'counter', 'Wall time spent in execute().'),
+            ('piracyshield_service_execute_max_seconds', 'max_seconds', 'gauge', 'Slowest execute() call.')
+        ):
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} {genre}')
+
+            for entry in snapshot:
+                lines.append(f'{metric}{{service="{entry.get("service")}",parent="{entry.get("parent") or ""}"}} {entry.get(field)}')
+
+        lines.append('# HELP piracyshield_service_execute_in_flight Number of execute() calls currently running.')
+        lines.append('# TYPE piracyshield_service_execute_in_flight gauge')
+
+        with cls._lock:
+            for name, value in cls._in_flight.items():
+                lines.append(f'piracyshield_service_execute_in_flight{{service="{name}"}} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def _begin(cls, name: str) -> None:
+        with cls._lock:
+            cls._in_flight[name] = cls._in_flight.get(name, 0) + 1
+
+    @classmethod
+    def _end(cls, name: str, parent: str, elapsed: float, failed: bool) -> None:
+        with cls._lock:
+            cls._in_flight[name] = max(0, cls._in_flight.get(name, 0) - 1)
+
+            stats = cls._stats.get((name, parent))
+
+            if stats is None:
+                stats = {
+                    'calls': 0,
+                    'errors': 0,
+                    'seconds': 0.0,
+                    'max_seconds': 0.0
+                }
+
+                cls._stats[(name, parent)] = stats
+
+            stats['calls'] += 1
+
+            stats['seconds'] += elapsed
+
+            if elapsed > stats['max_seconds']:
+                stats['max_seconds'] = elapsed
+
+            if failed:
+                stats['errors'] += 1
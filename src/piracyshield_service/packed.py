@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import ipaddress
+import socket
+
+try:
+    import numpy
+
+# optional, installed with the `vectorized` extra
+except ImportError:
+    numpy = None
+
+# IPv6 addresses are split in two columns, compared in order by `searchsorted`
+IPV6_DTYPE = [('high', 'u8'), ('low', 'u8')]
+
+# same layout as the network byte order returned by `inet_pton`
+IPV6_PACKED_DTYPE = [('high', '>u8'), ('low', '>u8')]
+
+LOW_MASK = (1 << 64) - 1
+
+FAMILIES = {
+    4: (socket.AF_INET, 4, ipaddress.IPv4Address),
+    6: (socket.AF_INET6, 16, ipaddress.IPv6Address)
+}
+
+# minimum number of values to use the vectorised lookups, below this the trie is faster
+vectorize_threshold = 256
+
+def is_available() -> bool:
+    return numpy is not None
+
+def should_vectorize(values: list) -> bool:
+    return numpy is not None and len(values) >= vectorize_threshold
+
+def parse_addresses(version: int, values: list) -> tuple:
+    """
+    Converts the addresses to an array in a single pass.
+
+    :param version: 4 or 6.
+    :param values: list of addresses.
+    :return: the array and the list of positions holding a valid address.
+    """
+
+    (family, size, address_class) = FAMILIES.get(version)
+
+    empty = bytes(size)
+
+    chunks = []
+
+    positions = []
+
+    for position, value in enumerate(values):
+        try:
+            chunks.append(socket.inet_pton(family, value))
+
+        except (OSError, TypeError, ValueError):
+            # `inet_pton` is stricter than `ipaddress` (ie. IPv6 scope identifiers)
+            try:
+                chunks.append(address_class(value).packed)
+
+            except (ValueError, TypeError):
+                chunks.append(empty)
+
+                continue
+
+        positions.append(position)
+
+    buffer = b''.join(chunks)
+
+    if version == 4:
+        return (numpy.frombuffer(buffer, dtype = '>u4').astype(numpy.uint32), positions)
+
+    return (numpy.frombuffer(buffer, dtype = IPV6_PACKED_DTYPE).astype(IPV6_DTYPE), positions)
+
+def to_array(version: int, packed: list) -> any:
+    """
+    Builds the array of a list of integers.
+
+    :param version: 4 or 6.
+    :param packed: list of integers.
+    :return: a uint32 array for IPv4, a two uint64 columns array for IPv6.
+    """
+
+    if version == 4:
+        return numpy.fromiter(packed, dtype = numpy.uint32, count = len(packed))
+
+    return numpy.array([(value >> 64, value & LOW_MASK) for value in packed], dtype = IPV6_DTYPE)
+
+class PackedNetworkSet:
+
+    """
+    Union of IP networks as sorted disjoint intervals, with vectorised containment lookups.
+    """
+
+    def __init__(self, version: int, networks: any):
+        """
+        :param version: 4 or 6.
+        :param networks: the networks in CIDR notation, host bits are ignored.
+        """
+
+        self.version = version
+
+        intervals = []
+
+        for network in networks:
+            try:
+                network = ipaddress.ip_network(network, strict = False)
+
+            except (ValueError, TypeError):
+                continue
+
+            if network.version != version:
+                continue
+
+            intervals.append((int(network.network_address), int(network.broadcast_address)))
+
+        intervals.sort()
+
+        merged = []
+
+        for start, end in intervals:
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+
+            else:
+                merged.append([start, end])
+
+        self.starts = to_array(version, [start for start, _ in merged])
+
+        self.ends = to_array(version, [end for _, end in merged])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def contains_many(self, values: list) -> list:
+        """
+        :param values: list of addresses, invalid ones are never contained.
+        :return: list of booleans, in the same order.
+        """
+
+        found = [False] * len(values)
+
+        if not values or not len(self.starts):
+            return found
+
+        (needles, positions) = parse_addresses(self.version, values)
+
+        # last interval starting before or at the address
+        indexes = numpy.searchsorted(self.starts, needles, side = 'right') - 1
+
+        ends = self.ends[numpy.maximum(indexes, 0)]
+
+        if self.version == 4:
+            contained = needles <= ends
+
+        else:
+            contained = (needles['high'] < ends['high']) | ((needles['high'] == ends['high']) & (needles['low'] <= ends['low']))
+
+        contained &= indexes >= 0
+
+        contained = contained.tolist()
+
+        for position in positions:
+            found[position] = contained[position]
+
+        return found
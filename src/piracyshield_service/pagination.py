@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import base64
+import heapq
+import json
+
+class PaginationCursorException(Exception):
+
+    """
+    The cursor is not a valid key.
+    """
+
+    pass
+
+class PaginationKeyException(Exception):
+
+    """
+    A document has no valid key to be paginated by.
+    """
+
+    pass
+
+class KeysetPaginator:
+
+    """
+    Pages through documents in the order of their unique key, resuming after the key of the last document of the previous page.
+
+    The key is made of one or more fields (ie. the creation time and the identifier, so pages follow the time
+    and the identifier breaks the ties), and the cursor is the encoded key of the last document of a page.
+    Pages are selected by comparing the keys (`key > cursor`), so a page never depends on the position of the
+    previous one: documents removed in the meantime (even the one of the cursor) or added before it don't shift
+    the following pages.
+
+    When the storage has a seek query for a method (the method name followed by `_page`), the predicate, the order
+    and the limit are pushed to it and a page costs as much as its documents; otherwise the whole storage cursor is
+    read and only the `limit` smallest keys after the cursor are kept.
+    Only the documents of the page are reduced to the requested fields.
+    """
+
+    key = None
+
+    default_limit = 50
+
+    max_limit = 1000
+
+    def __init__(self, key: tuple, default_limit: int = 50, max_limit: int = 1000):
+        """
+        :param key: the fields of the unique key of a document, nested fields separated by a dot (ie. `metadata.created_at`).
+        :param default_limit: documents of a page when not specified.
+        :param max_limit: maximum documents of a page.
+        """
+
+        self.key = tuple(key)
+
+        self.default_limit = default_limit
+
+        self.max_limit = max_limit
+
+    def paginate_storage(self, storage: object, method: str, *args, cursor: str = None, limit: int = None, fields: list = None, **kwargs) -> dict:
+        """
+        Reads a page from a storage query, seeking to the cursor when the storage supports it.
+
+        :param storage: the storage instance.
+        :param method: name of the storage query, its seek query is `{method}_page`.
+        :param args: arguments of the query.
+        :param cursor: the cursor of the previous page, None for the first page.
+        :param limit: documents of the page.
+        :param fields: optional list of fields to return.
+        :param kwargs: keyword arguments of the query.
+        :return: the `items` of the page and the `cursor` of the next page, None if this is the last one.
+        """
+
+        after = self._decode_cursor(cursor)
+
+        seek = getattr(storage, f'{method}_page', None)
+
+        if seek is not None:
+            # documents sorted by the key fields, after the cursor, one more than the page to know if there's a next one
+            documents = seek(
+                *args,
+                sort = list(self.key),
+                after = list(after) if after is not None else None,
+                limit = self._get_limit(limit) + 1,
+                **kwargs
+            )
+
+        else:
+            documents = getattr(storage, method)(*args, **kwargs)
+
+        return self._paginate(documents, after, limit, fields)
+
+    def paginate(self, documents: Iterable, cursor: str = None, limit: int = None, fields: list = None) -> dict:
+        """
+        :param documents: the documents, in any order.
+        :param cursor: the cursor of the previous page, None for the first page.
+        :param limit: documents of the page.
+        :param fields: optional list of fields to return, nested fields separated by a dot (ie. `metadata.created_at`).
+        :return: the `items` of the page and the `cursor` of the next page, None if this is the last one.
+        """
+
+        return self._paginate(documents, self._decode_cursor(cursor), limit, fields)
+
+    def _paginate(self, documents: Iterable, after: tuple, limit: int, fields: list) -> dict:
+        limit = self._get_limit(limit)
+
+        keyed = ((self._get_key(document), document) for document in documents)
+
+        if after is not None:
+            keyed = ((key, document) for key, document in keyed if key > after)
+
+        # bounded heap, the documents out of the page are never kept (a seek query returns the page only anyway)
+        page = heapq.nsmallest(limit + 1, keyed, key = lambda entry: entry[0])
+
+        next_cursor = self._encode_cursor(page[limit - 1][0]) if len(page) > limit else None
+
+        return {
+            'items': [self._project(document, fields) for (_, document) in page[:limit]],
+            'cursor': next_cursor
+        }
+
+    def _get_limit(self, limit: int = None) -> int:
+        return min(max(1, limit or self.default_limit), self.max_limit)
+
+    def _get_key(self, document: dict) -> tuple:
+        key = []
+
+        for field in self.key:
+            value = document
+
+            for name in field.split('.'):
+                value = value.get(name) if isinstance(value, dict) else None
+
+            # a document without its key would silently fall out of every page
+            if not isinstance(value, str):
+                raise PaginationKeyException(field)
+
+            key.append(value)
+
+        return tuple(key)
+
+    def _encode_cursor(self, key: tuple) -> str:
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+    def _decode_cursor(self, cursor: str = None) -> tuple | None:
+        if cursor is None:
+            return None
+
+        if not isinstance(cursor, str):
+            raise PaginationCursorException(cursor)
+
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+        except (ValueError, UnicodeError):
+            raise PaginationCursorException(cursor)
+
+        if not isinstance(key, list) or len(key) != len(self.key) or not all(isinstance(value, str) for value in key):
+            raise PaginationCursorException(cursor)
+
+        return tuple(key)
+
+    def _project(self, document: dict, fields: list = None) -> dict:
+        if not fields:
+            return document
+
+        projection = {}
+
+        for field in fields:
+            (*parents, name) = field.split('.')
+
+            source = document
+
+            for parent in parents:
+                source = source.get(parent) if isinstance(source, dict) else None
+
+            # missing fields are left out
+            if not isinstance(source, dict) or name not in source:
+                continue
+
+            target = projection
+
+            for parent in parents:
+                target = target.setdefault(parent, {})
+
+            target[name] = source.get(name)
+
+        return projection
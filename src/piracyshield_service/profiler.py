@@ -0,0 +1,401 @@
+from contextvars import ContextVar
+
+import functools
+import itertools
+import threading
+
+class StorageProfiler:
+
+    """
+    Opt-in counter of the storage round trips issued by each top-level `execute()`.
+
+    Each top-level call records its input size (the total length of the list and dict arguments) and the
+    storage calls it issued, directly or through nested services. Services whose number of calls grows
+    with the input size are flagged as N+1 offenders.
+
+    The storages of a service are wrapped by its first `execute()` with the profiler enabled, so the instances
+    already cached by `ServiceFactory` are profiled as well. The rows of a lazy cursor are counted while they're read.
+    """
+
+    enabled = False
+
+    # minimum growth of storage calls per input item to flag a service
+    slope_threshold = 0.5
+
+    # samples kept for each service
+    max_samples = 100
+
+    # elements of a container measured to estimate the size of the rest
+    sample_size = 20
+
+    _current = ContextVar('piracyshield_service_profiler_current', default = None)
+
+    _samples = {}
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def enable(cls) -> None:
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        cls.enabled = False
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._samples = {}
+
+    @classmethod
+    def wrap(cls, storage: object) -> object:
+        """
+        Wraps a storage or memory instance when the profiler is enabled.
+
+        :param storage: the storage instance.
+        :return: the wrapped instance or the storage itself.
+        """
+
+        if not cls.enabled or storage is None or isinstance(storage, StorageProxy):
+            return storage
+
+        return StorageProxy(storage)
+
+    @classmethod
+    def is_storage(cls, name: str) -> bool:
+        """
+        Tells if an attribute name holds a storage (ie. `data_storage`, `data_memory`, `ticket_storage`).
+        """
+
+        return name.startswith('data_storage') or name == 'data_memory' or name.endswith('_storage')
+
+    @classmethod
+    def attach(cls, instance: object) -> None:
+        """
+        Wraps the storages of a service or task instance, once.
+
+        :param instance: the service or task instance.
+        """
+
+        attributes = getattr(instance, '__dict__', None)
+
+        if attributes is None or attributes.get('_profiler_attached'):
+            return
+
+        for name, value in list(attributes.items()):
+            if cls.is_storage(name):
+                attributes[name] = cls.wrap(value)
+
+        attributes['_profiler_attached'] = True
+
+    @classmethod
+    def instrument(cls, execute: callable) -> callable:
+        """
+        Wraps an `execute()` method to open a trace on top-level calls.
+
+        :param execute: the unbound method.
+        :return: the wrapped method.
+        """
+
+        @functools.wraps(execute)
+        def wrapper(self, *args, **kwargs):
+            if not cls.enabled:
+                return execute(self, *args, **kwargs)
+
+            cls.attach(self)
+
+            # nested calls are accounted to the running trace
+            if cls._current.get() is not None:
+                return execute(self, *args, **kwargs)
+
+            trace = {
+                'calls': 0,
+                'rows': 0,
+                'bytes': 0,
+                'methods': {}
+            }
+
+            token = cls._current.set(trace)
+
+            try:
+                return execute(self, *args, **kwargs)
+
+            finally:
+                cls._current.reset(token)
+
+                cls._record(
+                    name = self.__class__.__name__,
+                    input_size = _get_input_size(args, kwargs),
+                    trace = trace
+                )
+
+        return wrapper
+
+    @classmethod
+    def track(cls, method: str, args: tuple, kwargs: dict, response: any) -> any:
+        """
+        Accounts a storage call to the running trace.
+
+        :return: the response, wrapped when it's a lazy cursor so its rows are counted while they're read.
+        """
+
+        trace = cls._current.get()
+
+        if trace is None:
+            return response
+
+        trace['calls'] += 1
+
+        trace['bytes'] += _get_size(args) + _get_size(kwargs)
+
+        trace['methods'][method] = trace['methods'].get(method, 0) + 1
+
+        if response is None or isinstance(response, _MEASURABLE):
+            trace['bytes'] += _get_size(response)
+
+            return response
+
+        if hasattr(response, '__iter__'):
+            return CursorProxy(response, trace)
+
+        return response
+
+    @classmethod
+    def track_rows(cls, trace: dict, rows: list) -> None:
+        """
+        Accounts the rows read from a cursor to the trace of the call that returned it.
+        """
+
+        trace['rows'] += len(rows)
+
+        trace['bytes'] += _get_size(rows)
+
+    @classmethod
+    def get_report(cls, limit: int = 10) -> list:
+        """
+        Returns the worst offenders, sorted by growth of storage calls per input item.
+
+        :param limit: maximum number of services to return.
+        :return: a list of dictionaries.
+        """
+
+        with cls._lock:
+            samples = {name: list(entries) for name, entries in cls._samples.items()}
+
+        report = []
+
+        for name, entries in samples.items():
+            slope = _get_slope([(entry.get('input_size'), entry.get('calls')) for entry in entries])
+
+            methods = {}
+
+            for entry in entries:
+                for method, count in entry.get('methods').items():
+                    methods[method] = methods.get(method, 0) + count
+
+            report.append({
+                'service': name,
+                'executions': len(entries),
+                'average_calls': sum(entry.get('calls') for entry in entries) / len(entries),
+                'max_calls': max(entry.get('calls') for entry in entries),
+                'average_rows': sum(entry.get('rows') for entry in entries) / len(entries),
+                'average_bytes': sum(entry.get('bytes') for entry in entries) / len(entries),
+                'calls_per_item': slope,
+                'is_n_plus_one': slope >= cls.slope_threshold,
+                'methods': dict(sorted(methods.items(), key = lambda item: item[1], reverse = True))
+            })
+
+        report.sort(key = lambda entry: (entry.get('calls_per_item'), entry.get('max_calls')), reverse = True)
+
+        return report[:limit]
+
+    @classmethod
+    def format_report(cls, limit: int = 10) -> str:
+        """
+        Renders the report as text, for debugging purposes.
+
+        :param limit: maximum number of services to show.
+        :return: the report.
+        """
+
+        lines = []
+
+        for entry in cls.get_report(limit):
+            lines.append('{}{}: {:.2f} calls/item, avg {:.1f} calls ({} max), avg {:.0f} rows, avg {:.0f} bytes over {} executions'.format(
+                '[N+1] ' if entry.get('is_n_plus_one') else '',
+                entry.get('service'),
+                entry.get('calls_per_item'),
+                entry.get('average_calls'),
+                entry.get('max_calls'),
+                entry.get('average_rows'),
+                entry.get('average_bytes'),
+                entry.get('executions')
+            ))
+
+            for method, count in entry.get('methods').items():
+                lines.append(f'    {method}: {count}')
+
+        return '\n'.join(lines)
+
+    @classmethod
+    def _record(cls, name: str, input_size: int, trace: dict) -> None:
+        with cls._lock:
+            entries = cls._samples.setdefault(name, [])
+
+            entries.append({
+                'input_size': input_size,
+                'calls': trace.get('calls'),
+                'rows': trace.get('rows'),
+                'bytes': trace.get('bytes'),
+                'methods': trace.get('methods')
+            })
+
+            if len(entries) > cls.max_samples:
+                del entries[0]
+
+class StorageProxy:
+
+    """
+    Forwards every call to the wrapped storage, accounting it to the running trace.
+    """
+
+    def __init__(self, storage: object):
+        object.__setattr__(self, '_storage', storage)
+
+    def __getattr__(self, name: str) -> any:
+        attribute = getattr(self._storage, name)
+
+        if not callable(attribute) or name.startswith('_'):
+            return attribute
+
+        label = f'{self._storage.__class__.__name__}.{name}'
+
+        @functools.wraps(attribute)
+        def call(*args, **kwargs):
+            try:
+                response = attribute(*args, **kwargs)
+
+            # failed calls are round trips as well
+            except Exception:
+                StorageProfiler.track(label, args, kwargs, None)
+
+                raise
+
+            return StorageProfiler.track(label, args, kwargs, response)
+
+        return call
+
+    def __setattr__(self, name: str, value: any) -> None:
+        setattr(self._storage, name, value)
+
+class CursorProxy:
+
+    """
+    Forwards a lazy cursor, accounting the rows read through iteration, `next()` or `batch()`.
+    """
+
+    def __init__(self, cursor: object, trace: dict):
+        object.__setattr__(self, '_cursor', cursor)
+
+        object.__setattr__(self, '_trace', trace)
+
+        object.__setattr__(self, '_iterator', None)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> any:
+        if self._iterator is None:
+            object.__setattr__(self, '_iterator', iter(self._cursor))
+
+        document = next(self._iterator)
+
+        StorageProfiler.track_rows(self._trace, [document])
+
+        return document
+
+    def __len__(self) -> int:
+        return len(self._cursor)
+
+    def __bool__(self) -> bool:
+        return bool(self._cursor)
+
+    def __getattr__(self, name: str) -> any:
+        attribute = getattr(self._cursor, name)
+
+        if name not in ('batch', 'next'):
+            return attribute
+
+        @functools.wraps(attribute)
+        def call(*args, **kwargs):
+            response = attribute(*args, **kwargs)
+
+            if name == 'batch':
+                StorageProfiler.track_rows(self._trace, response)
+
+            elif response is not None:
+                StorageProfiler.track_rows(self._trace, [response])
+
+            return response
+
+        return call
+
+    def __setattr__(self, name: str, value: any) -> None:
+        setattr(self._cursor, name, value)
+
+_MEASURABLE = (str, bytes, list, tuple, set, dict, int, float, bool)
+
+def _get_input_size(args: tuple, kwargs: dict) -> int:
+    size = 0
+
+    for value in list(args) + list(kwargs.values()):
+        if isinstance(value, (list, tuple, set, dict)):
+            size += len(value)
+
+    return size
+
+def _get_size(value: any, depth: int = 4) -> int:
+    """
+    Rough size of a value, measuring only a sample of the elements of large containers instead of serializing it.
+    """
+
+    if value is None:
+        return 0
+
+    if isinstance(value, (str, bytes)):
+        return len(value)
+
+    if isinstance(value, (bool, int, float)):
+        return 8
+
+    if not isinstance(value, (list, tuple, set, dict)) or not value:
+        return 0
+
+    if depth == 0:
+        return len(value) * 8
+
+    elements = value.items() if isinstance(value, dict) else value
+
+    sample = list(itertools.islice(elements, StorageProfiler.sample_size))
+
+    sample_size = sum(_get_size(element, depth - 1) for element in sample)
+
+    return sample_size * len(value) // len(sample)
+
+def _get_slope(points: list) -> float:
+    """
+    Least squares slope of the storage calls over the input size.
+    """
+
+    if len({x for x, _ in points}) < 2:
+        return 0.0
+
+    n = len(points)
+
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+
+    return numerator / denominator
@@ -0,0 +1,115 @@
+from piracyshield_component.log.logger import Logger
+
+from piracyshield_service.cache import LocalCache
+
+from piracyshield_service.connection import ConnectionRegistry
+
+from redis.exceptions import RedisError
+
+class ProviderCache:
+
+    """
+    Identifiers of the provider accounts, shared by the whole process.
+
+    Only the providers found are kept by `exists()`, so a provider created by another process is never refused.
+    Invalidated by the provider creation, removal and status changes (activation and deactivation), which also bump
+    a generation shared in Redis: every process drops its own copy on the next lookup once the generation changed.
+    The expiration time only covers the generation not being readable.
+    """
+
+    cache = LocalCache(ttl = 30)
+
+    generation_key = 'provider_cache:generation'
+
+    # the generation the cached entries belong to
+    generation = None
+
+    logger = None
+
+    @classmethod
+    def get_identifiers(cls, builder: callable) -> tuple:
+        """
+        :param builder: a function returning the list of provider identifiers.
+        :return: the provider identifiers.
+        """
+
+        cls._align()
+
+        return cls.cache.get_or_set('identifiers', lambda: tuple(builder()))
+
+    @classmethod
+    def exists(cls, provider_id: str, builder: callable) -> bool:
+        """
+        :param provider_id: the provider identifier.
+        :param builder: a function returning true if the provider exists.
+        :return: true if the provider exists.
+        """
+
+        cls._align()
+
+        if cls.cache.get(('exists', provider_id)):
+            return True
+
+        exists = builder()
+
+        if exists:
+            cls.cache.set(('exists', provider_id), True)
+
+        return exists
+
+    @classmethod
+    def get_missing(cls, provider_ids: list, builder: callable) -> list:
+        """
+        Same as `exists()` for multiple providers, the ones not already known are looked up at once.
+
+        :param provider_ids: list of provider identifiers.
+        :param builder: a function receiving the list of identifiers to look up and returning the ones not found.
+        :return: the identifiers of the providers not found.
+        """
+
+        cls._align()
+
+        unknown = [provider_id for provider_id in provider_ids if not cls.cache.get(('exists', provider_id))]
+
+        if not unknown:
+            return []
+
+        missing = builder(unknown)
+
+        for provider_id in set(unknown).difference(missing):
+            cls.cache.set(('exists', provider_id), True)
+
+        return missing
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls.cache.invalidate()
+
+        try:
+            ConnectionRegistry.get_task_redis().incr(cls.generation_key)
+
+        except RedisError as e:
+            cls._get_logger().error(f'Could not bump the providers generation: {e}')
+
+    @classmethod
+    def _align(cls) -> None:
+        try:
+            generation = ConnectionRegistry.get_task_redis().get(cls.generation_key)
+
+        # kept until it expires
+        except RedisError as e:
+            cls._get_logger().error(f'Could not read the providers generation: {e}')
+
+            return
+
+        if generation != cls.generation:
+            cls.cache.invalidate()
+
+            cls.generation = generation
+
+    @classmethod
+    def _get_logger(cls) -> Logger:
+        if cls.logger is None:
+            cls.logger = Logger('service')
+
+        return cls.logger
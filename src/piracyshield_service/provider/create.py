@@ -6,6 +6,8 @@ from piracyshield_data_model.provider.model import ProviderModel
 
 from piracyshield_data_storage.provider.storage import ProviderStorage
 
+from piracyshield_service.provider.cache import ProviderCache
+
 class ProviderCreateService(AccountCreateService):
 
     """
@@ -30,4 +32,8 @@ class ProviderCreateService(AccountCreateService):
         :return account id of the created account.
         """
 
-        return super().execute(name, email, password, confirm_password, flags, created_by)
+        account_id = super().execute(name, email, password, confirm_password, flags, created_by)
+
+        ProviderCache.invalidate()
+
+        return account_id
@@ -4,6 +4,8 @@ from piracyshield_service.account.remove import AccountRemoveService
 
 from piracyshield_data_storage.provider.storage import ProviderStorage
 
+from piracyshield_service.provider.cache import ProviderCache
+
 class ProviderRemoveService(AccountRemoveService):
 
     """
@@ -16,3 +18,15 @@ class ProviderRemoveService(AccountRemoveService):
         """
 
         super().__init__(ProviderStorage)
+
+    def execute(self, account_id: str) -> bool | Exception:
+        """
+        :param account_id: the provider account identifier.
+        :return: true if removed.
+        """
+
+        response = super().execute(account_id)
+
+        ProviderCache.invalidate()
+
+        return response
@@ -4,6 +4,8 @@ from piracyshield_service.account.set_status import AccountSetStatusService
 
 from piracyshield_data_storage.provider.storage import ProviderStorage
 
+from piracyshield_service.provider.cache import ProviderCache
+
 class ProviderSetStatusService(AccountSetStatusService):
 
     """
@@ -16,3 +18,16 @@ class ProviderSetStatusService(AccountSetStatusService):
         """
 
         super().__init__(ProviderStorage)
+
+    def execute(self, account_id: str, value: bool) -> bool | Exception:
+        """
+        :param account_id: the provider account identifier.
+        :param value: true/false status.
+        :return: true if updated.
+        """
+
+        response = super().execute(account_id, value)
+
+        ProviderCache.invalidate()
+
+        return response
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_storage.security.anti_brute_force.memory import SecurityAntiBruteForceMemory, SecurityAntiBruteForceMemorySetException, SecurityAntiBruteForceMemoryGetException
 
+from piracyshield_service.connection import ConnectionRegistry
+
 from piracyshield_service.security.blacklist.add_ip_address import SecurityBlacklistAddIPAddressService
 
 from piracyshield_service.security.errors import SecurityErrorCode, SecurityErrorMessage
@@ -80,15 +85,16 @@ class SecurityAntiBruteForceService(BaseService):
         Loads the configs.
         """
 
-        self.anti_brute_force_config = Config('security/anti_brute_force')
+        self.anti_brute_force_config = ConfigCache.get('security/anti_brute_force')
 
     def _prepare_modules(self) -> None:
         """
         Initialize and set the instances.
         """
 
-        self.data_memory = SecurityAntiBruteForceMemory(
+        self.data_memory = ConnectionRegistry.get_memory(
+            memory_class = SecurityAntiBruteForceMemory,
             database = self.anti_brute_force_config.get('database').get('memory_database')
         )
 
-        self.security_blacklist_add_ip_address_service = SecurityBlacklistAddIPAddressService()
+        self.security_blacklist_add_ip_address_service = ServiceFactory.get(SecurityBlacklistAddIPAddressService)
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.config import Config
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_data_storage.security.blacklist.memory import SecurityBlacklistMemory, SecurityBlacklistMemorySetException, SecurityBlacklistMemoryGetException
 
+from piracyshield_service.connection import ConnectionRegistry
+
 from piracyshield_service.security.errors import SecurityErrorCode, SecurityErrorMessage
 
 class SecurityBlacklistAddRefreshTokenService(BaseService):
@@ -54,13 +57,14 @@ class SecurityBlacklistAddRefreshTokenService(BaseService):
         Loads the configs.
         """
 
-        self.blacklist_config = Config('security/blacklist')
+        self.blacklist_config = ConfigCache.get('security/blacklist')
 
     def _prepare_modules(self) -> None:
         """
         Initialize and set the instances.
         """
 
-        self.data_memory = SecurityBlacklistMemory(
+        self.data_memory = ConnectionRegistry.get_memory(
+            memory_class = SecurityBlacklistMemory,
             database = self.blacklist_config.get('database').get('memory_database')
         )
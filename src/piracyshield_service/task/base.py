@@ -1,6 +1,10 @@
 from piracyshield_component.log.logger import Logger
 from piracyshield_component.utils.time import Time
 
+from piracyshield_service.metrics import ServiceMetrics
+
+from piracyshield_service.profiler import StorageProfiler
+
 from abc import ABC, abstractmethod
 from rq import get_current_job
 
@@ -31,6 +35,8 @@ class BaseTask(ABC):
     def on_failure(self, *args, **kwargs):
         pass
 
+    @ServiceMetrics.instrument
+    @StorageProfiler.instrument
     def execute(self, *args, **kwargs):
         try:
             self.before_run(*args, **kwargs)
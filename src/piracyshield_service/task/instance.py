@@ -1,6 +1,7 @@
-from piracyshield_component.config import Config
+from piracyshield_service.config import ConfigCache
+
+from piracyshield_service.connection import ConnectionRegistry
 
-from redis import Redis
 from rq import Queue
 
 class TaskInstanceService:
@@ -22,10 +23,11 @@ class TaskInstanceService:
         self._prepare_connections()
 
     def _prepare_connections(self) -> None:
-        self.redis_connection = Redis(
+        # shared across every task instance of the process
+        self.redis_connection = ConnectionRegistry.get_redis(
             host = self.database_redis_config.get('host'),
             port = self.database_redis_config.get('port'),
-            db = self.task_config.get('database')
+            database = self.task_config.get('database')
         )
 
         self.queue = Queue(
@@ -34,6 +36,6 @@ class TaskInstanceService:
         )
 
     def _prepare_configs(self) -> None:
-        self.task_config = Config('application').get('task')
+        self.task_config = ConfigCache.get('application').get('task')
 
-        self.database_redis_config = Config('database/redis').get('connection')
+        self.database_redis_config = ConfigCache.get('database/redis').get('connection')
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from piracyshield_component.log.logger import Logger
 
 from piracyshield_service.task.instance import TaskInstanceService
@@ -19,12 +21,13 @@ class TaskService(TaskInstanceService):
 
         self.logger = Logger('service')
 
-    def create(self, task_caller: callable, delay: int = 0, *args: list, **kwargs: dict) -> str:
+    def create(self, task_caller: callable | str, delay: int = 0, *args: list, **kwargs: dict) -> str:
         """
         Creates a task.
         Expects a caller function that calls a BaseTask extended class.
+        The dotted path of the function can be passed instead, so the task module is imported by the worker only.
 
-        :param task_caller: a function that calls the main task class.
+        :param task_caller: a function that calls the main task class, or its dotted path.
         :param delay: seconds of delay before the task is executed.
         :param *args: arguments to pass to the task class.
         :param **kwargs: keyword arguments to pass to the task class.
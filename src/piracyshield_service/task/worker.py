@@ -1,9 +1,67 @@
+from piracyshield_component.log.logger import Logger
+
+from piracyshield_service.factory import ServiceFactory, import_class
+
 from piracyshield_service.task.instance import TaskInstanceService
 
 from rq import Worker
 
 import threading
 
+class CacheWarmingWorker(Worker):
+
+    """
+    Worker refreshing the process caches before forking the work-horse of each job.
+
+    Every job runs in a work-horse forked from this process, which exits when the job is done, so the caches
+    filled by a job are lost with it. The active ticket items and whitelist items (`ActiveItemCache`) are kept
+    up to date here instead, replaying the latest deltas, and each work-horse inherits them already compiled.
+
+    The process pools started by a job (`RelationFlagPool`) live as long as the job and are shut down by the
+    work-horse before it exits.
+    """
+
+    logger = None
+
+    def execute_job(self, job, queue):
+        self.warm_caches()
+
+        return super().execute_job(job, queue)
+
+    def perform_job(self, job, queue):
+        # runs in the work-horse, which leaves with `os._exit` right after
+        try:
+            return super().perform_job(job, queue)
+
+        finally:
+            self.stop_pools()
+
+    def warm_caches(self) -> None:
+        try:
+            service_class = import_class('piracyshield_service.ticket.relation.establish.TicketRelationEstablishService')
+
+            service_class().prepare_caches()
+
+        # the work-horse loads them on its own then
+        except Exception as e:
+            self._get_logger().error(f'Could not warm the caches of the worker: {e}')
+
+        # the services (and their storage connections) are built again by each work-horse, only the caches are inherited
+        ServiceFactory.reset()
+
+    def stop_pools(self) -> None:
+        try:
+            import_class('piracyshield_service.ticket.relation.parallel.RelationFlagPool').shutdown()
+
+        except Exception as e:
+            self._get_logger().error(f'Could not stop the process pools of the job: {e}')
+
+    def _get_logger(self) -> Logger:
+        if self.logger is None:
+            self.logger = Logger('tasks')
+
+        return self.logger
+
 class TaskWorkerService(TaskInstanceService):
 
     """
@@ -28,7 +86,7 @@ class TaskWorkerService(TaskInstanceService):
         worker_thread.join()
 
     def _prepare_modules(self) -> None:
-        self.worker = Worker(
+        self.worker = CacheWarmingWorker(
             [self.queue],
             connection = self.redis_connection
         )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from piracyshield_service.connection import ConnectionRegistry
+
+import json
+
+class TicketChunkStore:
+
+    """
+    Holds the item chunks of a ticket until the creation task has processed them.
+
+    Chunks are kept in the task memory, so the job payload only carries the ticket identifier and the number of chunks.
+    """
+
+    key_prefix = 'ticket_chunks'
+
+    # seconds before the chunks of an abandoned ingestion are discarded
+    expiration = 86400
+
+    redis_connection = None
+
+    def __init__(self):
+        self._prepare_connections()
+
+    def append(self, ticket_id: str, chunk: dict) -> int:
+        """
+        Appends a chunk to the ticket.
+
+        :param ticket_id: the ticket identifier.
+        :param chunk: a dictionary with the `fqdn`, `ipv4` and `ipv6` lists.
+        :return: the index of the chunk.
+        """
+
+        key = self._get_key(ticket_id)
+
+        pipeline = self.redis_connection.pipeline()
+
+        pipeline.rpush(key, json.dumps(chunk))
+
+        pipeline.expire(key, self.expiration)
+
+        (length, _) = pipeline.execute()
+
+        return length - 1
+
+    def get(self, ticket_id: str, index: int) -> dict | None:
+        """
+        Returns a single chunk of the ticket.
+
+        :param ticket_id: the ticket identifier.
+        :param index: the chunk index.
+        :return: the chunk or None if not found.
+        """
+
+        chunk = self.redis_connection.lindex(self._get_key(ticket_id), index)
+
+        if chunk is None:
+            return None
+
+        return json.loads(chunk)
+
+    def count(self, ticket_id: str) -> int:
+        return self.redis_connection.llen(self._get_key(ticket_id))
+
+    def remove(self, ticket_id: str) -> None:
+        self.redis_connection.delete(self._get_key(ticket_id))
+
+    def _get_key(self, ticket_id: str) -> str:
+        return f'{self.key_prefix}:{ticket_id}'
+
+    def _prepare_connections(self) -> None:
+        self.redis_connection = ConnectionRegistry.get_task_redis()
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory, LazyService
+
+from piracyshield_service.identifier import OrderedIdentifier
+
 from piracyshield_component.utils.time import Time
-from piracyshield_component.security.identifier import Identifier
 from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_model.ticket.model import (
@@ -22,34 +25,15 @@ from piracyshield_data_model.ticket.model import (
     TicketModelAssignedToNonValidException
 )
 
-from piracyshield_data_model.ticket.item.model import (
-    TicketItemModel,
-    TicketItemModelTicketIdentifierNonValidException,
-    TicketItemModelTicketItemIdentifierNonValidException,
-    TicketItemModelGenreNonValidException,
-    TicketItemModelFQDNMissingException,
-    TicketItemModelFQDNNonValidException,
-    TicketItemModelIPv4MissingException,
-    TicketItemModelIPv4NonValidException,
-    TicketItemModelIPv6MissingException,
-    TicketItemModelIPv6NonValidException,
-    TicketItemModelProviderIdentifierMissingException,
-    TicketItemModelProviderIdentifierNonValidException
-)
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
 
 from piracyshield_data_storage.ticket.storage import TicketStorage, TicketStorageCreateException
 
-from piracyshield_service.provider.get_active import ProviderGetActiveService
-from piracyshield_service.provider.exists_by_identifier import ProviderExistsByIdentifierService
-
-from piracyshield_service.ticket.tasks.ticket_create import ticket_create_task_caller
-
-from piracyshield_service.log.ticket.create import LogTicketCreateService
+from piracyshield_service.ticket.item.validate_batch import TicketItemValidateBatchService
 
-from piracyshield_service.forensic.create_hash import ForensicCreateHashService
-from piracyshield_service.forensic.remove_by_ticket import ForensicRemoveByTicketService
+from piracyshield_service.ticket.chunk_store import TicketChunkStore
 
-from piracyshield_service.dda.is_assigned_to_account import DDAIsAssignedToAccountService
+from piracyshield_service.config import ConfigCache
 
 from piracyshield_service.ticket.errors import TicketErrorCode, TicketErrorMessage
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
@@ -62,17 +46,25 @@ class TicketCreateService(BaseService):
     Manages the creation of a new ticket.
     """
 
-    dda_is_assigned_to_account_service = None
+    # dependencies are resolved on first use to keep the import of this module light
+    forensic_create_hash_service = LazyService('piracyshield_service.forensic.create_hash.ForensicCreateHashService')
 
-    forensic_create_hash_service = None
+    forensic_remove_by_ticket_service = LazyService('piracyshield_service.forensic.remove_by_ticket.ForensicRemoveByTicketService')
 
-    log_ticket_create_service = None
+    log_ticket_create_service = LazyService('piracyshield_service.log.ticket.create.LogTicketCreateService')
 
-    provider_exists_by_identifier_service = None
+    ticket_resolve_assignment_service = LazyService('piracyshield_service.ticket.resolve_assignment.TicketResolveAssignmentService')
 
-    provider_get_active_service = None
+    ticket_item_validate_batch_service = None
 
-    ticket_item_data_model = None
+    ticket_chunk_store = None
+
+    # used when not set in the `ticket` section of the application config
+    default_max_items = 1000
+
+    default_chunk_size = 1000
+
+    ticket_config = None
 
     data_model = None
 
@@ -87,6 +79,8 @@ class TicketCreateService(BaseService):
 
         super().__init__()
 
+        self._prepare_configs()
+
         self._prepare_modules()
 
     def execute(
@@ -100,81 +94,16 @@ class TicketCreateService(BaseService):
         created_by: str,
         description: str = None
     ) -> tuple | Exception:
-        # filter duplicates
-        fqdn = list(set(fqdn))
-        ipv4 = list(set(ipv4))
-        ipv6 = list(set(ipv6))
-        assigned_to = list(set(assigned_to))
-
-        # TODO: do not hardcode this.
-        # do not procees if ticket items exceed maximum limits
-        if len(fqdn) > 1000:
-            raise ApplicationException(TicketErrorCode.TOO_MANY_FQDN, TicketErrorMessage.TOO_MANY_FQDN)
-
-        if len(ipv4) > 1000:
-            raise ApplicationException(TicketErrorCode.TOO_MANY_IPV4, TicketErrorMessage.TOO_MANY_IPV4)
-
-        if len(ipv6) > 1000:
-            raise ApplicationException(TicketErrorCode.TOO_MANY_IPV6, TicketErrorMessage.TOO_MANY_IPV6)
-
-        model = self._validate_parameters(
-            ticket_id = self._generate_ticket_id(),
+        (model, fqdn, ipv4, ipv6) = self._prepare_ticket(
             dda_id = dda_id,
-            description = description,
             fqdn = fqdn,
             ipv4 = ipv4,
             ipv6 = ipv6,
-            assigned_to = assigned_to
-        )
-
-        # formal validation before going on with the creation process
-        if fqdn:
-            for fqdn_value in fqdn:
-                self._validate_ticket_item(
-                    ticket_id = model.get('ticket_id'),
-                    value = fqdn_value,
-                    genre = 'fqdn'
-                )
-
-        if ipv4:
-            for ipv4_value in ipv4:
-                self._validate_ticket_item(
-                    ticket_id = model.get('ticket_id'),
-                    value = ipv4_value,
-                    genre = 'ipv4'
-                )
-
-        if ipv6:
-            for ipv6_value in ipv6:
-                self._validate_ticket_item(
-                    ticket_id = model.get('ticket_id'),
-                    value = ipv6_value,
-                    genre = 'ipv6'
-                )
-
-        # verify DDA
-        self._verify_dda(
-            dda_id = dda_id,
-            created_by = created_by
+            assigned_to = assigned_to,
+            created_by = created_by,
+            description = description
         )
 
-        if len(assigned_to):
-            # if specified, validate each provider identifier
-            self._verify_assigned_to(assigned_to)
-
-            model['assigned_to'] = assigned_to
-
-        # otherwise collect all the providers and assign them to the ticket
-        else:
-            model['assigned_to'] = []
-
-            active_providers = self.provider_get_active_service.execute()
-
-            for provider in active_providers:
-                provider_id = provider.get('account_id')
-
-                model['assigned_to'].append(provider_id)
-
         self.forensic_create_hash_service.execute(
             ticket_id = model.get('ticket_id'),
             hash_list = forensic_evidence.get('hash'),
@@ -211,7 +140,12 @@ class TicketCreateService(BaseService):
 
         # initialize the creation of the ticket items
         self._schedule_task(
-            ticket_data = model
+            ticket_data = model,
+            chunks = self._split_chunks(
+                fqdn = fqdn,
+                ipv4 = ipv4,
+                ipv6 = ipv6
+            )
         )
 
         return (
@@ -222,40 +156,114 @@ class TicketCreateService(BaseService):
             model.get('settings').get('revoke_time')
         )
 
-    def _generate_ticket_id(self) -> str:
+    def _prepare_ticket(
+        self,
+        dda_id: str,
+        fqdn: list,
+        ipv4: list,
+        ipv6: list,
+        assigned_to: list,
+        created_by: str,
+        description: str = None
+    ) -> tuple | Exception:
         """
-        Generates a UUIDv4.
+        Validates a new ticket and resolves its providers.
+
+        :return: the ticket model and the deduplicated FQDN, IPv4 and IPv6 lists.
         """
 
-        return self.identifier.generate()
+        # filter duplicates
+        fqdn = list(set(fqdn))
+        ipv4 = list(set(ipv4))
+        ipv6 = list(set(ipv6))
+        assigned_to = list(set(assigned_to))
+
+        # do not procees if ticket items exceed maximum limits
+        if len(fqdn) > self.ticket_config.get('max_fqdn', self.default_max_items):
+            raise ApplicationException(TicketErrorCode.TOO_MANY_FQDN, TicketErrorMessage.TOO_MANY_FQDN)
+
+        if len(ipv4) > self.ticket_config.get('max_ipv4', self.default_max_items):
+            raise ApplicationException(TicketErrorCode.TOO_MANY_IPV4, TicketErrorMessage.TOO_MANY_IPV4)
 
-    def _verify_dda(self, dda_id: str, created_by: str) -> bool | Exception:
-        # check if the DDA identifier is assigned to this account
-        if self.dda_is_assigned_to_account_service.execute(
+        if len(ipv6) > self.ticket_config.get('max_ipv6', self.default_max_items):
+            raise ApplicationException(TicketErrorCode.TOO_MANY_IPV6, TicketErrorMessage.TOO_MANY_IPV6)
+
+        model = self._validate_parameters(
+            ticket_id = self._generate_ticket_id(),
             dda_id = dda_id,
-            account_id = created_by
-        ) == False:
-            raise ApplicationException(TicketErrorCode.UNKNOWN_DDA_IDENTIFIER, TicketErrorMessage.UNKNOWN_DDA_IDENTIFIER)
+            description = description,
+            fqdn = fqdn,
+            ipv4 = ipv4,
+            ipv6 = ipv6,
+            assigned_to = assigned_to
+        )
 
-        return True
+        # formal validation before going on with the creation process
+        if fqdn:
+            self._validate_ticket_items(
+                ticket_id = model.get('ticket_id'),
+                values = fqdn,
+                genre = TicketItemGenreModel.FQDN.value
+            )
+
+        if ipv4:
+            self._validate_ticket_items(
+                ticket_id = model.get('ticket_id'),
+                values = ipv4,
+                genre = TicketItemGenreModel.IPV4.value
+            )
+
+        if ipv6:
+            self._validate_ticket_items(
+                ticket_id = model.get('ticket_id'),
+                values = ipv6,
+                genre = TicketItemGenreModel.IPV6.value
+            )
+
+        # the ticket items don't need to be validated again when inserted
+        model['is_validated'] = True
 
-    def _verify_assigned_to(self, assigned_to: list) -> bool | Exception:
+        # verify DDA and providers
+        model['assigned_to'] = self.ticket_resolve_assignment_service.execute(
+            dda_id = dda_id,
+            account_id = created_by,
+            assigned_to = assigned_to
+        )
+
+        return (model, fqdn, ipv4, ipv6)
+
+    def _generate_ticket_id(self) -> str:
+        """
+        Generates a time-ordered UUIDv7.
         """
-        Verifies each provider in the list.
 
-        :param assigned_to: list of valid account identifiers.
-        :return: true if correct, exception if not.
+        return self.identifier.generate()
+
+    def _split_chunks(self, fqdn: list, ipv4: list, ipv6: list) -> list:
         """
+        Splits the ticket items in chunks of a single genre when they exceed the chunk size.
+
+        :return: list of chunks, empty if the items fit a single job.
+        """
+
+        chunk_size = self.ticket_config.get('chunk_size', self.default_chunk_size)
+
+        if len(fqdn) + len(ipv4) + len(ipv6) <= chunk_size:
+            return []
 
-        for provider_id in assigned_to:
-            if self.provider_exists_by_identifier_service.execute(
-                account_id = provider_id
-            ) == False:
-                self.logger.error(f'Could not get assigned accounts: `{assigned_to}`')
+        chunks = []
 
-                raise ApplicationException(TicketErrorCode.NON_EXISTENT_ASSIGNED_TO, TicketErrorMessage.NON_EXISTENT_ASSIGNED_TO)
+        for genre, values in (
+            (TicketItemGenreModel.FQDN.value, fqdn),
+            (TicketItemGenreModel.IPV4.value, ipv4),
+            (TicketItemGenreModel.IPV6.value, ipv6)
+        ):
+            for start in range(0, len(values), chunk_size):
+                chunks.append({
+                    genre: values[start:start + chunk_size]
+                })
 
-            return True
+        return chunks
 
     def _build_document(
         self,
@@ -290,10 +298,20 @@ class TicketCreateService(BaseService):
             }
         }
 
-    def _schedule_task(self, ticket_data: dict) -> None | Exception:
+    def _schedule_task(self, ticket_data: dict, chunks: list = None) -> None | Exception:
+        """
+        Schedules the creation of the ticket items.
+        When chunked, the items are moved to the chunk store and the task processes them one chunk at a time.
+
+        :param ticket_data: the ticket model.
+        :param chunks: optional list of item chunks.
+        """
+
         try:
+            ticket_data = self._build_task_data(ticket_data, chunks)
+
             self.task_service.create(
-                task_caller = ticket_create_task_caller,
+                task_caller = 'piracyshield_service.ticket.tasks.ticket_create.ticket_create_task_caller',
                 delay = 1,
                 ticket_data = ticket_data
             )
@@ -301,8 +319,35 @@ class TicketCreateService(BaseService):
         except Exception as e:
             self.logger.error(f'Could not create ticket items for `{ticket_data.get("ticket_id")}`')
 
+            if chunks:
+                self.ticket_chunk_store.remove(ticket_data.get('ticket_id'))
+
             raise ApplicationException(TicketErrorCode.GENERIC, TicketErrorMessage.GENERIC, e)
 
+    def _build_task_data(self, ticket_data: dict, chunks: list = None) -> dict:
+        """
+        Moves the chunks to the chunk store, leaving only their number in the task data.
+
+        :param ticket_data: the ticket model.
+        :param chunks: optional list of item chunks.
+        :return: the task data.
+        """
+
+        if not chunks:
+            return ticket_data
+
+        for chunk in chunks:
+            self.ticket_chunk_store.append(
+                ticket_id = ticket_data.get('ticket_id'),
+                chunk = chunk
+            )
+
+        ticket_data = {key: value for key, value in ticket_data.items() if key not in ('fqdn', 'ipv4', 'ipv6')}
+
+        ticket_data['chunks'] = len(chunks)
+
+        return ticket_data
+
     def _validate_parameters(self, ticket_id: str, dda_id: str, description: str, fqdn: list, ipv4: list, ipv6: list, assigned_to: list) -> dict | Exception:
         try:
             model = self.data_model(
@@ -356,47 +401,38 @@ class TicketCreateService(BaseService):
         except TicketModelAssignedToNonValidException:
             raise ApplicationException(TicketErrorCode.NON_VALID_ASSIGNED_TO, TicketErrorMessage.NON_VALID_ASSIGNED_TO)
 
-    def _validate_ticket_item(self, ticket_id: str, value: str, genre: str) -> dict | Exception:
-        try:
-            self.ticket_item_data_model(
-                ticket_id = ticket_id, # placeholder
-                ticket_item_id = ticket_id, # placeholder
-                provider_id = ticket_id, # placeholder
-                value = value,
-                genre = genre,
-                is_active = False, # placeholder
-                is_duplicate = False, # placeholder
-                is_whitelisted = False, # placeholder
-                is_error = False # placeholder
-            )
+    def _validate_ticket_items(self, ticket_id: str, values: list, genre: str) -> bool | Exception:
+        """
+        Validates all the values of a genre at once.
+
+        :param ticket_id: the ticket identifier.
+        :param values: list of values.
+        :param genre: the genre of the values.
+        :return: true if correct, exception if not.
+        """
+
+        errors = self.ticket_item_validate_batch_service.execute(
+            genre = genre,
+            values = values
+        )
 
-            return True
+        if errors:
+            self.logger.error(f'Could not create the ticket items `{list(errors.keys())}` for `{ticket_id}`')
 
-        except Exception as e:
-            self.logger.error(f'Could not create the ticket item `{value}` for `{ticket_id}`')
+            raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC)
 
-            raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC, e)
+        return True
 
     def _prepare_configs(self):
-        pass
+        self.ticket_config = ConfigCache.get('application').get('ticket', {})
 
     def _prepare_modules(self):
         self.data_model = TicketModel
 
-        self.ticket_item_data_model = TicketItemModel
-
-        self.data_storage = TicketStorage()
-
-        self.identifier = Identifier()
+        self.ticket_item_validate_batch_service = ServiceFactory.get(TicketItemValidateBatchService)
 
-        self.forensic_create_hash_service = ForensicCreateHashService()
+        self.ticket_chunk_store = TicketChunkStore()
 
-        self.forensic_remove_by_ticket_service = ForensicRemoveByTicketService()
-
-        self.provider_get_active_service = ProviderGetActiveService()
-
-        self.provider_exists_by_identifier_service = ProviderExistsByIdentifierService()
-
-        self.log_ticket_create_service = LogTicketCreateService()
+        self.data_storage = TicketStorage()
 
-        self.dda_is_assigned_to_account_service = DDAIsAssignedToAccountService()
+        self.identifier = OrderedIdentifier()
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from piracyshield_service.ticket.create import TicketCreateService
+
+from piracyshield_service.factory import LazyService
+
+from piracyshield_component.utils.time import Time
+from piracyshield_component.exception import ApplicationException
+
+from piracyshield_data_storage.ticket.storage import TicketStorageCreateException, TicketStorageRemoveException
+
+from piracyshield_service.writer import insert_documents
+
+from piracyshield_service.ticket.errors import TicketErrorCode, TicketErrorMessage
+
+class TicketCreateBulkService(TicketCreateService):
+
+    """
+    Manages the creation of multiple tickets submitted by the same reporter.
+
+    Each ticket is validated on its own, while the lookups, the inserts and the creation job are shared by the whole batch.
+    """
+
+    forensic_create_hash_batch_service = LazyService('piracyshield_service.forensic.create_hash_batch.ForensicCreateHashBatchService')
+
+    log_ticket_create_batch_service = LazyService('piracyshield_service.log.ticket.create_batch.LogTicketCreateBatchService')
+
+    log_ticket_remove_all_service = LazyService('piracyshield_service.log.ticket.remove_all.LogTicketRemoveAllService')
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+    def execute(self, tickets: list, created_by: str) -> list | Exception:
+        """
+        :param tickets: a list of dictionaries with the same parameters of `TicketCreateService.execute()`.
+        :param created_by: the reporter account identifier.
+        :return: a list with the result of each ticket, in the same order.
+        """
+
+        results = [None] * len(tickets)
+
+        # valid tickets, by position
+        prepared = {}
+
+        for position, ticket in enumerate(tickets):
+            try:
+                (model, fqdn, ipv4, ipv6) = self._prepare_ticket(
+                    dda_id = ticket.get('dda_id'),
+                    fqdn = ticket.get('fqdn') or [],
+                    ipv4 = ticket.get('ipv4') or [],
+                    ipv6 = ticket.get('ipv6') or [],
+                    assigned_to = ticket.get('assigned_to') or [],
+                    created_by = created_by,
+                    description = ticket.get('description')
+                )
+
+                hash_list = (ticket.get('forensic_evidence') or {}).get('hash') or {}
+
+                self.forensic_create_hash_batch_service.validate(hash_list)
+
+                prepared[position] = (model, fqdn, ipv4, ipv6, hash_list)
+
+            except ApplicationException as e:
+                results[position] = self._build_error(e)
+
+        if not prepared:
+            return results
+
+        try:
+            self._create_tickets(
+                prepared = prepared,
+                created_by = created_by
+            )
+
+        # the batch is stored as a whole, so every valid ticket shares the same outcome
+        except ApplicationException as e:
+            for position in prepared.keys():
+                results[position] = self._build_error(e)
+
+            return results
+
+        for position, (model, fqdn, ipv4, ipv6, hash_list) in prepared.items():
+            results[position] = {
+                'ticket_id': model.get('ticket_id'),
+                'revoke_time': model.get('settings').get('revoke_time')
+            }
+
+        return results
+
+    def _create_tickets(self, prepared: dict, created_by: str) -> None | Exception:
+        ticket_ids = [model.get('ticket_id') for (model, fqdn, ipv4, ipv6, hash_list) in prepared.values()]
+
+        try:
+            self.forensic_create_hash_batch_service.execute(
+                hash_lists = {model.get('ticket_id'): hash_list for (model, fqdn, ipv4, ipv6, hash_list) in prepared.values()},
+                reporter_id = created_by
+            )
+
+        # without `insert_many()` some hashes may have been stored already
+        except ApplicationException:
+            self._rollback_hashes(ticket_ids)
+
+            raise
+
+        now = Time.now_iso8601()
+
+        documents = [
+            self._build_document(
+                model = model,
+                fqdn = fqdn,
+                ipv4 = ipv4,
+                ipv6 = ipv6,
+                now = now,
+                created_by = created_by
+            ) for (model, fqdn, ipv4, ipv6, hash_list) in prepared.values()
+        ]
+
+        try:
+            # insert the data into the database
+            insert_documents(self.data_storage, documents)
+
+        # without `insert_many()` some tickets may have been stored already
+        except TicketStorageCreateException as e:
+            self.logger.error(f'Could not create the tickets')
+
+            self._rollback_tickets(ticket_ids)
+
+            raise ApplicationException(TicketErrorCode.GENERIC, TicketErrorMessage.GENERIC, e)
+
+        try:
+            # log the operation
+            self.log_ticket_create_batch_service.execute(
+                entries = [
+                    {
+                        'ticket_id': document.get('ticket_id'),
+                        'message': f'Initial status set to `{document.get("status")}`.'
+                    } for document in documents
+                ]
+            )
+
+            # initialize the creation of the ticket items with a single job
+            self._schedule_bulk_task(
+                tickets = [
+                    (
+                        model,
+                        self._split_chunks(
+                            fqdn = fqdn,
+                            ipv4 = ipv4,
+                            ipv6 = ipv6
+                        )
+                    ) for (model, fqdn, ipv4, ipv6, hash_list) in prepared.values()
+                ]
+            )
+
+        # the tickets are reported as failed, so they're not left behind
+        except ApplicationException:
+            self._rollback_tickets(ticket_ids)
+
+            raise
+
+        self.logger.info(f'{len(documents)} tickets created by `{created_by}`')
+
+    def _rollback_tickets(self, ticket_ids: list) -> None:
+        """
+        Removes whatever has been stored for the tickets of a failed batch.
+
+        :param ticket_ids: list of ticket identifiers.
+        """
+
+        for ticket_id in ticket_ids:
+            # each step goes on its own, as the logs may have not been stored at all
+            try:
+                self.log_ticket_remove_all_service.execute(ticket_id)
+
+            except ApplicationException:
+                pass
+
+            try:
+                self.data_storage.remove(
+                    ticket_id = ticket_id
+                )
+
+            except TicketStorageRemoveException:
+                self.logger.error(f'Could not roll back the ticket `{ticket_id}`')
+
+        self._rollback_hashes(ticket_ids)
+
+    def _rollback_hashes(self, ticket_ids: list) -> None:
+        """
+        Removes the forensic hashes stored for the tickets of a failed batch.
+
+        :param ticket_ids: list of ticket identifiers.
+        """
+
+        for ticket_id in ticket_ids:
+            try:
+                self.forensic_remove_by_ticket_service.execute(ticket_id)
+
+            except ApplicationException:
+                self.logger.error(f'Could not roll back the forensic hashes of the ticket `{ticket_id}`')
+
+    def _schedule_bulk_task(self, tickets: list) -> None | Exception:
+        """
+        :param tickets: a list of ticket models and their item chunks.
+        """
+
+        try:
+            tickets_data = [self._build_task_data(model, chunks) for (model, chunks) in tickets]
+
+            self.task_service.create(
+                task_caller = 'piracyshield_service.ticket.tasks.ticket_create_bulk.ticket_create_bulk_task_caller',
+                delay = 1,
+                tickets_data = tickets_data
+            )
+
+        except Exception as e:
+            self.logger.error(f'Could not create ticket items for `{[model.get("ticket_id") for (model, chunks) in tickets]}`')
+
+            for (model, chunks) in tickets:
+                if chunks:
+                    self.ticket_chunk_store.remove(model.get('ticket_id'))
+
+            raise ApplicationException(TicketErrorCode.GENERIC, TicketErrorMessage.GENERIC, e)
+
+    def _build_error(self, e: ApplicationException) -> dict:
+        return {
+            'error': {
+                'code': e.code,
+                'message': e.message
+            }
+        }
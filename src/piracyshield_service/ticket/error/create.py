@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.security.identifier import Identifier
+from piracyshield_service.factory import ServiceFactory
+
+from piracyshield_service.identifier import OrderedIdentifier
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
@@ -180,7 +183,7 @@ class TicketErrorCreateService(BaseService):
 
     def _generate_ticket_error_id(self) -> str:
         """
-        Generates a UUIDv4.
+        Generates a time-ordered UUIDv7.
         """
 
         return self.identifier.generate()
@@ -252,12 +255,12 @@ class TicketErrorCreateService(BaseService):
 
         self.data_storage = TicketErrorStorage()
 
-        self.identifier = Identifier()
+        self.identifier = OrderedIdentifier()
 
-        self.ticket_get_service = TicketGetService()
+        self.ticket_get_service = ServiceFactory.get(TicketGetService)
 
-        self.ticket_item_set_flag_error_service = TicketItemSetFlagErrorService()
+        self.ticket_item_set_flag_error_service = ServiceFactory.get(TicketItemSetFlagErrorService)
 
-        self.ticket_item_get_available_by_ticket_service = TicketItemGetAvailableByTicketService()
+        self.ticket_item_get_available_by_ticket_service = ServiceFactory.get(TicketItemGetAvailableByTicketService)
 
-        self.log_ticket_create_service = LogTicketCreateService()
+        self.log_ticket_create_service = ServiceFactory.get(LogTicketCreateService)
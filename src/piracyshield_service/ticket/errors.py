@@ -43,6 +43,8 @@ class TicketErrorCode:
 
     TOO_MANY_IPV6 = '4020'
 
+    NON_VALID_CURSOR = '4021'
+
 class TicketErrorMessage:
 
     GENERIC = 'Error during the handling of the ticket.'
@@ -86,3 +88,5 @@ class TicketErrorMessage:
     TOO_MANY_IPV4 = 'Too many IPv4 items.'
 
     TOO_MANY_IPV6 = 'Too many IPv6 items.'
+
+    NON_VALID_CURSOR = 'Non valid pagination cursor.'
@@ -6,6 +6,8 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.ticket.storage import TicketStorage, TicketStorageGetException
 
+from piracyshield_service.pagination import KeysetPaginator, PaginationCursorException, PaginationKeyException
+
 from piracyshield_service.ticket.errors import TicketErrorCode, TicketErrorMessage
 
 class TicketGetAllService(BaseService):
@@ -16,6 +18,8 @@ class TicketGetAllService(BaseService):
 
     data_storage = None
 
+    paginator = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -39,6 +43,38 @@ class TicketGetAllService(BaseService):
 
             raise ApplicationException(TicketErrorCode.GENERIC, TicketErrorMessage.GENERIC, e)
 
+    def execute_page(self, cursor: str = None, limit: int = None, fields: list = None) -> dict | Exception:
+        """
+        Returns a page of tickets, to go through them without reading them all.
+
+        :param cursor: the cursor of the previous page, None for the first page.
+        :param limit: number of tickets of the page.
+        :param fields: optional list of fields to return (ie. `ticket_id`, `metadata.created_at`).
+        :return: the `items` of the page and the `cursor` of the next page, None if this is the last one.
+        """
+
+        try:
+            return self.paginator.paginate_storage(
+                self.data_storage,
+                'get_all',
+                cursor = cursor,
+                limit = limit,
+                fields = fields
+            )
+
+        except PaginationCursorException:
+            raise ApplicationException(TicketErrorCode.NON_VALID_CURSOR, TicketErrorMessage.NON_VALID_CURSOR)
+
+        except PaginationKeyException as e:
+            self.logger.error(f'Could not paginate, a document has no `{e}`')
+
+            raise ApplicationException(TicketErrorCode.GENERIC, TicketErrorMessage.GENERIC, e)
+
+        except TicketStorageGetException as e:
+            self.logger.error(f'Could not get tickets')
+
+            raise ApplicationException(TicketErrorCode.GENERIC, TicketErrorMessage.GENERIC, e)
+
     def _schedule_task(self):
         pass
 
@@ -50,3 +86,6 @@ class TicketGetAllService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = TicketStorage()
+
+        # by time, as the identifiers of the older tickets are random
+        self.paginator = KeysetPaginator(key = ('metadata.created_at', 'ticket_id'))
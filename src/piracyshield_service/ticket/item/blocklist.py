@@ -0,0 +1,545 @@
+from __future__ import annotations
+
+from piracyshield_component.log.logger import Logger
+
+from piracyshield_service.connection import ConnectionRegistry
+
+from piracyshield_service.ticket.item.digest import ItemDigest
+
+from redis.exceptions import RedisError, WatchError
+
+class ProviderBlocklist:
+
+    """
+    Materialised list of the items each provider must block, by genre.
+
+    Each list is a Redis sorted set with a version number, bumped on every change. Every value has the same score,
+    so the values are unique and sorted lexicographically: the list only depends on its content, whatever the history.
+    The list is:
+    - built from the storage on the first pull;
+    - extended when a ticket becomes visible;
+    - shrunk when an item is deactivated;
+    - dropped when a change can't be applied incrementally (ie. whitelist changes, removed tickets),
+      so the next pull builds it again.
+
+    Lists expire after `max_age`, as a safety net for lost updates.
+    A global generation counter is bumped by any update, for the views spanning every provider.
+    A list is added to the index before being built, so the removals and invalidations that arrive while the storage
+    is queried discard the build, which starts again. The index expires with the latest of the lists.
+
+    Each list also keeps its `ItemDigest`, updated in the same script of every single change.
+
+    Every addition and removal is appended to a journal of the list, by version, so a provider that already has
+    the list at a given version gets only the changes since then. The journal starts when the list is built and
+    keeps the latest `max_journal` changes; older versions get the whole list instead.
+    """
+
+    key_prefix = 'provider_blocklist'
+
+    # seconds before a list is built again from the storage
+    max_age = 3600
+
+    # changes kept in the journal of each list
+    max_journal = 100000
+
+    # builds of a list changed while being built, before serving the values without storing them
+    max_build_attempts = 3
+
+    redis_connection = None
+
+    logger = None
+
+    # appends the changes of a version to the journal, dropping the oldest versions past the limit
+    _JOURNAL_FUNCTION = """
+        local function journal(key, start_key, version, changes, limit, ttl)
+            for _, change in ipairs(changes) do
+                redis.call('ZADD', key, version, version .. ':' .. change)
+            end
+            local excess = redis.call('ZCARD', key) - limit
+            if excess > 0 then
+                local cutoff = redis.call('ZRANGE', key, excess - 1, excess - 1, 'WITHSCORES')[2]
+                redis.call('ZREMRANGEBYSCORE', key, '-inf', cutoff)
+                redis.call('SET', start_key, cutoff)
+            end
+            redis.call('EXPIRE', key, ttl)
+            redis.call('EXPIRE', start_key, ttl)
+        end
+    """
+
+    # adds the values only to a materialised list, otherwise bumps the version so a build in progress is discarded;
+    # each value is followed by the 8 limbs of its hash, added to the digest only when the value is new
+    _ADD_SCRIPT = _JOURNAL_FUNCTION + """
+        redis.call('INCR', KEYS[4])
+        if redis.call('EXISTS', KEYS[1]) == 0 then
+            redis.call('INCR', KEYS[3])
+            return -1
+        end
+        local changes = {}
+        for offset = 0, #ARGV - 2, 9 do
+            if redis.call('ZADD', KEYS[2], 'NX', 0, ARGV[offset + 1]) == 1 then
+                for limb = 1, 8 do
+                    redis.call('HINCRBY', KEYS[5], limb - 1, ARGV[offset + 1 + limb])
+                end
+                table.insert(changes, '+' .. ARGV[offset + 1])
+            end
+        end
+        if #changes > 0 then
+            local ttl = redis.call('TTL', KEYS[1])
+            redis.call('EXPIRE', KEYS[2], ttl)
+            redis.call('EXPIRE', KEYS[5], ttl)
+            journal(KEYS[6], KEYS[7], redis.call('INCR', KEYS[3]), changes, tonumber(ARGV[#ARGV]), ttl)
+        end
+        return #changes
+    """
+
+    # removes the values, with the same layout of the arguments of `_ADD_SCRIPT`
+    _REMOVE_SCRIPT = _JOURNAL_FUNCTION + """
+        local changes = {}
+        for offset = 0, #ARGV - 2, 9 do
+            if redis.call('ZREM', KEYS[2], ARGV[offset + 1]) == 1 then
+                for limb = 1, 8 do
+                    redis.call('HINCRBY', KEYS[4], limb - 1, '-' .. ARGV[offset + 1 + limb])
+                end
+                table.insert(changes, '-' .. ARGV[offset + 1])
+            end
+        end
+        local version = redis.call('INCR', KEYS[3])
+        local ttl = redis.call('TTL', KEYS[1])
+        if #changes > 0 and ttl > 0 then
+            journal(KEYS[5], KEYS[6], version, changes, tonumber(ARGV[#ARGV]), ttl)
+        end
+        return #changes
+    """
+
+    digest = None
+
+    def __init__(self):
+        self.digest = ItemDigest()
+
+        self._prepare_connections()
+
+    def get(self, provider_id: str, genre: str, builder: callable) -> list:
+        """
+        Returns the items of a provider, building the list from the storage if not materialised.
+
+        :param provider_id: the provider account identifier.
+        :param genre: `fqdn`, `ipv4` or `ipv6`.
+        :param builder: a function returning the values from the storage.
+        :return: list of unique values, sorted.
+        """
+
+        return self.get_with_version(provider_id, genre, builder)[0]
+
+    def get_with_version(self, provider_id: str, genre: str, builder: callable) -> tuple:
+        """
+        Same as `get()`, also returning the version the values belong to.
+
+        :return: the list of values and its version, None if the values don't match any stored version.
+        """
+
+        keys = self._get_keys(provider_id, genre)
+
+        try:
+            # read as a single transaction, so the values and the version match
+            pipeline = self.redis_connection.pipeline()
+
+            pipeline.exists(keys.get('ready'))
+
+            pipeline.zrange(keys.get('items'), 0, -1)
+
+            pipeline.get(keys.get('version'))
+
+            (is_ready, values, version) = pipeline.execute()
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not read the `{genre}` blocklist of `{provider_id}`: {e}')
+
+            return (self._get_canonical(builder()), None)
+
+        if is_ready:
+            return ([value.decode() for value in values], int(version or 0))
+
+        return self._build(provider_id, genre, builder)
+
+    def get_digest(self, provider_id: str, genre: str, builder: callable) -> str | None:
+        """
+        Returns the `ItemDigest` of the items of a provider, building the list from the storage if not materialised.
+
+        :param provider_id: the provider account identifier.
+        :param genre: `fqdn`, `ipv4` or `ipv6`.
+        :param builder: a function returning the values from the storage.
+        :return: a 64 characters hexadecimal string, None for an empty list.
+        """
+
+        keys = self._get_keys(provider_id, genre)
+
+        try:
+            pipeline = self.redis_connection.pipeline()
+
+            pipeline.exists(keys.get('ready'))
+
+            pipeline.zcard(keys.get('items'))
+
+            pipeline.hmget(keys.get('digest'), [str(limb) for limb in range(self.digest.limbs)])
+
+            (is_ready, count, limb_sums) = pipeline.execute()
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not read the `{genre}` blocklist digest of `{provider_id}`: {e}')
+
+            return self.digest.from_values(builder())
+
+        if not is_ready:
+            return self.digest.from_values(self._build(provider_id, genre, builder)[0])
+
+        if not count:
+            return None
+
+        return self.digest.from_limbs([limb_sum or 0 for limb_sum in limb_sums])
+
+    def get_changes(self, provider_id: str, genre: str, cursor: int | None, builder: callable) -> dict:
+        """
+        Returns the changes of the items of a provider since a version.
+
+        :param provider_id: the provider account identifier.
+        :param genre: `fqdn`, `ipv4` or `ipv6`.
+        :param cursor: the version of the list the provider already has, None for the whole list.
+        :param builder: a function returning the values from the storage.
+        :return: the current `version` (to be used as the next cursor, None if not known) and either the `added`
+                 and `removed` values, or the whole list in `items` when `snapshot` is true.
+        """
+
+        keys = self._get_keys(provider_id, genre)
+
+        if cursor is not None:
+            try:
+                pipeline = self.redis_connection.pipeline()
+
+                pipeline.exists(keys.get('ready'))
+
+                pipeline.get(keys.get('version'))
+
+                pipeline.get(keys.get('journal_start'))
+
+                pipeline.zrangebyscore(keys.get('journal'), f'({cursor}', '+inf')
+
+                (is_ready, version, start, changes) = pipeline.execute()
+
+                # the journal covers every change after the cursor
+                if is_ready and start is not None and int(start) <= cursor <= int(version or 0):
+                    (added, removed) = self._merge_changes(changes)
+
+                    return {
+                        'version': int(version or 0),
+                        'snapshot': False,
+                        'added': added,
+                        'removed': removed
+                    }
+
+            except RedisError as e:
+                self._get_logger().error(f'Could not read the `{genre}` blocklist journal of `{provider_id}`: {e}')
+
+        (values, version) = self.get_with_version(provider_id, genre, builder)
+
+        return {
+            'version': version,
+            'snapshot': True,
+            'items': values
+        }
+
+    def get_versions(self, provider_id: str, genres: list) -> dict:
+        """
+        Returns the versions of the lists of a provider, changed by every update.
+
+        :param provider_id: the provider account identifier.
+        :param genres: list of genres.
+        :return: a dictionary of genres and versions, None if not available or not materialised
+                 (as removals don't bump the version of lists not materialised).
+        """
+
+        try:
+            pipeline = self.redis_connection.pipeline()
+
+            for genre in genres:
+                pipeline.exists(self._get_keys(provider_id, genre).get('ready'))
+
+            pipeline.mget([self._get_keys(provider_id, genre).get('version') for genre in genres])
+
+            results = pipeline.execute()
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not read the blocklist versions of `{provider_id}`: {e}')
+
+            return {genre: None for genre in genres}
+
+        return {
+            genre: int(version or 0) if is_ready else None
+            for genre, is_ready, version in zip(genres, results[:-1], results[-1])
+        }
+
+    def get_generation(self) -> int:
+        """
+        Returns a counter changed by any update of the items, materialised or not.
+
+        :return: the generation, None if not available.
+        """
+
+        try:
+            return int(self.redis_connection.get(self._get_generation_key()) or 0)
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not read the blocklists generation: {e}')
+
+            return None
+
+    def notify_change(self) -> None:
+        """
+        Bumps the generation for changes not affecting the materialised lists (ie. new items of a ticket not yet visible).
+        """
+
+        try:
+            self.redis_connection.incr(self._get_generation_key())
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not bump the blocklists generation: {e}')
+
+    def add(self, provider_id: str, genre: str, values: list) -> None:
+        """
+        Adds the values of a ticket that became visible.
+        Nothing is done if the list isn't materialised, as it will be built with the values on the next pull.
+
+        :param provider_id: the provider account identifier.
+        :param genre: `fqdn`, `ipv4` or `ipv6`.
+        :param values: list of values.
+        """
+
+        if not values:
+            return
+
+        keys = self._get_keys(provider_id, genre)
+
+        try:
+            self.redis_connection.eval(
+                self._ADD_SCRIPT,
+                7,
+                keys.get('ready'),
+                keys.get('items'),
+                keys.get('version'),
+                self._get_generation_key(),
+                keys.get('digest'),
+                keys.get('journal'),
+                keys.get('journal_start'),
+                *self._get_script_arguments(values)
+            )
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not update the `{genre}` blocklist of `{provider_id}`: {e}')
+
+            self.invalidate(provider_id, genre)
+
+    def remove(self, values: list) -> None:
+        """
+        Removes deactivated values from every materialised list.
+
+        :param values: list of values.
+        """
+
+        if not values:
+            return
+
+        arguments = self._get_script_arguments(values)
+
+        try:
+            pipeline = self.redis_connection.pipeline()
+
+            for (provider_id, genre) in self._get_materialised():
+                keys = self._get_keys(provider_id, genre)
+
+                pipeline.eval(
+                    self._REMOVE_SCRIPT,
+                    6,
+                    keys.get('ready'),
+                    keys.get('items'),
+                    keys.get('version'),
+                    keys.get('digest'),
+                    keys.get('journal'),
+                    keys.get('journal_start'),
+                    *arguments
+                )
+
+            pipeline.incr(self._get_generation_key())
+
+            pipeline.execute()
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not remove {len(values)} values from the blocklists: {e}')
+
+            self.invalidate()
+
+    def invalidate(self, provider_id: str = None, genre: str = None) -> None:
+        """
+        Drops the lists, so they're built again from the storage on the next pull.
+
+        :param provider_id: optional provider account identifier, every list is dropped if not specified.
+        :param genre: optional genre, every genre of the provider is dropped if not specified.
+        """
+
+        try:
+            materialised = [
+                (materialised_provider_id, materialised_genre)
+                for (materialised_provider_id, materialised_genre) in self._get_materialised()
+                if provider_id in (None, materialised_provider_id) and genre in (None, materialised_genre)
+            ]
+
+            if provider_id and genre and (provider_id, genre) not in materialised:
+                materialised.append((provider_id, genre))
+
+            pipeline = self.redis_connection.pipeline()
+
+            for (materialised_provider_id, materialised_genre) in materialised:
+                keys = self._get_keys(materialised_provider_id, materialised_genre)
+
+                pipeline.delete(keys.get('ready'), keys.get('items'), keys.get('digest'), keys.get('journal'), keys.get('journal_start'))
+
+                pipeline.incr(keys.get('version'))
+
+                pipeline.srem(self._get_index_key(), f'{materialised_provider_id}:{materialised_genre}')
+
+            pipeline.incr(self._get_generation_key())
+
+            pipeline.execute()
+
+        # the lists still expire after `max_age`
+        except RedisError as e:
+            self._get_logger().error(f'Could not invalidate the blocklists: {e}')
+
+    def _build(self, provider_id: str, genre: str, builder: callable) -> tuple:
+        keys = self._get_keys(provider_id, genre)
+
+        values = None
+
+        for attempt in range(self.max_build_attempts):
+            try:
+                # registered before querying the storage, so the removals and invalidations in the meantime bump
+                # the version of this list as well, and the version is read afterwards to discard this build then
+                pipeline = self.redis_connection.pipeline()
+
+                pipeline.sadd(self._get_index_key(), f'{provider_id}:{genre}')
+
+                pipeline.expire(self._get_index_key(), self.max_age)
+
+                pipeline.get(keys.get('version'))
+
+                version = pipeline.execute()[-1]
+
+            except RedisError:
+                return (self._get_canonical(builder()), None)
+
+            # the same values and order the list has once stored
+            values = self._get_canonical(builder())
+
+            with self.redis_connection.pipeline() as pipeline:
+                try:
+                    pipeline.watch(keys.get('version'))
+
+                    if pipeline.get(keys.get('version')) != version:
+                        raise WatchError()
+
+                    pipeline.multi()
+
+                    pipeline.delete(keys.get('items'), keys.get('digest'), keys.get('journal'))
+
+                    if values:
+                        pipeline.zadd(keys.get('items'), dict.fromkeys(values, 0))
+
+                        pipeline.hset(keys.get('digest'), mapping = dict(enumerate(self.digest.sum_limbs(values))))
+
+                    pipeline.expire(keys.get('items'), self.max_age)
+
+                    pipeline.expire(keys.get('digest'), self.max_age)
+
+                    pipeline.set(keys.get('ready'), 1, ex = self.max_age)
+
+                    # the journal starts from the version set by this build
+                    pipeline.set(keys.get('journal_start'), int(version or 0) + 1, ex = self.max_age)
+
+                    pipeline.incr(keys.get('version'))
+
+                    # invalidations in the meantime unregister the list
+                    pipeline.sadd(self._get_index_key(), f'{provider_id}:{genre}')
+
+                    # the version set by this build
+                    return (values, pipeline.execute()[-2])
+
+                except WatchError:
+                    self._get_logger().debug(f'The `{genre}` blocklist of `{provider_id}` changed while being built (attempt {attempt + 1})')
+
+                except RedisError as e:
+                    self._get_logger().error(f'Could not store the `{genre}` blocklist of `{provider_id}`: {e}')
+
+                    break
+
+        # not stored, the next pull builds it again
+        return (values, None)
+
+    def _get_canonical(self, values: list) -> list:
+        # the code point order of the strings matches the byte order of Redis
+        return sorted(set(values or []))
+
+    def _get_materialised(self) -> list:
+        return [tuple(member.decode().rsplit(':', 1)) for member in self.redis_connection.smembers(self._get_index_key())]
+
+    def _get_keys(self, provider_id: str, genre: str) -> dict:
+        key = f'{self.key_prefix}:{provider_id}:{genre}'
+
+        return {
+            'ready': f'{key}:ready',
+            'items': f'{key}:items',
+            'version': f'{key}:version',
+            'digest': f'{key}:digest',
+            'journal': f'{key}:journal',
+            'journal_start': f'{key}:journal_start'
+        }
+
+    def _merge_changes(self, changes: list) -> tuple:
+        # the first change of a value tells if the provider has it, the last one if it must have it
+        states = {}
+
+        for member in changes:
+            change = member.decode().split(':', 1)[1]
+
+            (first, _) = states.get(change[1:], (change[0], None))
+
+            states[change[1:]] = (first, change[0])
+
+        return (
+            [value for value, (first, last) in states.items() if first == last == '+'],
+            [value for value, (first, last) in states.items() if first == last == '-']
+        )
+
+    def _get_script_arguments(self, values: list) -> list:
+        arguments = []
+
+        for value in values:
+            arguments.append(value)
+
+            arguments.extend(self.digest.hash_limbs(value))
+
+        arguments.append(self.max_journal)
+
+        return arguments
+
+    def _get_index_key(self) -> str:
+        return f'{self.key_prefix}:index'
+
+    def _get_generation_key(self) -> str:
+        return f'{self.key_prefix}:generation'
+
+    def _get_logger(self) -> Logger:
+        if self.logger is None:
+            self.logger = Logger('service')
+
+        return self.logger
+
+    def _prepare_connections(self) -> None:
+        self.redis_connection = ConnectionRegistry.get_task_redis()
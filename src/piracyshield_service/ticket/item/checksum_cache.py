@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from piracyshield_component.log.logger import Logger
+
+from piracyshield_service.connection import ConnectionRegistry
+
+from redis.exceptions import RedisError
+
+class ChecksumCache:
+
+    """
+    Memoised checksums of the item lists, by scope (a provider or every item) and genre.
+
+    Each checksum is stored with the version of the list it was computed from, and is returned
+    only while the list is still at that version, so any change of the items invalidates it.
+    Larger structures (ie. the checksum trees) are stored with a field for each part, along with their version.
+    """
+
+    key_prefix = 'item_checksum'
+
+    # seconds before the checksums of a scope are dropped, as lists expire as well
+    max_age = 3600
+
+    redis_connection = None
+
+    logger = None
+
+    def __init__(self):
+        self._prepare_connections()
+
+    def get_many(self, scope: str, versions: dict) -> dict:
+        """
+        Returns the checksums still valid.
+
+        :param scope: a provider identifier or `global`.
+        :param versions: a dictionary of genres and current list versions.
+        :return: a dictionary of genres and checksums (None for empty lists), missing genres are stale.
+        """
+
+        try:
+            memos = self.redis_connection.hmget(self._get_key(scope), list(versions))
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not read the checksums of `{scope}`: {e}')
+
+            return {}
+
+        checksums = {}
+
+        for genre, memo in zip(versions, memos):
+            if memo is None or versions.get(genre) is None:
+                continue
+
+            (version, checksum) = memo.decode().split(':', 1)
+
+            if int(version) == versions.get(genre):
+                checksums[genre] = checksum or None
+
+        return checksums
+
+    def set_many(self, scope: str, checksums: dict) -> None:
+        """
+        Stores the checksums.
+
+        :param scope: a provider identifier or `global`.
+        :param checksums: a dictionary of genres and tuples of list version and checksum (None for empty lists).
+        """
+
+        if not checksums:
+            return
+
+        try:
+            pipeline = self.redis_connection.pipeline()
+
+            pipeline.hset(self._get_key(scope), mapping = {
+                genre: f'{version}:{checksum or ""}'
+                for genre, (version, checksum) in checksums.items()
+            })
+
+            pipeline.expire(self._get_key(scope), self.max_age)
+
+            pipeline.execute()
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not store the checksums of `{scope}`: {e}')
+
+    def get_fields(self, scope: str, version: int, fields: list) -> list | None:
+        """
+        Returns some fields of a structure stored by `set_fields()`, still valid.
+
+        :param scope: `tree:` followed by a provider identifier and a genre.
+        :param version: the current list version.
+        :param fields: list of field names.
+        :return: the values of the fields (None for missing ones), None if the structure is stale or missing.
+        """
+
+        try:
+            (stored_version, *values) = self.redis_connection.hmget(self._get_key(scope), ['version'] + list(fields))
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not read the checksums of `{scope}`: {e}')
+
+            return None
+
+        if stored_version is None or int(stored_version) != version:
+            return None
+
+        return [value.decode() if value is not None else None for value in values]
+
+    def set_fields(self, scope: str, version: int, fields: dict) -> None:
+        """
+        Replaces a structure stored as a field for each part, so the parts are read one at a time.
+
+        :param scope: `tree:` followed by a provider identifier and a genre.
+        :param version: the version of the list it was computed from.
+        :param fields: a dictionary of field names and values.
+        """
+
+        try:
+            # a single transaction, so a reader never gets the fields of two versions
+            pipeline = self.redis_connection.pipeline()
+
+            pipeline.delete(self._get_key(scope))
+
+            pipeline.hset(self._get_key(scope), mapping = {'version': version, **fields})
+
+            pipeline.expire(self._get_key(scope), self.max_age)
+
+            pipeline.execute()
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not store the checksums of `{scope}`: {e}')
+
+    def _get_key(self, scope: str) -> str:
+        return f'{self.key_prefix}:{scope}'
+
+    def _get_logger(self) -> Logger:
+        if self.logger is None:
+            self.logger = Logger('service')
+
+        return self.logger
+
+    def _prepare_connections(self) -> None:
+        self.redis_connection = ConnectionRegistry.get_task_redis()
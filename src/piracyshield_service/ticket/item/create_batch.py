@@ -9,18 +9,38 @@ from piracyshield_data_model.ticket.item.model import TicketItemModel
 
 from piracyshield_data_storage.ticket.item.storage import TicketItemStorage, TicketItemStorageCreateException
 
+from piracyshield_service.config import ConfigCache
+
+from piracyshield_service.writer import ChunkedWriter
+
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
+import copy
+
 class TicketItemCreateBatchService(BaseService):
 
     """
-    Create multiple ticket items in a single batch.
+    Create multiple ticket items in chunked batches.
     """
 
     data_model = None
 
     data_storage = None
 
+    writer = None
+
+    # used when not set in the `ticket.item_writer` section of the application config
+    default_chunk_size = 1000
+
+    default_min_chunk_size = 100
+
+    default_max_chunk_size = 10000
+
+    # seconds
+    default_target_latency = 0.5
+
+    writer_config = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -28,36 +48,72 @@ class TicketItemCreateBatchService(BaseService):
 
         super().__init__()
 
+        self._prepare_configs()
+
         self._prepare_modules()
 
-    def execute(self, ticket_items: list) -> bool | Exception:
+    def execute(self, ticket_items: iter, is_trusted: bool = False) -> int | Exception:
         """
-        :param ticket_items: a list of ticket items dictionaries.
-        :return
+        :param ticket_items: an iterable of ticket items dictionaries, consumed one chunk at a time.
+        :param is_trusted: true if the values have been already validated, each value goes through the data model only once then.
+        :return: the number of created ticket items.
         """
 
-        batch = []
-
-        for ticket_item in ticket_items:
-            model = self._validate_parameters(**ticket_item)
-
-            batch.append(self._build_document(
-                model = model,
-                now = Time.now_iso8601()
-            ))
-
         try:
             # insert the data into the database
-            self.data_storage.insert_many(batch)
+            written = self.writer.write(self._build_documents(ticket_items, is_trusted))
 
         except TicketItemStorageCreateException as e:
             self.logger.error(f'Could not massively create ticket items')
 
             raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC, e)
 
-        self.logger.info(f'Created {len(batch)} ticket items')
+        self.logger.info(f'Created {written} ticket items')
+
+        return written
+
+    def _build_documents(self, ticket_items: iter, is_trusted: bool) -> iter:
+        # validated models by value and flags, used for the trusted items assigned to the other providers.
+        # The relations come value by value, so only the ones of the current chunk are kept
+        templates = {}
+
+        count = 0
+
+        for ticket_item in ticket_items:
+            if count >= self.writer.chunk_size:
+                templates.clear()
+
+                count = 0
 
-        return True
+            count += 1
+
+            if not is_trusted:
+                model = self._validate_parameters(**ticket_item)
+
+            else:
+                template_key = (
+                    ticket_item.get('value'),
+                    ticket_item.get('genre'),
+                    ticket_item.get('is_active'),
+                    ticket_item.get('is_duplicate'),
+                    ticket_item.get('is_whitelisted'),
+                    ticket_item.get('is_error')
+                )
+
+                template = templates.get(template_key)
+
+                if template is None:
+                    model = self._validate_parameters(**ticket_item)
+
+                    templates[template_key] = model
+
+                else:
+                    model = self._build_trusted_model(ticket_item, template)
+
+            yield self._build_document(
+                model = model,
+                now = Time.now_iso8601()
+            )
 
     def _build_document(self, model: dict, now: str) -> dict:
         return {
@@ -78,6 +134,26 @@ class TicketItemCreateBatchService(BaseService):
             }
         }
 
+    def _build_trusted_model(self, ticket_item: dict, template: dict) -> dict:
+        """
+        Builds the model of an already validated ticket item from the model of the same value and flags.
+        Only the identifiers differ, and they're generated internally.
+
+        :param ticket_item: the ticket item dictionary.
+        :param template: the validated model of the same value and flags.
+        :return: the model dictionary.
+        """
+
+        model = copy.deepcopy(template)
+
+        model['ticket_id'] = ticket_item.get('ticket_id')
+
+        model['ticket_item_id'] = ticket_item.get('ticket_item_id')
+
+        model['provider_id'] = ticket_item.get('provider_id')
+
+        return model
+
     def _schedule_task(self):
         pass
 
@@ -114,9 +190,20 @@ class TicketItemCreateBatchService(BaseService):
             raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC, e)
 
     def _prepare_configs(self):
-        pass
+        self.writer_config = ConfigCache.get('application').get('ticket', {}).get('item_writer', {})
 
     def _prepare_modules(self):
         self.data_model = TicketItemModel
 
         self.data_storage = TicketItemStorage()
+
+        # the chunk size keeps adapting across tickets and jobs
+        self.writer = ChunkedWriter(
+            insert = self.data_storage.insert_many,
+            chunk_size = self.writer_config.get('chunk_size', self.default_chunk_size),
+            min_chunk_size = self.writer_config.get('min_chunk_size', self.default_min_chunk_size),
+            max_chunk_size = self.writer_config.get('max_chunk_size', self.default_max_chunk_size),
+            target_latency = self.writer_config.get('target_latency', self.default_target_latency),
+            workers = self.writer_config.get('workers', 1),
+            name = 'ticket_item'
+        )
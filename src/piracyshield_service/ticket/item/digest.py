@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+
+class ItemDigest:
+
+    """
+    Order-independent digest of a list of items, updated in constant time when an item is added or removed.
+
+    The digest is the sum, modulo 2^256, of the SHA-256 of each value (UTF-8 encoded) read as a big-endian integer,
+    formatted as 64 hexadecimal characters. Adding an item adds its hash and removing it subtracts the same amount,
+    so a provider can keep its own digest in sync with the changes and compare it with the published one.
+    Lists are sets, so repeated values are counted once.
+
+    Stored digests are split in 8 limbs of 32 bits, each one summed on its own so that it can be increased
+    atomically by Redis (`HINCRBY`) without handling the carry, which is applied when the digest is read.
+    """
+
+    limbs = 8
+
+    limb_bits = 32
+
+    modulus = 1 << 256
+
+    def hash(self, value: str) -> int:
+        """
+        :param value: a single item value.
+        :return: the hash of the value as an integer.
+        """
+
+        return int.from_bytes(hashlib.sha256(value.encode()).digest(), 'big')
+
+    def hash_limbs(self, value: str) -> tuple:
+        """
+        :param value: a single item value.
+        :return: the hash of the value as 8 integers, the most significant first.
+        """
+
+        return struct.unpack('>8I', hashlib.sha256(value.encode()).digest())
+
+    def from_values(self, values: list) -> str | None:
+        """
+        Computes the digest of a whole list.
+
+        :param values: list of values.
+        :return: a 64 characters hexadecimal string, None for an empty list.
+        """
+
+        if not len(values):
+            return None
+
+        return self._format(sum(self.hash(value) for value in set(values)))
+
+    def from_limbs(self, limb_sums: list) -> str:
+        """
+        Computes the digest from the sums of each limb.
+
+        :param limb_sums: the 8 sums, the most significant first.
+        :return: a 64 characters hexadecimal string.
+        """
+
+        total = 0
+
+        for limb_sum in limb_sums:
+            total = (total << self.limb_bits) + int(limb_sum)
+
+        return self._format(total)
+
+    def sum_limbs(self, values: list) -> list:
+        """
+        Sums the limbs of the hashes of a list, to store its digest.
+
+        :param values: list of values.
+        :return: the 8 sums, the most significant first.
+        """
+
+        limb_sums = [0] * self.limbs
+
+        for value in set(values):
+            for position, limb in enumerate(self.hash_limbs(value)):
+                limb_sums[position] += limb
+
+        return limb_sums
+
+    def _format(self, total: int) -> str:
+        return format(total % self.modulus, '064x')
@@ -25,6 +25,10 @@ class TicketItemErrorCode:
 
     TICKET_ITEM_EMPTY_CHECKSUM = '5011'
 
+    TICKET_ITEM_GENRE_NON_VALID = '5012'
+
+    TICKET_ITEM_CHECKSUM_NODE_NOT_FOUND = '5013'
+
 class TicketItemErrorMessage:
 
     GENERIC = 'Generic error.'
@@ -50,3 +54,7 @@ class TicketItemErrorMessage:
     TICKET_ITEM_UPDATE_TIME_EXCEEDED = 'Cannot update the ticket item: max update time has been exceeded.'
 
     TICKET_ITEM_EMPTY_CHECKSUM = 'No ticket item available to generate a checksum.'
+
+    TICKET_ITEM_GENRE_NON_VALID = 'Non valid ticket item genre.'
+
+    TICKET_ITEM_CHECKSUM_NODE_NOT_FOUND = 'Checksum node not found.'
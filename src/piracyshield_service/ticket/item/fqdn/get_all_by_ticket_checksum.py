@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.security.checksum import Checksum
 from piracyshield_component.exception import ApplicationException
 
@@ -66,6 +68,6 @@ class TicketItemFQDNGetAllByTicketChecksumService(BaseService):
         pass
 
     def _prepare_modules(self):
-        self.ticket_item_fqdn_get_all_by_ticket_service = TicketItemFQDNGetAllByTicketService()
+        self.ticket_item_fqdn_get_all_by_ticket_service = ServiceFactory.get(TicketItemFQDNGetAllByTicketService)
 
         self.checksum = Checksum()
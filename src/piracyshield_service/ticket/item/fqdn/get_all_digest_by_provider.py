@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from piracyshield_service.base import BaseService
+
+from piracyshield_service.factory import ServiceFactory
+
+from piracyshield_component.exception import ApplicationException
+
+from piracyshield_service.ticket.item.fqdn.get_all_by_provider import TicketItemFQDNGetAllByProviderService
+
+from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
+
+class TicketItemFQDNGetAllDigestByProviderService(BaseService):
+
+    """
+    Returns the order-independent digest of all the tickets' FQDN lists assigned to a provider.
+    """
+
+    ticket_item_fqdn_get_all_by_provider_service = None
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+        self._prepare_modules()
+
+    def execute(self, account_id: str) -> str | Exception:
+        """
+        Get the digest of all the FQDN items assigned to the provider.
+
+        :return
+        """
+
+        digest = self.ticket_item_fqdn_get_all_by_provider_service.execute_digest(
+            account_id = account_id
+        )
+
+        # we don't have any data to work on
+        if digest is None:
+            raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_EMPTY_CHECKSUM, TicketItemErrorMessage.TICKET_ITEM_EMPTY_CHECKSUM)
+
+        return digest
+
+    def _schedule_task(self):
+        pass
+
+    def _validate_parameters(self):
+        pass
+
+    def _prepare_configs(self):
+        pass
+
+    def _prepare_modules(self):
+        self.ticket_item_fqdn_get_all_by_provider_service = ServiceFactory.get(TicketItemFQDNGetAllByProviderService)
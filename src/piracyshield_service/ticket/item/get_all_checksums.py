@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from piracyshield_service.base import BaseService
+
+from piracyshield_service.factory import ServiceFactory
+
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+
+from piracyshield_service.ticket.item.fqdn.get_all import TicketItemFQDNGetAllService
+from piracyshield_service.ticket.item.ipv4.get_all import TicketItemIPv4GetAllService
+from piracyshield_service.ticket.item.ipv6.get_all import TicketItemIPv6GetAllService
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.checksum_cache import ChecksumCache
+from piracyshield_service.ticket.item.stream import StreamChecksum
+
+class TicketItemGetAllChecksumsService(BaseService):
+
+    """
+    Returns the checksums of every genre list.
+
+    Checksums are memoised by the items generation, when stale every genre is computed again at once.
+    """
+
+    scope = 'global'
+
+    checksum_cache = None
+
+    provider_blocklist = None
+
+    ticket_item_get_all_services = None
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+        self._prepare_modules()
+
+    def execute(self) -> dict | Exception:
+        """
+        :return: a dictionary of genres and checksums, None for empty lists.
+        """
+
+        generation = self.provider_blocklist.get_generation()
+
+        versions = {genre: generation for genre in self.ticket_item_get_all_services}
+
+        checksums = self.checksum_cache.get_many(self.scope, versions)
+
+        if len(checksums) == len(versions):
+            return checksums
+
+        checksums = {
+            genre: self._compute_checksum(service.execute_stream())
+            for genre, service in self.ticket_item_get_all_services.items()
+        }
+
+        # items changed while being read, the next call computes them again
+        if generation is not None and self.provider_blocklist.get_generation() == generation:
+            self.checksum_cache.set_many(self.scope, {genre: (generation, checksum) for genre, checksum in checksums.items()})
+
+        return checksums
+
+    def _compute_checksum(self, chunks: Iterator[list]) -> str | None:
+        checksum = StreamChecksum()
+
+        # hashed in chunks, the same values of `execute()`, without joining them in a single string
+        for chunk in chunks:
+            checksum.update(chunk)
+
+        return checksum.hexdigest()
+
+    def _schedule_task(self):
+        pass
+
+    def _validate_parameters(self):
+        pass
+
+    def _prepare_configs(self):
+        pass
+
+    def _prepare_modules(self):
+        self.ticket_item_get_all_services = {
+            TicketItemGenreModel.FQDN.value: ServiceFactory.get(TicketItemFQDNGetAllService),
+            TicketItemGenreModel.IPV4.value: ServiceFactory.get(TicketItemIPv4GetAllService),
+            TicketItemGenreModel.IPV6.value: ServiceFactory.get(TicketItemIPv6GetAllService)
+        }
+
+        self.provider_blocklist = ProviderBlocklist()
+
+        self.checksum_cache = ChecksumCache()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from piracyshield_service.base import BaseService
+
+from piracyshield_service.factory import ServiceFactory
+
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+
+from piracyshield_service.ticket.item.fqdn.get_all_by_provider import TicketItemFQDNGetAllByProviderService
+from piracyshield_service.ticket.item.ipv4.get_all_by_provider import TicketItemIPv4GetAllByProviderService
+from piracyshield_service.ticket.item.ipv6.get_all_by_provider import TicketItemIPv6GetAllByProviderService
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.checksum_cache import ChecksumCache
+from piracyshield_service.ticket.item.stream import StreamChecksum, iterate_chunks
+
+class TicketItemGetAllChecksumsByProviderService(BaseService):
+
+    """
+    Returns the checksums of every genre list assigned to a provider.
+
+    Checksums are memoised by list version, only the genres changed since the last call are computed again,
+    all together.
+    """
+
+    chunk_size = 10000
+
+    checksum_cache = None
+
+    provider_blocklist = None
+
+    ticket_item_get_all_by_provider_services = None
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+        self._prepare_modules()
+
+    def execute(self, account_id: str) -> dict | Exception:
+        """
+        :param account_id: the provider account identifier.
+        :return: a dictionary of genres and checksums, None for empty lists.
+        """
+
+        versions = self.provider_blocklist.get_versions(account_id, list(self.ticket_item_get_all_by_provider_services))
+
+        checksums = self.checksum_cache.get_many(account_id, versions)
+
+        computed = {}
+
+        for genre, service in self.ticket_item_get_all_by_provider_services.items():
+            if genre in checksums:
+                continue
+
+            (values, version) = service.execute_with_version(account_id)
+
+            checksums[genre] = self._compute_checksum(values)
+
+            # values built outside of a stored version can't be memoised
+            if version is not None:
+                computed[genre] = (version, checksums[genre])
+
+        self.checksum_cache.set_many(account_id, computed)
+
+        return checksums
+
+    def _compute_checksum(self, values: list) -> str | None:
+        checksum = StreamChecksum()
+
+        # hashed in chunks, without joining the whole list in a single string
+        for chunk in iterate_chunks(values, self.chunk_size):
+            checksum.update(chunk)
+
+        return checksum.hexdigest()
+
+    def _schedule_task(self):
+        pass
+
+    def _validate_parameters(self):
+        pass
+
+    def _prepare_configs(self):
+        pass
+
+    def _prepare_modules(self):
+        self.ticket_item_get_all_by_provider_services = {
+            TicketItemGenreModel.FQDN.value: ServiceFactory.get(TicketItemFQDNGetAllByProviderService),
+            TicketItemGenreModel.IPV4.value: ServiceFactory.get(TicketItemIPv4GetAllByProviderService),
+            TicketItemGenreModel.IPV6.value: ServiceFactory.get(TicketItemIPv6GetAllByProviderService)
+        }
+
+        self.provider_blocklist = ProviderBlocklist()
+
+        self.checksum_cache = ChecksumCache()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from piracyshield_service.base import BaseService
+
+from piracyshield_service.factory import ServiceFactory
+
+from piracyshield_component.exception import ApplicationException
+
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+
+from piracyshield_service.ticket.get_all_by_provider import TicketGetAllByProviderService
+
+from piracyshield_service.ticket.item.fqdn.get_all_by_provider import TicketItemFQDNGetAllByProviderService
+from piracyshield_service.ticket.item.ipv4.get_all_by_provider import TicketItemIPv4GetAllByProviderService
+from piracyshield_service.ticket.item.ipv6.get_all_by_provider import TicketItemIPv6GetAllByProviderService
+
+from piracyshield_service.ticket.item.fqdn.get_all_by_ticket_checksum_for_provider import TicketItemFQDNGetAllByTicketChecksumForProviderService
+from piracyshield_service.ticket.item.ipv4.get_all_by_ticket_checksum_for_provider import TicketItemIPv4GetAllByTicketChecksumForProviderService
+from piracyshield_service.ticket.item.ipv6.get_all_by_ticket_checksum_for_provider import TicketItemIPv6GetAllByTicketChecksumForProviderService
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.checksum_cache import ChecksumCache
+from piracyshield_service.ticket.item.merkle import MerkleTree
+
+from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
+
+class TicketItemGetChecksumNodeByProviderService(BaseService):
+
+    """
+    Returns a node of the `MerkleTree` over the checksums of each ticket list assigned to a provider.
+
+    The leaves are the same checksums of `TicketItem*GetAllByTicketChecksumForProviderService`, so when the root
+    doesn't match a provider descends the tree and downloads again only the tickets that differ.
+    Trees are memoised by list version with a field for each node, as the descent takes a request for each level
+    and each request reads only the node and its children.
+    """
+
+    checksum_cache = None
+
+    provider_blocklist = None
+
+    ticket_get_all_by_provider_service = None
+
+    ticket_item_get_all_by_provider_services = None
+
+    ticket_item_get_all_by_ticket_checksum_for_provider_services = None
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+        self._prepare_modules()
+
+    def execute(self, account_id: str, genre: str, depth: int = 0, position: int = 0) -> dict | Exception:
+        """
+        :param account_id: the provider account identifier.
+        :param genre: `fqdn`, `ipv4` or `ipv6`.
+        :param depth: the level of the node, 0 for the root.
+        :param position: the position of the node within its level.
+        :return: the node with its checksum and the checksums of its children, or the ticket identifier for a leaf.
+        """
+
+        self._validate_parameters(genre)
+
+        scope = f'tree:{account_id}:{genre}'
+
+        version = self.provider_blocklist.get_versions(account_id, [genre]).get(genre)
+
+        if version is not None:
+            values = self.checksum_cache.get_fields(scope, version, MerkleTree.get_node_fields(depth, position))
+
+            if values is not None:
+                return self._get_node(MerkleTree.node_from_fields(depth, position, values))
+
+        # materialises the list when needed, so its version is known
+        (_, version) = self.ticket_item_get_all_by_provider_services.get(genre).execute_with_version(account_id)
+
+        tree = MerkleTree(self._get_leaves(account_id, genre))
+
+        # the items changed while being read, the next call builds the tree again
+        if version is not None and self.provider_blocklist.get_versions(account_id, [genre]).get(genre) == version:
+            self.checksum_cache.set_fields(scope, version, tree.to_fields())
+
+        return self._get_node(tree.get_node(depth, position))
+
+    def _get_node(self, node: dict | None) -> dict | Exception:
+        if node is None:
+            raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_CHECKSUM_NODE_NOT_FOUND, TicketItemErrorMessage.TICKET_ITEM_CHECKSUM_NODE_NOT_FOUND)
+
+        return node
+
+    def _get_leaves(self, account_id: str, genre: str) -> list:
+        # skip the tickets without items of this genre
+        ticket_ids = [
+            ticket.get('ticket_id')
+            for ticket in self.ticket_get_all_by_provider_service.execute(account_id)
+            if ticket.get(genre)
+        ]
+
+        # the cached checksums are read at once, only the missing ones are computed from the storage
+        checksums = self.ticket_item_get_all_by_ticket_checksum_for_provider_services.get(genre).execute_many(
+            ticket_ids = ticket_ids,
+            account_id = account_id
+        )
+
+        return [(ticket_id, checksum) for ticket_id, checksum in checksums.items() if checksum is not None]
+
+    def _schedule_task(self):
+        pass
+
+    def _validate_parameters(self, genre: str):
+        if genre not in self.ticket_item_get_all_by_provider_services:
+            raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_GENRE_NON_VALID, TicketItemErrorMessage.TICKET_ITEM_GENRE_NON_VALID)
+
+    def _prepare_configs(self):
+        pass
+
+    def _prepare_modules(self):
+        self.ticket_get_all_by_provider_service = ServiceFactory.get(TicketGetAllByProviderService)
+
+        self.ticket_item_get_all_by_provider_services = {
+            TicketItemGenreModel.FQDN.value: ServiceFactory.get(TicketItemFQDNGetAllByProviderService),
+            TicketItemGenreModel.IPV4.value: ServiceFactory.get(TicketItemIPv4GetAllByProviderService),
+            TicketItemGenreModel.IPV6.value: ServiceFactory.get(TicketItemIPv6GetAllByProviderService)
+        }
+
+        self.ticket_item_get_all_by_ticket_checksum_for_provider_services = {
+            TicketItemGenreModel.FQDN.value: ServiceFactory.get(TicketItemFQDNGetAllByTicketChecksumForProviderService),
+            TicketItemGenreModel.IPV4.value: ServiceFactory.get(TicketItemIPv4GetAllByTicketChecksumForProviderService),
+            TicketItemGenreModel.IPV6.value: ServiceFactory.get(TicketItemIPv6GetAllByTicketChecksumForProviderService)
+        }
+
+        self.provider_blocklist = ProviderBlocklist()
+
+        self.checksum_cache = ChecksumCache()
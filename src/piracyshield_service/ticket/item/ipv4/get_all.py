@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from piracyshield_service.base import BaseService
 
 from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.ticket.item.storage import TicketItemStorage, TicketItemStorageGetException
 
+from piracyshield_service.ticket.item.stream import iterate_chunks
+
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
 class TicketItemIPv4GetAllService(BaseService):
@@ -44,6 +48,25 @@ class TicketItemIPv4GetAllService(BaseService):
 
             raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC, e)
 
+    def execute_stream(self, chunk_size: int = 10000) -> Iterator[list] | Exception:
+        """
+        Get all the IPv4 items in chunks, the same values of `execute()`, queried only when consumed.
+
+        :param chunk_size: maximum number of items of each chunk.
+        :return: a generator of lists of values.
+        """
+
+        # the storage errors are raised while iterating, so they're handled in here
+        try:
+            response = self.data_storage.get_all_items_with_genre(genre = 'ipv4')
+
+            yield from iterate_chunks(response.batch(), chunk_size)
+
+        except TicketItemStorageGetException as e:
+            self.logger.error(f'Could not get all the ticket IPv4s')
+
+            raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC, e)
+
     def _schedule_task(self):
         pass
 
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from piracyshield_service.base import BaseService
 
 from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.ticket.item.storage import TicketItemStorage, TicketItemStorageGetException
 
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.stream import iterate_chunks
+
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
 class TicketItemIPv4GetAllByProviderService(BaseService):
@@ -16,6 +21,8 @@ class TicketItemIPv4GetAllByProviderService(BaseService):
 
     data_storage = None
 
+    provider_blocklist = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -32,6 +39,66 @@ class TicketItemIPv4GetAllByProviderService(BaseService):
         :return
         """
 
+        return self.execute_with_version(account_id)[0]
+
+    def execute_with_version(self, account_id: str) -> tuple | Exception:
+        """
+        Get all the IPv4 items with the version of the list.
+
+        :return: the list of values and its version, None if not known.
+        """
+
+        # served from the materialised list, the storage is queried only to build it
+        return self.provider_blocklist.get_with_version(
+            provider_id = account_id,
+            genre = 'ipv4',
+            builder = lambda: self._get_from_storage(account_id)
+        )
+
+    def execute_digest(self, account_id: str) -> str | None | Exception:
+        """
+        Get the order-independent digest of all the IPv4 items, see `ItemDigest`.
+
+        :return: a 64 characters hexadecimal string, None if there are no items.
+        """
+
+        # kept up to date on every change of the materialised list
+        return self.provider_blocklist.get_digest(
+            provider_id = account_id,
+            genre = 'ipv4',
+            builder = lambda: self._get_from_storage(account_id)
+        )
+
+    def execute_changes(self, account_id: str, cursor: int = None) -> dict | Exception:
+        """
+        Get the IPv4 items added and removed since the version of a previous call.
+
+        :param cursor: the `version` returned by the previous call, None for every item.
+        :return: the new `version` and the `added` and `removed` values, or every value in `items` when `snapshot` is true.
+        """
+
+        # the whole list is returned when the cursor is older than the changes kept
+        return self.provider_blocklist.get_changes(
+            provider_id = account_id,
+            genre = 'ipv4',
+            cursor = cursor,
+            builder = lambda: self._get_from_storage(account_id)
+        )
+
+    def execute_stream(self, account_id: str, chunk_size: int = 10000) -> Iterator[list] | Exception:
+        """
+        Get all the IPv4 items in chunks, the same sorted and unique values of `execute()`, read only when consumed.
+
+        :param chunk_size: maximum number of items of each chunk.
+        :return: a generator of lists of values.
+        """
+
+        # the storage errors of a build are raised while iterating, already wrapped by `_get_from_storage()`
+        (values, _) = self.execute_with_version(account_id)
+
+        yield from iterate_chunks(values, chunk_size)
+
+    def _get_from_storage(self, account_id: str) -> list | Exception:
         try:
             response = self.data_storage.get_all_items_with_genre_by_provider(
                 genre = 'ipv4',
@@ -58,3 +125,5 @@ class TicketItemIPv4GetAllByProviderService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = TicketItemStorage()
+
+        self.provider_blocklist = ProviderBlocklist()
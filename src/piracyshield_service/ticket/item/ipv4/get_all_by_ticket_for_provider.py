@@ -6,6 +6,8 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.ticket.item.storage import TicketItemStorage, TicketItemStorageGetException
 
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
 class TicketItemIPv4GetAllByTicketForProviderService(BaseService):
@@ -32,6 +34,16 @@ class TicketItemIPv4GetAllByTicketForProviderService(BaseService):
         :return
         """
 
+        # the items of an open ticket only change through item changes, which evict it
+        return TicketItemListCache.get(
+            ticket_id = ticket_id,
+            provider_id = account_id,
+            genre = 'ipv4',
+            kind = TicketItemListCache.VALUES,
+            builder = lambda: self._get_from_storage(ticket_id, account_id)
+        )
+
+    def _get_from_storage(self, ticket_id: str, account_id: str) -> list | Exception:
         try:
             response = self.data_storage.get_all_items_with_genre_by_ticket_for_provider(
                 ticket_id = ticket_id,
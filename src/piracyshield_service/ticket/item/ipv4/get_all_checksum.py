@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.security.checksum import Checksum
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.exception import ApplicationException
 
-from piracyshield_service.ticket.item.ipv4.get_all import TicketItemIPv4GetAllService
+from piracyshield_service.ticket.item.get_all_checksums import TicketItemGetAllChecksumsService
 
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
@@ -15,9 +16,7 @@ class TicketItemIPv4GetAllChecksumService(BaseService):
     Returns the checksum of all the tickets' IPv4 lists.
     """
 
-    checksum = None
-
-    ticket_item_ipv4_get_all_service = None
+    ticket_item_get_all_checksums_service = None
 
     def __init__(self):
         """
@@ -35,24 +34,14 @@ class TicketItemIPv4GetAllChecksumService(BaseService):
         :return
         """
 
-        response = self.ticket_item_ipv4_get_all_service.execute()
+        # memoised by list version, computed again only when the items change
+        checksum = self.ticket_item_get_all_checksums_service.execute().get('ipv4')
 
         # we don't have any data to work on
-        if not len(response):
+        if checksum is None:
             raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_EMPTY_CHECKSUM, TicketItemErrorMessage.TICKET_ITEM_EMPTY_CHECKSUM)
 
-        data = '\n'.join(response)
-
-        try:
-            return self.checksum.from_string(
-                algorithm = 'sha256',
-                string = data
-            )
-
-        except ChecksumUnicodeException as e:
-            self.logger.error(f'Could not generate the checksum for IPv4s')
-
-            raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC, e)
+        return checksum
 
     def _schedule_task(self):
         pass
@@ -64,6 +53,4 @@ class TicketItemIPv4GetAllChecksumService(BaseService):
         pass
 
     def _prepare_modules(self):
-        self.ticket_item_ipv4_get_all_service = TicketItemIPv4GetAllService()
-
-        self.checksum = Checksum()
+        self.ticket_item_get_all_checksums_service = ServiceFactory.get(TicketItemGetAllChecksumsService)
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.security.checksum import Checksum
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.exception import ApplicationException
 
-from piracyshield_service.ticket.item.ipv4.get_all_by_provider import TicketItemIPv4GetAllByProviderService
+from piracyshield_service.ticket.item.get_all_checksums_by_provider import TicketItemGetAllChecksumsByProviderService
 
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
@@ -15,9 +16,7 @@ class TicketItemIPv4GetAllChecksumByProviderService(BaseService):
     Returns the checksum of all the tickets' IPv4 lists assigned to a provider.
     """
 
-    checksum = None
-
-    ticket_item_ipv4_get_all_by_provider_service = None
+    ticket_item_get_all_checksums_by_provider_service = None
 
     def __init__(self):
         """
@@ -35,26 +34,16 @@ class TicketItemIPv4GetAllChecksumByProviderService(BaseService):
         :return
         """
 
-        response = self.ticket_item_ipv4_get_all_by_provider_service.execute(
+        # memoised by list version, computed again only when the items change
+        checksum = self.ticket_item_get_all_checksums_by_provider_service.execute(
             account_id = account_id
-        )
+        ).get('ipv4')
 
         # we don't have any data to work on
-        if not len(response):
+        if checksum is None:
             raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_EMPTY_CHECKSUM, TicketItemErrorMessage.TICKET_ITEM_EMPTY_CHECKSUM)
 
-        data = '\n'.join(response)
-
-        try:
-            return self.checksum.from_string(
-                algorithm = 'sha256',
-                string = data
-            )
-
-        except ChecksumUnicodeException as e:
-            self.logger.error(f'Could not generate the checksum for IPv4s')
-
-            raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC, e)
+        return checksum
 
     def _schedule_task(self):
         pass
@@ -66,6 +55,4 @@ class TicketItemIPv4GetAllChecksumByProviderService(BaseService):
         pass
 
     def _prepare_modules(self):
-        self.ticket_item_ipv4_get_all_by_provider_service = TicketItemIPv4GetAllByProviderService()
-
-        self.checksum = Checksum()
+        self.ticket_item_get_all_checksums_by_provider_service = ServiceFactory.get(TicketItemGetAllChecksumsByProviderService)
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.security.checksum import Checksum
 from piracyshield_component.exception import ApplicationException
 
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 from piracyshield_service.ticket.item.ipv6.get_all_by_ticket_for_provider import TicketItemIPv6GetAllByTicketForProviderService
 
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
@@ -35,14 +39,43 @@ class TicketItemIPv6GetAllByTicketChecksumForProviderService(BaseService):
         :return
         """
 
+        checksum = TicketItemListCache.get(
+            ticket_id = ticket_id,
+            provider_id = account_id,
+            genre = 'ipv6',
+            kind = TicketItemListCache.CHECKSUM,
+            builder = lambda: self._compute_checksum(ticket_id, account_id)
+        )
+
+        # we don't have any data to work on
+        if checksum is None:
+            raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_EMPTY_CHECKSUM, TicketItemErrorMessage.TICKET_ITEM_EMPTY_CHECKSUM)
+
+        return checksum
+
+    def execute_many(self, ticket_ids: list, account_id: str) -> dict | Exception:
+        """
+        Get the checksums of the IPv6 items of many tickets, reading the cached ones at once.
+
+        :return: a dictionary of ticket identifiers and checksums, None for the tickets without IPv6 items.
+        """
+
+        return TicketItemListCache.get_many(
+            ticket_ids = ticket_ids,
+            provider_id = account_id,
+            genre = 'ipv6',
+            kind = TicketItemListCache.CHECKSUM,
+            builder = lambda ticket_id: self._compute_checksum(ticket_id, account_id)
+        )
+
+    def _compute_checksum(self, ticket_id: str, account_id: str) -> str | None | Exception:
         response = self.ticket_item_ipv6_get_all_by_ticket_for_provider_service.execute(
             ticket_id = ticket_id,
             account_id = account_id
         )
 
-        # we don't have any data to work on
         if not len(response):
-            raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_EMPTY_CHECKSUM, TicketItemErrorMessage.TICKET_ITEM_EMPTY_CHECKSUM)
+            return None
 
         data = '\n'.join(response)
 
@@ -67,6 +100,6 @@ class TicketItemIPv6GetAllByTicketChecksumForProviderService(BaseService):
         pass
 
     def _prepare_modules(self):
-        self.ticket_item_ipv6_get_all_by_ticket_for_provider_service = TicketItemIPv6GetAllByTicketForProviderService()
+        self.ticket_item_ipv6_get_all_by_ticket_for_provider_service = ServiceFactory.get(TicketItemIPv6GetAllByTicketForProviderService)
 
         self.checksum = Checksum()
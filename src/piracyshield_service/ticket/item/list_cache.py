@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from piracyshield_component.log.logger import Logger
+
+from piracyshield_service.cache import LocalCache
+from piracyshield_service.config import ConfigCache
+from piracyshield_service.connection import ConnectionRegistry
+
+from redis.exceptions import RedisError
+
+import json
+
+class TicketItemListCache:
+
+    """
+    Items of a ticket assigned to a provider and their checksums, by ticket, provider, genre and kind (`values`, `checksum`).
+
+    Once a ticket is open its items only change through explicit item changes, which evict the ticket (or everything,
+    for changes spanning many tickets) by bumping an epoch in Redis. Each entry is stored with the epochs read before
+    computing it and returned only while they're unchanged, so every process sees the evictions.
+
+    Entries are kept in a bounded LRU in process and, when `ticket.item_list_cache.redis` is enabled, in Redis
+    as well, so they're computed once for all the workers. The returned values are shared and must be treated as read-only.
+    """
+
+    VALUES = 'values'
+
+    CHECKSUM = 'checksum'
+
+    key_prefix = 'ticket_item_list'
+
+    # seconds before an entry is computed again, as a safety net for lost evictions
+    max_age = 3600
+
+    cache = LocalCache(ttl = max_age, max_size = 10000)
+
+    logger = None
+
+    # the expiration is set only when the entries of a ticket are created, so none outlives the epoch it was built with
+    _STORE_SCRIPT = """
+        redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+        if redis.call('TTL', KEYS[1]) < 0 then
+            redis.call('EXPIRE', KEYS[1], ARGV[3])
+        end
+    """
+
+    @classmethod
+    def get(cls, ticket_id: str, provider_id: str, genre: str, kind: str, builder: callable) -> any:
+        """
+        Returns the cached value or builds and stores it.
+
+        :param ticket_id: the ticket identifier.
+        :param provider_id: the provider account identifier.
+        :param genre: `fqdn`, `ipv4` or `ipv6`.
+        :param kind: `values` or `checksum`.
+        :param builder: a function returning a JSON serializable value from the storage.
+        :return: the value.
+        """
+
+        key = (ticket_id, provider_id, genre, kind)
+
+        field = f'{provider_id}:{genre}:{kind}'
+
+        use_redis = cls._is_redis_enabled()
+
+        try:
+            pipeline = ConnectionRegistry.get_task_redis().pipeline()
+
+            pipeline.mget([cls._get_epoch_key(), cls._get_epoch_key(ticket_id)])
+
+            if use_redis:
+                pipeline.hget(cls._get_entries_key(ticket_id), field)
+
+            results = pipeline.execute()
+
+        # without the epochs the entries can't be validated
+        except RedisError as e:
+            cls._get_logger().error(f'Could not read the item list cache of ticket `{ticket_id}`: {e}')
+
+            return builder()
+
+        epoch = ':'.join(str(int(value or 0)) for value in results[0])
+
+        entry = cls.cache.get(key)
+
+        if entry is not None and entry[0] == epoch:
+            return entry[1]
+
+        if use_redis and results[1] is not None:
+            (stored_epoch, stored_value) = results[1].decode().split('|', 1)
+
+            if stored_epoch == epoch:
+                value = json.loads(stored_value)
+
+                cls.cache.set(key, (epoch, value))
+
+                return value
+
+        value = builder()
+
+        # an eviction in the meantime changes the epochs, so this entry is never returned
+        cls.cache.set(key, (epoch, value))
+
+        if use_redis:
+            cls._store(ticket_id, field, f'{epoch}|{json.dumps(value)}')
+
+        return value
+
+    @classmethod
+    def get_many(cls, ticket_ids: list, provider_id: str, genre: str, kind: str, builder: callable) -> dict:
+        """
+        Same as `get()` for many tickets, reading the epochs and the stored entries in a single round trip.
+
+        :param ticket_ids: list of ticket identifiers.
+        :param provider_id: the provider account identifier.
+        :param genre: `fqdn`, `ipv4` or `ipv6`.
+        :param kind: `values` or `checksum`.
+        :param builder: a function receiving a ticket identifier and returning a JSON serializable value from the storage.
+        :return: a dictionary of ticket identifiers and values.
+        """
+
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+
+        if not ticket_ids:
+            return {}
+
+        field = f'{provider_id}:{genre}:{kind}'
+
+        use_redis = cls._is_redis_enabled()
+
+        try:
+            pipeline = ConnectionRegistry.get_task_redis().pipeline()
+
+            pipeline.mget([cls._get_epoch_key()] + [cls._get_epoch_key(ticket_id) for ticket_id in ticket_ids])
+
+            if use_redis:
+                for ticket_id in ticket_ids:
+                    pipeline.hget(cls._get_entries_key(ticket_id), field)
+
+            results = pipeline.execute()
+
+        except RedisError as e:
+            cls._get_logger().error(f'Could not read the item list cache of {len(ticket_ids)} tickets: {e}')
+
+            return {ticket_id: builder(ticket_id) for ticket_id in ticket_ids}
+
+        (global_epoch, *ticket_epochs) = results[0]
+
+        stored_entries = results[1:] if use_redis else [None] * len(ticket_ids)
+
+        values = {}
+
+        for ticket_id, ticket_epoch, stored_entry in zip(ticket_ids, ticket_epochs, stored_entries):
+            key = (ticket_id, provider_id, genre, kind)
+
+            epoch = f'{int(global_epoch or 0)}:{int(ticket_epoch or 0)}'
+
+            entry = cls.cache.get(key)
+
+            if entry is not None and entry[0] == epoch:
+                values[ticket_id] = entry[1]
+
+                continue
+
+            if stored_entry is not None:
+                (stored_epoch, stored_value) = stored_entry.decode().split('|', 1)
+
+                if stored_epoch == epoch:
+                    values[ticket_id] = json.loads(stored_value)
+
+                    cls.cache.set(key, (epoch, values[ticket_id]))
+
+                    continue
+
+            values[ticket_id] = builder(ticket_id)
+
+            cls.cache.set(key, (epoch, values[ticket_id]))
+
+            if use_redis:
+                cls._store(ticket_id, field, f'{epoch}|{json.dumps(values[ticket_id])}')
+
+        return values
+
+    @classmethod
+    def invalidate(cls, ticket_id: str = None) -> None:
+        """
+        Evicts the entries of a ticket, or of every ticket.
+
+        :param ticket_id: optional ticket identifier.
+        """
+
+        if ticket_id:
+            cls.cache.invalidate_matching(lambda key: key[0] == ticket_id)
+
+        else:
+            cls.cache.invalidate()
+
+        try:
+            pipeline = ConnectionRegistry.get_task_redis().pipeline()
+
+            pipeline.incr(cls._get_epoch_key(ticket_id))
+
+            # outlives any entry built with the previous epoch
+            pipeline.expire(cls._get_epoch_key(ticket_id), cls.max_age * 2)
+
+            if ticket_id:
+                pipeline.delete(cls._get_entries_key(ticket_id))
+
+            pipeline.execute()
+
+        # the entries still expire after `max_age`
+        except RedisError as e:
+            cls._get_logger().error(f'Could not evict the item list cache: {e}')
+
+    @classmethod
+    def _store(cls, ticket_id: str, field: str, value: str) -> None:
+        try:
+            ConnectionRegistry.get_task_redis().eval(cls._STORE_SCRIPT, 1, cls._get_entries_key(ticket_id), field, value, cls.max_age)
+
+        except RedisError as e:
+            cls._get_logger().error(f'Could not store the item list cache of ticket `{ticket_id}`: {e}')
+
+    @classmethod
+    def _is_redis_enabled(cls) -> bool:
+        return bool(ConfigCache.get('application').get('ticket', {}).get('item_list_cache', {}).get('redis', False))
+
+    @classmethod
+    def _get_logger(cls) -> Logger:
+        if cls.logger is None:
+            cls.logger = Logger('service')
+
+        return cls.logger
+
+    @classmethod
+    def _get_epoch_key(cls, ticket_id: str = None) -> str:
+        if ticket_id:
+            return f'{cls.key_prefix}:{ticket_id}:epoch'
+
+        return f'{cls.key_prefix}:epoch'
+
+    @classmethod
+    def _get_entries_key(cls, ticket_id: str) -> str:
+        return f'{cls.key_prefix}:{ticket_id}:entries'
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+class TicketItemMatcher:
+
+    """
+    Compiled view of the active ticket items, used to flag duplicates.
+    """
+
+    def __init__(self, ticket_items: dict):
+        """
+        :param ticket_items: the active ticket items grouped by genre, as returned by `TicketItemGetActiveService`.
+        """
+
+        self.values = {genre: values if isinstance(values, (set, frozenset)) else set(values) for genre, values in (ticket_items or {}).items()}
+
+    def is_duplicate(self, genre: str, value: str) -> bool:
+        return value in self.values.get(genre, ())
+
+    def is_duplicate_many(self, genre: str, values: list) -> list:
+        """
+        :param genre: the genre of the values.
+        :param values: list of values.
+        :return: list of booleans, in the same order.
+        """
+
+        # exact matches on strings, a hash lookup is already cheaper than packing the values
+        existent = self.values.get(genre, ())
+
+        return [value in existent for value in values]
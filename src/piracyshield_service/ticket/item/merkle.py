@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+
+class MerkleTree:
+
+    """
+    Hash tree over the checksums of the tickets of a list, to find which tickets differ from a copy.
+
+    Leaves are the checksums of each ticket, ordered by ticket identifier. Each interior node is the SHA-256
+    (hexadecimal) of the concatenated hexadecimal checksums of its two children; the last node of a level
+    without a sibling is moved up unchanged.
+
+    Nodes are addressed by depth (0 for the root) and position within the level, so a copy with a different
+    root is compared one level at a time, descending only into the children that differ.
+    """
+
+    tickets = None
+
+    # levels of checksums, from the root to the leaves
+    levels = None
+
+    def __init__(self, leaves: list = None):
+        """
+        :param leaves: list of tuples of ticket identifier and checksum.
+        """
+
+        leaves = sorted(leaves or [])
+
+        self.tickets = [ticket_id for (ticket_id, _) in leaves]
+
+        self.levels = [[checksum for (_, checksum) in leaves]] if leaves else []
+
+        while self.levels and len(self.levels[0]) > 1:
+            level = self.levels[0]
+
+            self.levels.insert(0, [
+                self._hash_pair(level[position], level[position + 1]) if position + 1 < len(level) else level[position]
+                for position in range(0, len(level), 2)
+            ])
+
+    def get_root(self) -> str | None:
+        """
+        :return: the checksum of the root, None if there are no tickets.
+        """
+
+        return self.levels[0][0] if self.levels else None
+
+    def get_node(self, depth: int, position: int) -> dict | None:
+        """
+        Returns a node with the checksums of its children.
+
+        :param depth: the level of the node, 0 for the root.
+        :param position: the position of the node within its level.
+        :return: the node, None if it doesn't exist.
+        """
+
+        if depth < 0 or depth >= len(self.levels) or position < 0 or position >= len(self.levels[depth]):
+            return None
+
+        node = {
+            'depth': depth,
+            'position': position,
+            'checksum': self.levels[depth][position],
+            'children': []
+        }
+
+        if depth == len(self.levels) - 1:
+            node['ticket_id'] = self.tickets[position]
+
+        else:
+            node['children'] = self.levels[depth + 1][position * 2:position * 2 + 2]
+
+        return node
+
+    def to_fields(self) -> dict:
+        """
+        Flattens the tree in a field for each node, so a node can be read without loading the whole tree.
+
+        :return: a dictionary with the number of `levels`, the checksums by `depth:position` and the tickets by `ticket:position`.
+        """
+
+        fields = {'levels': len(self.levels)}
+
+        for depth, level in enumerate(self.levels):
+            for position, checksum in enumerate(level):
+                fields[f'{depth}:{position}'] = checksum
+
+        for position, ticket_id in enumerate(self.tickets):
+            fields[f'ticket:{position}'] = ticket_id
+
+        return fields
+
+    @classmethod
+    def get_node_fields(cls, depth: int, position: int) -> list:
+        """
+        :return: the fields of `to_fields()` needed to build a node with `node_from_fields()`.
+        """
+
+        return [
+            'levels',
+            f'{depth}:{position}',
+            f'{depth + 1}:{position * 2}',
+            f'{depth + 1}:{position * 2 + 1}',
+            f'ticket:{position}'
+        ]
+
+    @classmethod
+    def node_from_fields(cls, depth: int, position: int, values: list) -> dict | None:
+        """
+        Builds a node, the same of `get_node()`, from the values of the fields of `get_node_fields()`.
+
+        :return: the node, None if it doesn't exist.
+        """
+
+        (levels, checksum, left, right, ticket_id) = values
+
+        if depth < 0 or position < 0 or depth >= int(levels or 0) or checksum is None:
+            return None
+
+        node = {
+            'depth': depth,
+            'position': position,
+            'checksum': checksum,
+            'children': []
+        }
+
+        if depth == int(levels) - 1:
+            node['ticket_id'] = ticket_id
+
+        else:
+            node['children'] = [child for child in (left, right) if child is not None]
+
+        return node
+
+    def _hash_pair(self, left: str, right: str) -> str:
+        return hashlib.sha256(f'{left}{right}'.encode()).hexdigest()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from piracyshield_service.base import BaseService
+
+from piracyshield_service.factory import ServiceFactory
+
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+
+from piracyshield_service.ticket.get import TicketGetService
+
+from piracyshield_service.ticket.item.fqdn.get_all_by_ticket_for_provider import TicketItemFQDNGetAllByTicketForProviderService
+from piracyshield_service.ticket.item.ipv4.get_all_by_ticket_for_provider import TicketItemIPv4GetAllByTicketForProviderService
+from piracyshield_service.ticket.item.ipv6.get_all_by_ticket_for_provider import TicketItemIPv6GetAllByTicketForProviderService
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
+class TicketItemPublishByTicketService(BaseService):
+
+    """
+    Adds the items of a ticket that became visible to the materialised lists of its providers.
+    """
+
+    ticket_get_service = None
+
+    ticket_item_get_all_by_ticket_for_provider_services = None
+
+    provider_blocklist = None
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+        self._prepare_modules()
+
+    def execute(self, ticket_id: str) -> bool:
+        """
+        :param ticket_id: the ticket identifier.
+        :return: true if the lists have been updated, false if they have been dropped instead.
+        """
+
+        # the ticket status changed, even if none of its items end up in a list
+        self.provider_blocklist.notify_change()
+
+        # the lists read before the ticket was open are dropped, the calls below fill them again
+        TicketItemListCache.invalidate(ticket_id)
+
+        try:
+            ticket = self.ticket_get_service.execute(ticket_id)
+
+            for provider_id in ticket.get('assigned_to') or []:
+                for genre, service in self.ticket_item_get_all_by_ticket_for_provider_services.items():
+                    # skip the query for the genres the ticket doesn't have
+                    if not ticket.get(genre):
+                        continue
+
+                    self.provider_blocklist.add(
+                        provider_id = provider_id,
+                        genre = genre,
+                        values = service.execute(ticket_id = ticket_id, account_id = provider_id)
+                    )
+
+            return True
+
+        # the ticket is already visible, the lists are built again from the storage on the next pull
+        except Exception as e:
+            self.logger.error(f'Could not update the blocklists with ticket `{ticket_id}`: {e}')
+
+            self.provider_blocklist.invalidate()
+
+            return False
+
+    def _schedule_task(self):
+        pass
+
+    def _validate_parameters(self):
+        pass
+
+    def _prepare_configs(self):
+        pass
+
+    def _prepare_modules(self):
+        self.ticket_get_service = ServiceFactory.get(TicketGetService)
+
+        self.ticket_item_get_all_by_ticket_for_provider_services = {
+            TicketItemGenreModel.FQDN.value: ServiceFactory.get(TicketItemFQDNGetAllByTicketForProviderService),
+            TicketItemGenreModel.IPV4.value: ServiceFactory.get(TicketItemIPv4GetAllByTicketForProviderService),
+            TicketItemGenreModel.IPV6.value: ServiceFactory.get(TicketItemIPv6GetAllByTicketForProviderService)
+        }
+
+        self.provider_blocklist = ProviderBlocklist()
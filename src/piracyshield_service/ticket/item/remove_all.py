@@ -6,6 +6,11 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.ticket.item.storage import TicketItemStorage, TicketItemStorageRemoveException
 
+from piracyshield_service.ticket.relation.cache import ActiveItemCache
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
 class TicketItemRemoveAllService(BaseService):
@@ -16,6 +21,8 @@ class TicketItemRemoveAllService(BaseService):
 
     data_storage = None
 
+    provider_blocklist = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -35,6 +42,12 @@ class TicketItemRemoveAllService(BaseService):
 
             raise ApplicationException(TicketItemErrorCode.GENERIC, TicketItemErrorMessage.GENERIC, e)
 
+        ActiveItemCache.publish_invalidate(ActiveItemCache.TICKET_ITEM)
+
+        TicketItemListCache.invalidate(ticket_id)
+
+        self.provider_blocklist.invalidate()
+
         return True
 
     def _schedule_task(self):
@@ -48,3 +61,5 @@ class TicketItemRemoveAllService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = TicketItemStorage()
+
+        self.provider_blocklist = ProviderBlocklist()
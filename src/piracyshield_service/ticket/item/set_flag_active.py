@@ -2,12 +2,19 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.ticket.item.storage import TicketItemStorage, TicketItemStorageUpdateException
 
 from piracyshield_service.log.ticket.item.create import LogTicketItemCreateService
 
+from piracyshield_service.ticket.relation.cache import ActiveItemCache
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
 class TicketItemSetFlagActiveService(BaseService):
@@ -22,6 +29,8 @@ class TicketItemSetFlagActiveService(BaseService):
 
     data_storage = None
 
+    provider_blocklist = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -55,6 +64,18 @@ class TicketItemSetFlagActiveService(BaseService):
 
                 raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_NOT_FOUND, TicketItemErrorMessage.TICKET_ITEM_NOT_FOUND)
 
+            ActiveItemCache.publish_invalidate(ActiveItemCache.TICKET_ITEM)
+
+            # the value may be in any ticket
+            TicketItemListCache.invalidate()
+
+            # a deactivated value leaves every list, a reactivated one goes back only to its providers
+            if status:
+                self.provider_blocklist.invalidate()
+
+            else:
+                self.provider_blocklist.remove([value])
+
             # TODO: log operation.
 
             self.logger.debug(f'Ticket item active flag set to `{status}` for `{value}` by `{internal_id}`')
@@ -78,4 +99,6 @@ class TicketItemSetFlagActiveService(BaseService):
     def _prepare_modules(self):
         self.data_storage = TicketItemStorage()
 
-        self.log_ticket_item_create_service = LogTicketItemCreateService()
+        self.log_ticket_item_create_service = ServiceFactory.get(LogTicketItemCreateService)
+
+        self.provider_blocklist = ProviderBlocklist()
@@ -6,6 +6,11 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.ticket.item.storage import TicketItemStorage, TicketItemStorageUpdateException
 
+from piracyshield_service.ticket.relation.cache import ActiveItemCache
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
 class TicketItemSetFlagErrorService(BaseService):
@@ -16,6 +21,8 @@ class TicketItemSetFlagErrorService(BaseService):
 
     data_storage = None
 
+    provider_blocklist = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -47,6 +54,13 @@ class TicketItemSetFlagErrorService(BaseService):
 
                 raise ApplicationException(TicketItemErrorCode.TICKET_ITEM_NOT_FOUND, TicketItemErrorMessage.TICKET_ITEM_NOT_FOUND)
 
+            ActiveItemCache.publish_invalidate(ActiveItemCache.TICKET_ITEM)
+
+            TicketItemListCache.invalidate(ticket_id)
+
+            # the value may still be blocked through other tickets
+            self.provider_blocklist.invalidate()
+
             # TODO: log operation.
 
             self.logger.debug(f'Ticket item error flag set to `{status}` for ticket item `{value}`, ticket `{ticket_id}`')
@@ -69,3 +83,5 @@ class TicketItemSetFlagErrorService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = TicketItemStorage()
+
+        self.provider_blocklist = ProviderBlocklist()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
@@ -166,8 +168,8 @@ class TicketItemSetUnprocessedService(BaseService):
 
         self.data_storage = TicketItemStorage()
 
-        self.ticket_item_get_by_value_service = TicketItemGetByValueService()
+        self.ticket_item_get_by_value_service = ServiceFactory.get(TicketItemGetByValueService)
 
-        self.log_ticket_create_service = LogTicketCreateService()
+        self.log_ticket_create_service = ServiceFactory.get(LogTicketCreateService)
 
-        self.log_ticket_item_create_service = LogTicketItemCreateService()
+        self.log_ticket_item_create_service = ServiceFactory.get(LogTicketItemCreateService)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+import hashlib
+import itertools
+
+def iterate_chunks(values: Iterable, chunk_size: int) -> Iterator[list]:
+    """
+    Splits an iterable (ie. a storage cursor) in lists, reading only one chunk at a time.
+
+    :param values: the values to split.
+    :param chunk_size: maximum number of values of each chunk.
+    :return: a generator of non empty lists.
+    """
+
+    iterator = iter(values)
+
+    while chunk := list(itertools.islice(iterator, max(1, chunk_size))):
+        yield chunk
+
+class StreamChecksum:
+
+    """
+    SHA-256 of a list of values computed while they're streamed, one chunk at a time.
+
+    The result is the same of `Checksum.from_string()` over the values joined by a newline, without building the string.
+    """
+
+    hash = None
+
+    count = 0
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+
+        self.count = 0
+
+    def update(self, values: list) -> None:
+        """
+        :param values: the next values of the list.
+        """
+
+        if not values:
+            return
+
+        # the separator between the previous chunk and this one
+        if self.count:
+            self.hash.update(b'\n')
+
+        self.hash.update('\n'.join(values).encode())
+
+        self.count += len(values)
+
+    def wrap(self, chunks: Iterable) -> Iterator[list]:
+        """
+        Hashes the chunks of a stream while they're yielded.
+
+        :param chunks: an iterable of lists of values.
+        :return: a generator of the same chunks.
+        """
+
+        for chunk in chunks:
+            self.update(chunk)
+
+            yield chunk
+
+    def hexdigest(self) -> str | None:
+        """
+        :return: the checksum of the values seen so far, None if there were none.
+        """
+
+        if not self.count:
+            return None
+
+        return self.hash.hexdigest()
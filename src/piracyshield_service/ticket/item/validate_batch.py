@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from piracyshield_service.base import BaseService
+
+from piracyshield_component.security.identifier import Identifier
+
+from piracyshield_data_model.ticket.item.model import TicketItemModel
+
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+
+class TicketItemValidateBatchService(BaseService):
+
+    """
+    Validates a whole list of ticket item values of the same genre.
+
+    Every distinct value goes through the data model once, however many times it's repeated,
+    so the rules are always the ones of the model.
+    """
+
+    data_model = None
+
+    # valid identifier used for the other fields of the model
+    placeholder_id = None
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+        self._prepare_modules()
+
+    def execute(self, genre: str, values: list) -> dict:
+        """
+        :param genre: the genre of the values.
+        :param values: list of values.
+        :return: a dictionary of non valid values with the reason, empty if every value is valid.
+        """
+
+        if genre not in (TicketItemGenreModel.FQDN.value, TicketItemGenreModel.IPV4.value, TicketItemGenreModel.IPV6.value):
+            return {value: 'Non valid genre.' for value in values}
+
+        errors = {}
+
+        for value in dict.fromkeys(values):
+            if not self._validate_parameters(genre = genre, value = value):
+                errors[value] = f'Non valid {genre}.'
+
+        return errors
+
+    def _schedule_task(self):
+        pass
+
+    def _validate_parameters(self, genre: str, value: str) -> bool:
+        try:
+            self.data_model(
+                ticket_id = self.placeholder_id,
+                ticket_item_id = self.placeholder_id,
+                provider_id = self.placeholder_id,
+                value = value,
+                genre = genre,
+                is_active = False,
+                is_duplicate = False,
+                is_whitelisted = False,
+                is_error = False
+            )
+
+            return True
+
+        except Exception:
+            return False
+
+    def _prepare_configs(self):
+        pass
+
+    def _prepare_modules(self):
+        self.data_model = TicketItemModel
+
+        self.placeholder_id = Identifier().generate()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.exception import ApplicationException
 
 from piracyshield_service.ticket.item.remove_all import TicketItemRemoveAllService
@@ -46,4 +48,4 @@ class TicketRelationAbandonService(BaseService):
         pass
 
     def _prepare_modules(self):
-        self.ticket_item_remove_all_service = TicketItemRemoveAllService()
+        self.ticket_item_remove_all_service = ServiceFactory.get(TicketItemRemoveAllService)
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from piracyshield_component.log.logger import Logger
+
+from piracyshield_service.connection import ConnectionRegistry
+
+import itertools
+import json
+import threading
+import time
+
+class ActiveItemCache:
+
+    """
+    Long-lived copy of the active ticket items and whitelist items, kept by each worker process.
+
+    The rq worker runs each job in a forked work-horse that exits afterwards, so the copy is kept up to date by
+    the worker itself before every fork (see `CacheWarmingWorker`) and each work-horse inherits it, ready to use.
+
+    Every change bumps a version counter in Redis and appends a delta to a bounded journal.
+    Workers replay the deltas they missed and rebuild a source from the storage only when:
+    - the journal no longer holds every missed version (gap);
+    - a delta can't be applied incrementally (ie. removals);
+    - the copy is older than `max_age`, as a safety net for lost deltas.
+
+    The sources are built and compiled outside of the shared lock and swapped in when ready. Deltas are applied
+    to copies of the changed sets, so the returned dictionaries are never modified once returned and must be treated as read-only.
+    """
+
+    TICKET_ITEM = 'ticket_item'
+
+    WHITELIST = 'whitelist'
+
+    key_prefix = 'active_item_cache'
+
+    # deltas kept in the journal
+    max_journal_size = 1000
+
+    # seconds before a source is rebuilt regardless of the deltas
+    max_age = 300
+
+    logger = None
+
+    # source -> (version, built_at, values grouped by genre, revision)
+    _sources = {}
+
+    # source -> (revision, compiled structure)
+    _compiled = {}
+
+    # changes each time the values of a source change
+    _revisions = itertools.count(1)
+
+    # guards the dictionaries above, never held while building or compiling
+    _lock = threading.Lock()
+
+    # source -> lock held while rebuilding it
+    _build_locks = {}
+
+    # bumps the version and appends the delta atomically, so the journal has no holes
+    _PUBLISH_SCRIPT = """
+        local version = redis.call('INCR', KEYS[1])
+        redis.call('ZADD', KEYS[2], version, version .. ':' .. ARGV[1])
+        redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -(tonumber(ARGV[2]) + 1))
+        return version
+    """
+
+    @classmethod
+    def get(cls, source: str, builder: callable) -> dict:
+        """
+        Returns the up to date values of a source, grouped by genre.
+
+        :param source: `ticket_item` or `whitelist`.
+        :param builder: a function returning the values from the storage, as a dictionary of lists.
+        :return: a dictionary of sets.
+        """
+
+        return cls._get_entry(source, builder)[2]
+
+    @classmethod
+    def get_compiled(cls, source: str, builder: callable, compiler: callable) -> any:
+        """
+        Returns a structure compiled from the values of a source, compiled again only when they change.
+
+        :param source: `ticket_item` or `whitelist`.
+        :param builder: a function returning the values from the storage, as a dictionary of lists.
+        :param compiler: a function receiving the values and returning the compiled structure.
+        :return: the compiled structure.
+        """
+
+        (version, built_at, values, revision) = cls._get_entry(source, builder)
+
+        with cls._lock:
+            compiled = cls._compiled.get(source)
+
+        if compiled is not None and compiled[0] == revision:
+            return compiled[1]
+
+        # the values of a revision never change, so they're compiled without holding the lock
+        compiled = (revision, compiler(values))
+
+        with cls._lock:
+            current = cls._compiled.get(source)
+
+            if current is None or current[0] < revision:
+                cls._compiled[source] = compiled
+
+        return compiled[1]
+
+    @classmethod
+    def publish_add(cls, source: str, values: dict) -> None:
+        """
+        Notifies the workers of new active values.
+
+        :param source: `ticket_item` or `whitelist`.
+        :param values: a dictionary of genres and lists of values.
+        """
+
+        values = {genre: list(genre_values) for genre, genre_values in values.items() if genre_values}
+
+        if values:
+            cls._publish({
+                'source': source,
+                'operation': 'add',
+                'values': values
+            })
+
+    @classmethod
+    def publish_invalidate(cls, source: str) -> None:
+        """
+        Notifies the workers that a source must be rebuilt.
+
+        :param source: `ticket_item` or `whitelist`.
+        """
+
+        cls._publish({
+            'source': source,
+            'operation': 'invalidate'
+        })
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._sources = {}
+
+            cls._compiled = {}
+
+    @classmethod
+    def _get_entry(cls, source: str, builder: callable) -> tuple:
+        # read before the version, so a cached version higher than the current one means that Redis has been reset
+        with cls._lock:
+            entry = cls._sources.get(source)
+
+        redis_connection = ConnectionRegistry.get_task_redis()
+
+        current_version = int(redis_connection.get(cls._get_version_key()) or 0)
+
+        if entry is None or entry[0] > current_version or time.monotonic() - entry[1] > cls.max_age:
+            return cls._rebuild(source, builder, current_version, entry)
+
+        (version, built_at, values, revision) = entry
+
+        if version == current_version:
+            return entry
+
+        deltas = redis_connection.zrangebyscore(cls._get_journal_key(), version + 1, current_version)
+
+        if len(deltas) != current_version - version:
+            cls._get_logger().debug(f'Version gap for `{source}` ({version} -> {current_version}), rebuilding')
+
+            return cls._rebuild(source, builder, current_version, entry)
+
+        # the cached sets may be in use by other threads and compiled structures, so the changed ones are copied
+        values = dict(values)
+
+        for delta in deltas:
+            delta = json.loads(delta.decode().split(':', 1)[1])
+
+            if delta.get('source') != source:
+                continue
+
+            if delta.get('operation') != 'add':
+                return cls._rebuild(source, builder, current_version, entry)
+
+            for genre, genre_values in delta.get('values').items():
+                values[genre] = values.get(genre, set()).union(genre_values)
+
+            revision = next(cls._revisions)
+
+        entry = (current_version, built_at, values, revision)
+
+        with cls._lock:
+            stored = cls._sources.get(source)
+
+            # another thread may have stored a newer copy in the meantime
+            if stored is not None and stored[0] > current_version:
+                return stored
+
+            cls._sources[source] = entry
+
+        return entry
+
+    @classmethod
+    def _rebuild(cls, source: str, builder: callable, version: int, stale_entry: tuple = None) -> tuple:
+        with cls._lock:
+            build_lock = cls._build_locks.setdefault(source, threading.Lock())
+
+        # a single thread builds each source, while the others keep reading the cached copies
+        with build_lock:
+            with cls._lock:
+                stored = cls._sources.get(source)
+
+            if stored is not None and stored is not stale_entry and stored[0] >= version:
+                return stored
+
+            # the version is read before the build, so the changes made in the meantime are replayed later
+            values = {genre: set(genre_values) for genre, genre_values in (builder() or {}).items()}
+
+            entry = (version, time.monotonic(), values, next(cls._revisions))
+
+            with cls._lock:
+                cls._sources[source] = entry
+
+        return entry
+
+    @classmethod
+    def _publish(cls, delta: dict) -> None:
+        try:
+            ConnectionRegistry.get_task_redis().eval(
+                cls._PUBLISH_SCRIPT,
+                2,
+                cls._get_version_key(),
+                cls._get_journal_key(),
+                json.dumps(delta),
+                cls.max_journal_size
+            )
+
+        # the change is already stored, the workers catch up at the latest after `max_age`
+        except Exception as e:
+            cls._get_logger().error(f'Could not publish the `{delta.get("source")}` cache delta: {e}')
+
+    @classmethod
+    def _get_logger(cls) -> Logger:
+        if cls.logger is None:
+            cls.logger = Logger('service')
+
+        return cls.logger
+
+    @classmethod
+    def _get_version_key(cls) -> str:
+        return f'{cls.key_prefix}:version'
+
+    @classmethod
+    def _get_journal_key(cls) -> str:
+        return f'{cls.key_prefix}:journal'
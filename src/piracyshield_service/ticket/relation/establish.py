@@ -2,20 +2,31 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
-from piracyshield_component.security.identifier import Identifier
+from piracyshield_service.factory import ServiceFactory, LazyService
+
+from piracyshield_service.identifier import OrderedIdentifier
+
 from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
-from piracyshield_data_model.whitelist.genre.model import WhitelistGenreModel
 
 from piracyshield_service.ticket.item.create_batch import TicketItemCreateBatchService
 from piracyshield_service.ticket.item.get_active import TicketItemGetActiveService
+from piracyshield_service.ticket.item.matcher import TicketItemMatcher
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
 
 from piracyshield_service.whitelist.get_active import WhitelistGetActiveService
 
+from piracyshield_service.whitelist.matcher import WhitelistMatcher
+
+from piracyshield_service.ticket.relation.cache import ActiveItemCache
+from piracyshield_service.ticket.relation.parallel import RelationFlagPool, compute_flags
+
+from piracyshield_service.config import ConfigCache
+
 from piracyshield_service.ticket.item.errors import TicketItemErrorCode, TicketItemErrorMessage
 
-from piracyshield_component_cidr_verifier import is_ipv4_in_cidr, is_ipv6_in_cidr
+import itertools
 
 class TicketRelationEstablishService(BaseService):
 
@@ -24,20 +35,26 @@ class TicketRelationEstablishService(BaseService):
     Each ticket item is created and associated to a single provider.
     """
 
-    batch = []
-
-    ticket_item_cache = {}
-
-    whitelist_cache = {}
-
     ticket_item_create_service = None
 
+    # only needed on failure
+    ticket_relation_abandon_service = LazyService('piracyshield_service.ticket.relation.abandon.TicketRelationAbandonService')
+
     ticket_item_get_active_service = None
 
     whitelist_get_active_service = None
 
+    provider_blocklist = None
+
     identifier = None
 
+    # used when not set in the `ticket` section of the application config
+    default_parallel_threshold = 10000
+
+    default_shard_size = 2500
+
+    ticket_config = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -45,19 +62,51 @@ class TicketRelationEstablishService(BaseService):
 
         super().__init__()
 
+        self._prepare_configs()
+
         self._prepare_modules()
 
-        # build ticket item cache
-        self._build_ticket_item_cache()
+    def execute(
+        self,
+        ticket_id: str,
+        providers: list,
+        fqdn: list = None,
+        ipv4: list = None,
+        ipv6: list = None,
+        is_validated: bool = False,
+        caches: tuple = None
+    ) -> bool | Exception:
+        """
+        :param ticket_id: the ticket identifier.
+        :param providers: list of provider identifiers.
+        :param fqdn: optional list of FQDN items.
+        :param ipv4: optional list of IPv4 items.
+        :param ipv6: optional list of IPv6 items.
+        :param is_validated: true if the values have been already validated during the creation of the ticket.
+        :param caches: optional active ticket items and whitelist matchers, as returned by `prepare_caches()`.
+        :return: the ticket items of each genre.
+        """
 
-        # build whitelist cache
-        self._build_whitelist_cache()
+        # per-call state, as this service is shared
+        relations = []
 
-    def execute(self, ticket_id: str, providers: list, fqdn: list = None, ipv4: list = None, ipv6: list = None) -> bool | Exception:
-        self.batch = []
+        matchers = caches or self.prepare_caches()
 
         self.logger.debug(f'Establishing relations for `{ticket_id}`')
 
+        flags = self._compute_flags(
+            matchers = matchers,
+            genre_items = {
+                genre: items
+                for genre, items in (
+                    (TicketItemGenreModel.FQDN.value, fqdn),
+                    (TicketItemGenreModel.IPV4.value, ipv4),
+                    (TicketItemGenreModel.IPV6.value, ipv6)
+                )
+                if items
+            }
+        )
+
         fqdn_ticket_items = None
         ipv4_ticket_items = None
         ipv6_ticket_items = None
@@ -67,7 +116,9 @@ class TicketRelationEstablishService(BaseService):
                 ticket_id = ticket_id,
                 genre = TicketItemGenreModel.FQDN.value,
                 items = fqdn,
-                providers = providers
+                providers = providers,
+                relations = relations,
+                flags = flags.get(TicketItemGenreModel.FQDN.value)
             )
 
         if ipv4:
@@ -75,7 +126,9 @@ class TicketRelationEstablishService(BaseService):
                 ticket_id = ticket_id,
                 genre = TicketItemGenreModel.IPV4.value,
                 items = ipv4,
-                providers = providers
+                providers = providers,
+                relations = relations,
+                flags = flags.get(TicketItemGenreModel.IPV4.value)
             )
 
         if ipv6:
@@ -83,109 +136,129 @@ class TicketRelationEstablishService(BaseService):
                 ticket_id = ticket_id,
                 genre = TicketItemGenreModel.IPV6.value,
                 items = ipv6,
-                providers = providers
+                providers = providers,
+                relations = relations,
+                flags = flags.get(TicketItemGenreModel.IPV6.value)
             )
 
-        # insert batch
-        self.ticket_item_create_batch_service.execute(self.batch)
+        try:
+            # the relations are generated while being written, one chunk at a time
+            self.ticket_item_create_batch_service.execute(
+                ticket_items = itertools.chain.from_iterable(relations),
+                is_trusted = is_validated
+            )
+
+        # some chunks may have been written already
+        except Exception:
+            self.logger.error(f'Could not write the relations for `{ticket_id}`, rolling back')
+
+            self.ticket_relation_abandon_service.execute(ticket_id)
+
+            raise
+
+        # the items aren't visible yet, but the lists of every item changed
+        self.provider_blocklist.notify_change()
+
+        # let the other workers know about the new blockable items
+        ActiveItemCache.publish_add(
+            source = ActiveItemCache.TICKET_ITEM,
+            values = {
+                genre: [ticket_item.get('value') for ticket_item in ticket_items if not ticket_item.get('is_whitelisted') and not ticket_item.get('is_error')]
+                for genre, ticket_items in (
+                    (TicketItemGenreModel.FQDN.value, fqdn_ticket_items or []),
+                    (TicketItemGenreModel.IPV4.value, ipv4_ticket_items or []),
+                    (TicketItemGenreModel.IPV6.value, ipv6_ticket_items or [])
+                )
+            }
+        )
 
         self.logger.info(f'Ticket relations completed')
 
         return (fqdn_ticket_items, ipv4_ticket_items, ipv6_ticket_items)
 
-    def _generate_relation(self, ticket_id: str, genre: str, items: list, providers: list) -> dict:
-        ticket_items = []
+    def prepare_caches(self) -> tuple:
+        """
+        Loads the active ticket items and whitelist items.
+        Can be reused across the chunks of the same ticket.
 
-        for value in items:
-            # generate ticket item identifier
-            ticket_item_id = self._generate_ticket_item_id()
+        :return: the ticket items matcher and the whitelist matcher.
+        """
 
-            is_active = True
+        return (self._build_ticket_item_matcher(), self._build_whitelist_matcher())
 
-            is_duplicate = self._is_duplicate(
-                genre = genre,
-                value = value
-            )
+    def _compute_flags(self, matchers: tuple, genre_items: dict) -> dict:
+        """
+        Flags the items of each genre, in a pool of processes for large tickets when enabled.
 
-            is_whitelisted = self._is_whitelisted(
-                genre = genre,
-                value = value
-            )
+        :param matchers: the ticket items matcher and the whitelist matcher.
+        :param genre_items: a dictionary of genres and lists of values.
+        :return: a dictionary of genres and their duplicate and whitelist flags.
+        """
 
-            is_error = False
+        workers = self.ticket_config.get('relation_workers', 1)
 
-            for provider_id in providers:
-                self.batch.append({
-                    'ticket_id': ticket_id,
-                    'ticket_item_id': ticket_item_id,
-                    'value': value,
-                    'genre': genre,
-                    'provider_id': provider_id,
-                    'is_active': is_active,
-                    'is_duplicate': is_duplicate,
-                    'is_whitelisted': is_whitelisted,
-                    'is_error': is_error
-                })
+        if workers > 1 and sum(len(items) for items in genre_items.values()) >= self.ticket_config.get('relation_parallel_threshold', self.default_parallel_threshold):
+            return RelationFlagPool(
+                workers = workers,
+                shard_size = self.ticket_config.get('relation_shard_size', self.default_shard_size)
+            ).compute(matchers, genre_items)
+
+        # flags of the whole list at once, the network lookups are vectorised for large lists of addresses
+        return {genre: compute_flags(matchers, genre, items) for genre, items in genre_items.items()}
 
+    def _generate_relation(self, ticket_id: str, genre: str, items: list, providers: list, relations: list, flags: tuple) -> dict:
+        ticket_items = []
+
+        (duplicate_flags, whitelist_flags) = flags
+
+        for value, is_duplicate, is_whitelisted in zip(items, duplicate_flags, whitelist_flags):
             ticket_items.append({
                 'value': value,
                 'genre': genre,
-                'is_active': is_active,
+                'is_active': True,
                 'is_duplicate': is_duplicate,
                 'is_whitelisted': is_whitelisted,
-                'is_error': is_error
+                'is_error': False
             })
 
-        return ticket_items
-
-    def _is_duplicate(self, genre: str, value: str) -> bool:
-        if genre == TicketItemGenreModel.FQDN.value and TicketItemGenreModel.FQDN.value in self.ticket_item_cache:
-            return value in self.ticket_item_cache.get(TicketItemGenreModel.FQDN.value)
-
-        elif genre == TicketItemGenreModel.IPV4.value and TicketItemGenreModel.IPV4.value in self.ticket_item_cache:
-            return value in self.ticket_item_cache.get(TicketItemGenreModel.IPV4.value)
-
-        elif genre == TicketItemGenreModel.IPV6.value and TicketItemGenreModel.IPV6.value in self.ticket_item_cache:
-            return value in self.ticket_item_cache.get(TicketItemGenreModel.IPV6.value)
+        relations.append(self._iterate_relations(ticket_id, ticket_items, self._generate_ticket_item_ids(len(ticket_items)), providers))
 
-        return False
-
-    def _is_whitelisted(self, genre: str, value: str) -> bool:
-        if genre == TicketItemGenreModel.FQDN.value and TicketItemGenreModel.FQDN.value in self.whitelist_cache:
-            return value in self.whitelist_cache.get(WhitelistGenreModel.FQDN.value)
-
-        elif genre == TicketItemGenreModel.IPV4.value and TicketItemGenreModel.IPV4.value in self.whitelist_cache:
-            if value in self.whitelist_cache.get(WhitelistGenreModel.IPV4.value):
-                return True
-
-            if WhitelistGenreModel.CIDR_IPV4.value in self.whitelist_cache:
-                for cidr_ipv4 in self.whitelist_cache.get(WhitelistGenreModel.CIDR_IPV4.value):
-                    if is_ipv4_in_cidr(value, cidr_ipv4) == True:
-                        return True
-
-        elif genre == TicketItemGenreModel.IPV6.value and TicketItemGenreModel.IPV6.value in self.whitelist_cache:
-            if value in self.whitelist_cache.get(WhitelistGenreModel.IPV6.value):
-                return True
+        return ticket_items
 
-            if WhitelistGenreModel.CIDR_IPV6.value in self.whitelist_cache:
-                for cidr_ipv6 in self.whitelist_cache.get(WhitelistGenreModel.CIDR_IPV6.value):
-                    if is_ipv6_in_cidr(value, cidr_ipv6) == True:
-                        return True
+    def _iterate_relations(self, ticket_id: str, ticket_items: list, ticket_item_ids: list, providers: list) -> iter:
+        """
+        Yields a relation for each ticket item and provider, so the whole matrix is never kept in memory.
+        """
 
-        return False
+        for ticket_item, ticket_item_id in zip(ticket_items, ticket_item_ids):
+            for provider_id in providers:
+                yield {
+                    'ticket_id': ticket_id,
+                    'ticket_item_id': ticket_item_id,
+                    'provider_id': provider_id,
+                    **ticket_item
+                }
 
-    def _generate_ticket_item_id(self) -> str:
+    def _generate_ticket_item_ids(self, count: int) -> list:
         """
-        Generates a UUIDv4.
+        Generates the time-ordered UUIDv7 identifiers of a whole genre at once.
         """
 
-        return self.identifier.generate()
+        return self.identifier.generate_batch(count)
 
-    def _build_ticket_item_cache(self):
-        self.ticket_item_cache = self.ticket_item_get_active_service.execute()
+    def _build_ticket_item_matcher(self) -> TicketItemMatcher:
+        return ActiveItemCache.get_compiled(
+            source = ActiveItemCache.TICKET_ITEM,
+            builder = self.ticket_item_get_active_service.execute,
+            compiler = TicketItemMatcher
+        )
 
-    def _build_whitelist_cache(self):
-        self.whitelist_cache = self.whitelist_get_active_service.execute()
+    def _build_whitelist_matcher(self) -> WhitelistMatcher:
+        return ActiveItemCache.get_compiled(
+            source = ActiveItemCache.WHITELIST,
+            builder = self.whitelist_get_active_service.execute,
+            compiler = WhitelistMatcher
+        )
 
     def _schedule_task(self):
         pass
@@ -194,13 +267,15 @@ class TicketRelationEstablishService(BaseService):
         pass
 
     def _prepare_configs(self):
-        pass
+        self.ticket_config = ConfigCache.get('application').get('ticket', {})
 
     def _prepare_modules(self):
-        self.ticket_item_get_active_service = TicketItemGetActiveService()
+        self.ticket_item_get_active_service = ServiceFactory.get(TicketItemGetActiveService)
+
+        self.ticket_item_create_batch_service = ServiceFactory.get(TicketItemCreateBatchService)
 
-        self.ticket_item_create_batch_service = TicketItemCreateBatchService()
+        self.whitelist_get_active_service = ServiceFactory.get(WhitelistGetActiveService)
 
-        self.whitelist_get_active_service = WhitelistGetActiveService()
+        self.provider_blocklist = ProviderBlocklist()
 
-        self.identifier = Identifier()
+        self.identifier = OrderedIdentifier()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import multiprocessing
+import os
+import pickle
+import tempfile
+import threading
+
+# matchers loaded by the current worker process and the snapshot they come from
+_matchers = None
+
+_matchers_path = None
+
+def compute_flags(matchers: tuple, genre: str, items: list) -> tuple:
+    """
+    Flags a list of items of the same genre.
+
+    :param matchers: the ticket items matcher and the whitelist matcher.
+    :param genre: the genre of the items.
+    :param items: list of values.
+    :return: the duplicate flags and the whitelist flags, in the same order of the items.
+    """
+
+    (ticket_item_matcher, whitelist_matcher) = matchers
+
+    return (
+        ticket_item_matcher.is_duplicate_many(genre, items),
+        whitelist_matcher.is_whitelisted_many(genre, items)
+    )
+
+def _compute_shard(path: str, genre: str, items: list) -> tuple:
+    global _matchers, _matchers_path
+
+    # each worker loads a snapshot once, the following shards reuse it
+    if _matchers_path != path:
+        with open(path, 'rb') as handle:
+            _matchers = pickle.load(handle)
+
+        _matchers_path = path
+
+    return compute_flags(_matchers, genre, items)
+
+class RelationFlagPool:
+
+    """
+    Computes the flags of a ticket items in a pool of processes, split by genre and in shards of items.
+
+    A single pool is kept for the whole process and reused by every ticket. Its workers are started with
+    the `forkserver` method (`spawn` where not available), so they never inherit the threads and locks
+    of the parent, such as the ones of the ticket item writers, and the pool can be started at any time.
+
+    In the task worker the pool lives for a single job: it is started by the work-horse running the job
+    and shut down before the work-horse exits (see `CacheWarmingWorker`), waiting for its processes, as
+    the work-horse leaves with `os._exit` and would not stop them otherwise.
+
+    The matchers are written once to a snapshot file each time they change and each worker loads them
+    on its first shard of that snapshot, instead of receiving them with every shard.
+    Results are merged back in the original order, so the flags are the same of `compute_flags()`.
+    """
+
+    workers = None
+
+    shard_size = None
+
+    _executor = None
+
+    _executor_workers = None
+
+    # the matchers of the current snapshot and its path
+    _snapshot = None
+
+    _lock = threading.Lock()
+
+    def __init__(self, workers: int, shard_size: int = 1000):
+        """
+        :param workers: number of processes.
+        :param shard_size: maximum number of items sent to a worker at once.
+        """
+
+        self.workers = workers
+
+        self.shard_size = max(1, shard_size)
+
+    def compute(self, matchers: tuple, genre_items: dict) -> dict:
+        """
+        :param matchers: the ticket items matcher and the whitelist matcher.
+        :param genre_items: a dictionary of genres and lists of values.
+        :return: a dictionary of genres and their duplicate and whitelist flags.
+        """
+
+        shards = [
+            (genre, items[start:start + self.shard_size])
+            for genre, items in genre_items.items()
+            for start in range(0, len(items), self.shard_size)
+        ]
+
+        flags = {genre: ([], []) for genre in genre_items}
+
+        if not shards:
+            return flags
+
+        # the snapshot must not change while the shards are running
+        with self._lock:
+            executor = self._get_executor(self.workers)
+
+            path = self._get_snapshot(matchers)
+
+            try:
+                results = list(executor.map(_compute_shard, [path] * len(shards), *zip(*shards)))
+
+            # a worker died, the next ticket starts a new pool
+            except BrokenProcessPool:
+                self._stop()
+
+                raise
+
+        # `map` keeps the order of the shards
+        for (genre, _), (duplicate_flags, whitelist_flags) in zip(shards, results):
+            flags[genre][0].extend(duplicate_flags)
+
+            flags[genre][1].extend(whitelist_flags)
+
+        return flags
+
+    @classmethod
+    def start(cls, workers: int) -> None:
+        """
+        Starts the shared pool ahead of the first ticket.
+
+        :param workers: number of processes.
+        """
+
+        with cls._lock:
+            cls._get_executor(workers)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Stops the shared pool, waiting for its processes to exit, and removes the matchers snapshot.
+        """
+
+        with cls._lock:
+            cls._stop(wait = True)
+
+    @classmethod
+    def _stop(cls, wait: bool = False) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait = wait, cancel_futures = True)
+
+            cls._executor = None
+
+        if cls._snapshot is not None:
+            cls._remove_snapshot(cls._snapshot[1])
+
+            cls._snapshot = None
+
+    @classmethod
+    def _get_executor(cls, workers: int) -> ProcessPoolExecutor:
+        if cls._executor is not None and cls._executor_workers != workers:
+            cls._executor.shutdown(wait = True)
+
+            cls._executor = None
+
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(
+                max_workers = workers,
+                mp_context = cls._get_context()
+            )
+
+            cls._executor_workers = workers
+
+        return cls._executor
+
+    @classmethod
+    def _get_snapshot(cls, matchers: tuple) -> str:
+        # the compiled matchers are shared until the active items change, so they're compared by identity
+        if cls._snapshot is not None and all(current is new for current, new in zip(cls._snapshot[0], matchers)):
+            return cls._snapshot[1]
+
+        (descriptor, path) = tempfile.mkstemp(prefix = 'relation_matchers_', suffix = '.pickle')
+
+        with os.fdopen(descriptor, 'wb') as handle:
+            pickle.dump(matchers, handle, protocol = pickle.HIGHEST_PROTOCOL)
+
+        if cls._snapshot is not None:
+            cls._remove_snapshot(cls._snapshot[1])
+
+        cls._snapshot = (matchers, path)
+
+        return path
+
+    @classmethod
+    def _remove_snapshot(cls, path: str) -> None:
+        try:
+            os.remove(path)
+
+        except OSError:
+            pass
+
+    @classmethod
+    def _get_context(cls) -> multiprocessing.context.BaseContext:
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context('forkserver')
+
+        return multiprocessing.get_context('spawn')
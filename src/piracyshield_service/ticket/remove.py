@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
@@ -11,8 +13,6 @@ from piracyshield_service.ticket.relation.abandon import TicketRelationAbandonSe
 
 from piracyshield_service.ticket.get import TicketGetService
 
-from piracyshield_service.ticket.tasks.remove_logs import remove_logs_task_caller
-
 from piracyshield_service.forensic.remove_by_ticket import ForensicRemoveByTicketService
 
 from piracyshield_service.ticket.errors import TicketErrorCode, TicketErrorMessage
@@ -91,7 +91,7 @@ class TicketRemoveService(BaseService):
     def _schedule_task(self, ticket_id: str):
         try:
             self.task_service.create(
-                task_caller = remove_logs_task_caller,
+                task_caller = 'piracyshield_service.ticket.tasks.remove_logs.remove_logs_task_caller',
                 delay = 1,
                 ticket_id = ticket_id
             )
@@ -110,8 +110,8 @@ class TicketRemoveService(BaseService):
     def _prepare_modules(self):
         self.data_storage = TicketStorage()
 
-        self.forensic_remove_by_ticket_service = ForensicRemoveByTicketService()
+        self.forensic_remove_by_ticket_service = ServiceFactory.get(ForensicRemoveByTicketService)
 
-        self.ticket_relation_abandon_service = TicketRelationAbandonService()
+        self.ticket_relation_abandon_service = ServiceFactory.get(TicketRelationAbandonService)
 
-        self.ticket_get_service = TicketGetService()
+        self.ticket_get_service = ServiceFactory.get(TicketGetService)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from piracyshield_service.base import BaseService
+
+from piracyshield_service.factory import LazyService
+
+from piracyshield_component.exception import ApplicationException
+
+from piracyshield_service.provider.cache import ProviderCache
+
+from piracyshield_service.dda.cache import DDACache
+
+from piracyshield_service.ticket.errors import TicketErrorCode, TicketErrorMessage
+
+class TicketResolveAssignmentService(BaseService):
+
+    """
+    Verifies the DDA identifier and resolves the providers of a new ticket in a single step.
+
+    Both lookups are served by the process caches, so the storage is queried only when they're cold,
+    and once for all the identifiers not found there.
+    """
+
+    dda_is_assigned_to_account_service = LazyService('piracyshield_service.dda.is_assigned_to_account.DDAIsAssignedToAccountService')
+
+    provider_exists_by_identifier_service = LazyService('piracyshield_service.provider.exists_by_identifier.ProviderExistsByIdentifierService')
+
+    provider_get_active_service = LazyService('piracyshield_service.provider.get_active.ProviderGetActiveService')
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+    def execute(self, dda_id: str, account_id: str, assigned_to: list = None) -> list | Exception:
+        """
+        :param dda_id: the DDA identifier of the ticket.
+        :param account_id: the reporter account identifier.
+        :param assigned_to: optional list of provider identifiers.
+        :return: the provider identifiers, every provider when none is specified.
+        """
+
+        # check if the DDA identifier is assigned to this account
+        if DDACache.is_assigned_to_account(
+            dda_id = dda_id,
+            account_id = account_id,
+            builder = lambda: self.dda_is_assigned_to_account_service.execute(
+                dda_id = dda_id,
+                account_id = account_id
+            )
+        ) == False:
+            raise ApplicationException(TicketErrorCode.UNKNOWN_DDA_IDENTIFIER, TicketErrorMessage.UNKNOWN_DDA_IDENTIFIER)
+
+        providers = ProviderCache.get_identifiers(self._get_providers)
+
+        # otherwise collect all the providers
+        if not assigned_to:
+            return list(providers)
+
+        # the active providers surely exist, the others are verified all together
+        unknown_providers = ProviderCache.get_missing(
+            provider_ids = list(set(assigned_to).difference(providers)),
+            builder = self.provider_exists_by_identifier_service.execute_many
+        )
+
+        if unknown_providers:
+            self.logger.error(f'Could not get assigned accounts: `{list(unknown_providers)}`')
+
+            raise ApplicationException(TicketErrorCode.NON_EXISTENT_ASSIGNED_TO, TicketErrorMessage.NON_EXISTENT_ASSIGNED_TO)
+
+        return assigned_to
+
+    def _get_providers(self) -> list:
+        return [provider.get('account_id') for provider in self.provider_get_active_service.execute()]
+
+    def _schedule_task(self):
+        pass
+
+    def _validate_parameters(self):
+        pass
+
+    def _prepare_configs(self):
+        pass
+
+    def _prepare_modules(self):
+        pass
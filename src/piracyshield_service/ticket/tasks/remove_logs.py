@@ -1,5 +1,7 @@
 from piracyshield_service.task.base import BaseTask
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_service.log.ticket.remove_all import LogTicketRemoveAllService
 
 class RemoveLogsTask(BaseTask):
@@ -31,7 +33,7 @@ class RemoveLogsTask(BaseTask):
         Initialize required modules.
         """
 
-        self.log_ticket_remove_all_service = LogTicketRemoveAllService()
+        self.log_ticket_remove_all_service = ServiceFactory.get(LogTicketRemoveAllService)
 
     def after_run(self):
         pass
@@ -1,11 +1,16 @@
 from piracyshield_service.task.base import BaseTask
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_data_model.ticket.status.model import TicketStatusModel
 
 from piracyshield_data_storage.ticket.storage import TicketStorage, TicketStorageUpdateException
 
 from piracyshield_service.log.ticket.create import LogTicketCreateService
 
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 class TicketAutocloseTask(BaseTask):
 
     """
@@ -18,6 +23,8 @@ class TicketAutocloseTask(BaseTask):
 
     log_ticket_create_service = None
 
+    provider_blocklist = None
+
     def __init__(self, ticket_id: str):
         super().__init__()
 
@@ -37,13 +44,20 @@ class TicketAutocloseTask(BaseTask):
             ticket_status = TicketStatusModel.CLOSED.value
         )
 
+        # the values may still be blocked through other tickets, so the lists are built again
+        self.provider_blocklist.invalidate()
+
+        TicketItemListCache.invalidate(self.ticket_id)
+
     def before_run(self):
         """
         Initialize required modules.
         """
         self.ticket_storage = TicketStorage()
 
-        self.log_ticket_create_service = LogTicketCreateService()
+        self.log_ticket_create_service = ServiceFactory.get(LogTicketCreateService)
+
+        self.provider_blocklist = ProviderBlocklist()
 
     def after_run(self):
         # log the operation
@@ -1,43 +1,39 @@
 from piracyshield_service.task.base import BaseTask
 
+from piracyshield_service.factory import ServiceFactory, LazyService
+
 from piracyshield_component.utils.time import Time
 
 from piracyshield_data_model.ticket.status.model import TicketStatusModel
 
 from piracyshield_data_storage.ticket.storage import TicketStorage
 
-from piracyshield_service.ticket.relation.establish import TicketRelationEstablishService
-from piracyshield_service.ticket.relation.abandon import TicketRelationAbandonService
-from piracyshield_service.ticket.get import TicketGetService
-
-from piracyshield_service.forensic.remove_by_ticket import ForensicRemoveByTicketService
-
-from piracyshield_service.ticket.tasks.ticket_initialize import ticket_initialize_task_caller
-from piracyshield_service.ticket.tasks.ticket_autoclose import ticket_autoclose_task_caller
-
-from piracyshield_service.log.ticket.create import LogTicketCreateService
-
 from piracyshield_service.task.service import TaskService
 
+from piracyshield_service.ticket.chunk_store import TicketChunkStore
+
 class TicketCreateTask(BaseTask):
 
     """
     Creation of ticket items and subsequent tasks.
     """
 
-    pending_tasks = []
+    pending_tasks = None
 
     ticket_data = None
 
-    ticket_relation_establish_service = None
+    ticket_relation_establish_service = LazyService('piracyshield_service.ticket.relation.establish.TicketRelationEstablishService')
 
-    ticket_relation_abandon_service = None
+    # only needed on failure
+    ticket_relation_abandon_service = LazyService('piracyshield_service.ticket.relation.abandon.TicketRelationAbandonService')
 
-    ticket_get_service = None
+    forensic_remove_by_ticket_service = LazyService('piracyshield_service.forensic.remove_by_ticket.ForensicRemoveByTicketService')
+
+    log_ticket_create_service = LazyService('piracyshield_service.log.ticket.create.LogTicketCreateService')
 
     ticket_storage = None
 
-    log_ticket_create_service = None
+    ticket_chunk_store = None
 
     task_service = None
 
@@ -46,6 +42,9 @@ class TicketCreateTask(BaseTask):
 
         self.ticket_data = ticket_data
 
+        # must not be shared between jobs
+        self.pending_tasks = []
+
     def run(self) -> bool:
         """
         Starts the operations for the new ticket.
@@ -54,22 +53,28 @@ class TicketCreateTask(BaseTask):
 
         # proceed to build the relation item <-> provider
         # this part provides a check for duplicates, whitelisted items and error tickets
-        (fqdn_ticket_items, ipv4_ticket_items, ipv6_ticket_items) = self.ticket_relation_establish_service.execute(
-            ticket_id = self.ticket_data.get('ticket_id'),
-            providers = self.ticket_data.get('assigned_to'),
-            fqdn = self.ticket_data.get('fqdn') or None,
-            ipv4 = self.ticket_data.get('ipv4') or None,
-            ipv6 = self.ticket_data.get('ipv6') or None
-        )
-
+        if self.ticket_data.get('chunks'):
+            self._establish_chunks(self.ticket_data.get('chunks'))
+
+        else:
+            self.ticket_relation_establish_service.execute(
+                ticket_id = self.ticket_data.get('ticket_id'),
+                providers = self.ticket_data.get('assigned_to'),
+                fqdn = self.ticket_data.get('fqdn') or None,
+                ipv4 = self.ticket_data.get('ipv4') or None,
+                ipv6 = self.ticket_data.get('ipv6') or None,
+                is_validated = self.ticket_data.get('is_validated', False)
+            )
+
+        # the ticket becomes visible only once every chunk has been committed
         self.pending_tasks.append(self.task_service.create(
-            task_caller = ticket_initialize_task_caller,
+            task_caller = 'piracyshield_service.ticket.tasks.ticket_initialize.ticket_initialize_task_caller',
             delay = self.ticket_data.get('settings').get('revoke_time'),
             ticket_id = self.ticket_data.get('ticket_id')
         ))
 
         self.pending_tasks.append(self.task_service.create(
-            task_caller = ticket_autoclose_task_caller,
+            task_caller = 'piracyshield_service.ticket.tasks.ticket_autoclose.ticket_autoclose_task_caller',
             delay = self.ticket_data.get('settings').get('autoclose_time'),
             ticket_id = self.ticket_data.get('ticket_id')
         ))
@@ -82,26 +87,50 @@ class TicketCreateTask(BaseTask):
 
         return True
 
-    def before_run(self):
+    def _establish_chunks(self, chunks: int) -> None:
         """
-        Initialize required modules.
+        Builds the relations one chunk at a time, so only a single chunk is kept in memory.
+
+        :param chunks: the number of chunks.
         """
 
-        self.ticket_storage = TicketStorage()
+        # loaded once for the whole ticket
+        caches = self.ticket_relation_establish_service.prepare_caches()
 
-        self.ticket_get_service = TicketGetService()
+        for index in range(chunks):
+            chunk = self.ticket_chunk_store.get(self.ticket_data.get('ticket_id'), index)
 
-        self.ticket_relation_establish_service = TicketRelationEstablishService()
+            if chunk is None:
+                raise ValueError(f'Missing chunk {index} of {chunks}')
 
-        self.ticket_relation_abandon_service = TicketRelationAbandonService()
+            self.ticket_relation_establish_service.execute(
+                ticket_id = self.ticket_data.get('ticket_id'),
+                providers = self.ticket_data.get('assigned_to'),
+                fqdn = chunk.get('fqdn') or None,
+                ipv4 = chunk.get('ipv4') or None,
+                ipv6 = chunk.get('ipv6') or None,
+                is_validated = self.ticket_data.get('is_validated', False),
+                caches = caches
+            )
+
+            self.logger.debug(f'Committed chunk {index + 1} of {chunks} for `{self.ticket_data.get("ticket_id")}`')
+
+    def before_run(self):
+        """
+        Initialize required modules.
+        """
 
-        self.forensic_remove_by_ticket_service = ForensicRemoveByTicketService()
+        self.ticket_storage = TicketStorage()
 
-        self.log_ticket_create_service = LogTicketCreateService()
+        self.task_service = ServiceFactory.get(TaskService)
 
-        self.task_service = TaskService()
+        if self.ticket_data.get('chunks'):
+            self.ticket_chunk_store = TicketChunkStore()
 
     def after_run(self):
+        if self.ticket_chunk_store:
+            self.ticket_chunk_store.remove(self.ticket_data.get('ticket_id'))
+
         self.ticket_storage.update_status(
             ticket_id = self.ticket_data.get('ticket_id'),
             ticket_status = TicketStatusModel.CREATED.value
@@ -123,6 +152,9 @@ class TicketCreateTask(BaseTask):
         for single_task in self.pending_tasks:
             self.task_service.remove(single_task)
 
+        if self.ticket_chunk_store:
+            self.ticket_chunk_store.remove(self.ticket_data.get('ticket_id'))
+
         self.ticket_storage.update_status(
             ticket_id = self.ticket_data.get('ticket_id'),
             ticket_status = TicketStatusModel.FAILED.value
@@ -0,0 +1,69 @@
+from piracyshield_service.task.base import BaseTask
+
+from piracyshield_service.ticket.tasks.ticket_create import TicketCreateTask
+
+class TicketCreateBulkTask(BaseTask):
+
+    """
+    Creation of the ticket items of multiple tickets, created in bulk.
+    """
+
+    tickets_data = None
+
+    def __init__(self, tickets_data: list):
+        super().__init__()
+
+        self.tickets_data = tickets_data
+
+    def run(self) -> bool:
+        """
+        Runs the creation of each ticket.
+        Every ticket keeps its own rollback, so a failure doesn't affect the rest of the batch.
+        """
+
+        # errors by ticket identifier
+        errors = {}
+
+        for ticket_data in self.tickets_data:
+            try:
+                TicketCreateTask(ticket_data = ticket_data).execute()
+
+            except Exception as e:
+                errors[ticket_data.get('ticket_id')] = str(e)
+
+        if errors:
+            self.logger.error(f'Could not initialize ticket items for `{list(errors)}`')
+
+            self._save_errors(errors)
+
+        return not errors
+
+    def _save_errors(self, errors: dict) -> None:
+        """
+        Stores the error of every failed ticket in the job, as each ticket task shares it and only keeps its own.
+
+        :param errors: a dictionary of ticket identifiers and errors.
+        """
+
+        if self.job is None:
+            return
+
+        self.job.meta['error'] = f'Could not initialize ticket items for {len(errors)} tickets'
+
+        self.job.meta['errors'] = errors
+
+        self.job.save_meta()
+
+    def before_run(self):
+        pass
+
+    def after_run(self):
+        pass
+
+    def on_failure(self):
+        pass
+
+def ticket_create_bulk_task_caller(**kwargs):
+    t = TicketCreateBulkTask(**kwargs)
+
+    return t.execute()
@@ -1,11 +1,15 @@
 from piracyshield_service.task.base import BaseTask
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_data_model.ticket.status.model import TicketStatusModel
 
 from piracyshield_data_storage.ticket.storage import TicketStorage
 
 from piracyshield_service.log.ticket.create import LogTicketCreateService
 
+from piracyshield_service.ticket.item.publish_by_ticket import TicketItemPublishByTicketService
+
 class TicketInitializeTask(BaseTask):
 
     """
@@ -18,6 +22,8 @@ class TicketInitializeTask(BaseTask):
 
     log_ticket_create_service = None
 
+    ticket_item_publish_by_ticket_service = None
+
     def __init__(self, ticket_id: str):
         super().__init__()
 
@@ -37,13 +43,18 @@ class TicketInitializeTask(BaseTask):
             ticket_status = TicketStatusModel.OPEN.value
         )
 
+        # the items are now visible to the providers
+        self.ticket_item_publish_by_ticket_service.execute(self.ticket_id)
+
     def before_run(self):
         """
         Initialize required modules.
         """
         self.ticket_storage = TicketStorage()
 
-        self.log_ticket_create_service = LogTicketCreateService()
+        self.log_ticket_create_service = ServiceFactory.get(LogTicketCreateService)
+
+        self.ticket_item_publish_by_ticket_service = ServiceFactory.get(TicketItemPublishByTicketService)
 
     def after_run(self):
         # log the operation
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from piracyshield_service.base import BaseService
+
+from piracyshield_service.factory import ServiceFactory
+
+from piracyshield_component.exception import ApplicationException
+
+from piracyshield_data_model.whitelist.genre.model import WhitelistGenreModel
+
+from piracyshield_service.whitelist.get_active import WhitelistGetActiveService
+
+from piracyshield_service.whitelist.matcher import WhitelistMatcher
+
+from piracyshield_service.ticket.relation.cache import ActiveItemCache
+
+from piracyshield_service.whitelist.errors import WhitelistErrorCode, WhitelistErrorMessage
+
+class WhitelistCheckService(BaseService):
+
+    """
+    Checks a list of values against the active whitelist.
+    """
+
+    whitelist_get_active_service = None
+
+    def __init__(self):
+        """
+        Inizialize logger and required modules.
+        """
+
+        super().__init__()
+
+        self._prepare_modules()
+
+    def execute(self, genre: str, values: list) -> list | Exception:
+        """
+        :param genre: the genre of the values (`fqdn`, `ipv4` or `ipv6`).
+        :param values: list of values.
+        :return: a list of values with the whitelist item covering them, if any.
+        """
+
+        self._validate_parameters(genre)
+
+        whitelist_matcher = self._get_whitelist_matcher()
+
+        flags = whitelist_matcher.is_whitelisted_many(genre, values)
+
+        return [
+            {
+                'value': value,
+                'is_whitelisted': is_whitelisted,
+                'whitelisted_by': whitelist_matcher.get_entry(genre, value) if is_whitelisted else None
+            }
+            for value, is_whitelisted in zip(values, flags)
+        ]
+
+    def _get_whitelist_matcher(self) -> WhitelistMatcher:
+        return ActiveItemCache.get_compiled(
+            source = ActiveItemCache.WHITELIST,
+            builder = self.whitelist_get_active_service.execute,
+            compiler = WhitelistMatcher
+        )
+
+    def _schedule_task(self):
+        pass
+
+    def _validate_parameters(self, genre: str):
+        if genre not in (WhitelistGenreModel.FQDN.value, WhitelistGenreModel.IPV4.value, WhitelistGenreModel.IPV6.value):
+            raise ApplicationException(WhitelistErrorCode.NON_VALID_GENRE, WhitelistErrorMessage.NON_VALID_GENRE)
+
+    def _prepare_configs(self):
+        pass
+
+    def _prepare_modules(self):
+        self.whitelist_get_active_service = ServiceFactory.get(WhitelistGetActiveService)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from piracyshield_service.base import BaseService
 
+from piracyshield_service.factory import ServiceFactory
+
 from piracyshield_component.utils.time import Time
 from piracyshield_component.exception import ApplicationException
 
@@ -24,12 +26,22 @@ from piracyshield_data_model.whitelist.model import (
     WhitelistModelASCodeNonValidException
 )
 
+from piracyshield_data_model.whitelist.genre.model import WhitelistGenreModel
+
 from piracyshield_data_storage.whitelist.storage import WhitelistStorage, WhitelistStorageCreateException, WhitelistStorageGetException
 
 from piracyshield_service.whitelist.exists_by_value import WhitelistExistsByValueService
+from piracyshield_service.whitelist.get_active import WhitelistGetActiveService
+
+from piracyshield_service.whitelist.matcher import WhitelistMatcher
 
 from piracyshield_service.ticket.item.exists_by_value import TicketItemExistsByValueService
 
+from piracyshield_service.ticket.relation.cache import ActiveItemCache
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 from piracyshield_service.whitelist.errors import WhitelistErrorCode, WhitelistErrorMessage
 
 class WhitelistCreateService(BaseService):
@@ -42,8 +54,12 @@ class WhitelistCreateService(BaseService):
 
     whitelist_exists_by_value_service = None
 
+    whitelist_get_active_service = None
+
     data_storage = None
 
+    provider_blocklist = None
+
     data_model = None
 
     def __init__(self):
@@ -70,6 +86,18 @@ class WhitelistCreateService(BaseService):
         ):
             raise ApplicationException(WhitelistErrorCode.ITEM_EXISTS, WhitelistErrorMessage.ITEM_EXISTS)
 
+        # check if the item is already part of a whitelisted network or domain
+        if model.get('genre') in (WhitelistGenreModel.FQDN.value, WhitelistGenreModel.IPV4.value, WhitelistGenreModel.IPV6.value):
+            entry = self._get_whitelist_matcher().get_entry(
+                genre = model.get('genre'),
+                value = model.get('value')
+            )
+
+            if entry:
+                self.logger.debug(f'Whitelist item `{model.get("value")}` already covered by `{entry}`')
+
+                raise ApplicationException(WhitelistErrorCode.ITEM_COVERED, WhitelistErrorMessage.ITEM_COVERED)
+
         if self.ticket_item_exists_by_value_service.execute(
             genre = model.get('genre'),
             value = model.get('value')
@@ -92,12 +120,31 @@ class WhitelistCreateService(BaseService):
 
             raise ApplicationException(WhitelistErrorCode.GENERIC, WhitelistErrorMessage.GENERIC, e)
 
+        ActiveItemCache.publish_add(
+            source = ActiveItemCache.WHITELIST,
+            values = {
+                document.get('genre'): [document.get('value')]
+            }
+        )
+
+        # pulls are built again with the new whitelist state
+        self.provider_blocklist.invalidate()
+
+        TicketItemListCache.invalidate()
+
         self.logger.info(f'Whitelist item `{document.get("value")}` created by `{document.get("metadata").get("created_by")}`')
 
         # NOTE: should we consider a task to mark all the pre existent items as whitelisted?
 
         return True
 
+    def _get_whitelist_matcher(self) -> WhitelistMatcher:
+        return ActiveItemCache.get_compiled(
+            source = ActiveItemCache.WHITELIST,
+            builder = self.whitelist_get_active_service.execute,
+            compiler = WhitelistMatcher
+        )
+
     def _build_document(self, model: dict, now: str, created_by: str) -> dict:
         document = {
             'genre': model.get('genre'),
@@ -201,6 +248,10 @@ class WhitelistCreateService(BaseService):
 
         self.data_storage = WhitelistStorage()
 
-        self.whitelist_exists_by_value_service = WhitelistExistsByValueService()
+        self.whitelist_exists_by_value_service = ServiceFactory.get(WhitelistExistsByValueService)
+
+        self.whitelist_get_active_service = ServiceFactory.get(WhitelistGetActiveService)
+
+        self.ticket_item_exists_by_value_service = ServiceFactory.get(TicketItemExistsByValueService)
 
-        self.ticket_item_exists_by_value_service = TicketItemExistsByValueService()
+        self.provider_blocklist = ProviderBlocklist()
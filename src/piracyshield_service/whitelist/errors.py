@@ -41,6 +41,10 @@ class WhitelistErrorCode:
 
     CANNOT_SET_STATUS = '6019'
 
+    ITEM_COVERED = '6020'
+
+    NON_VALID_CURSOR = '6021'
+
 class WhitelistErrorMessage:
 
     GENERIC = 'Error during the creation of the whitelist item.'
@@ -82,3 +86,7 @@ class WhitelistErrorMessage:
     CANNOT_REMOVE = 'The item could not be removed. Ensure you have proper permissions or to specify a valid item.'
 
     CANNOT_SET_STATUS = 'Cannot update the status of the whitelist item.'
+
+    ITEM_COVERED = 'This item is already covered by a whitelisted CIDR class or parent domain.'
+
+    NON_VALID_CURSOR = 'Non valid pagination cursor.'
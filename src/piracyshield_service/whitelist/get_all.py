@@ -6,6 +6,8 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.whitelist.storage import WhitelistStorage, WhitelistStorageGetException
 
+from piracyshield_service.pagination import KeysetPaginator, PaginationCursorException, PaginationKeyException
+
 from piracyshield_service.whitelist.errors import WhitelistErrorCode, WhitelistErrorMessage
 
 class WhitelistGetAllService(BaseService):
@@ -16,6 +18,8 @@ class WhitelistGetAllService(BaseService):
 
     data_storage = None
 
+    paginator = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -43,6 +47,40 @@ class WhitelistGetAllService(BaseService):
 
             raise ApplicationException(WhitelistErrorCode.GENERIC, WhitelistErrorMessage.GENERIC, e)
 
+    def execute_page(self, account_id: str, cursor: str = None, limit: int = None, fields: list = None) -> dict | Exception:
+        """
+        Returns a page of whitelist items, to go through them without reading them all.
+
+        :param account_id: the account identifier.
+        :param cursor: the cursor of the previous page, None for the first page.
+        :param limit: number of whitelist items of the page.
+        :param fields: optional list of fields to return (ie. `genre`, `value`).
+        :return: the `items` of the page and the `cursor` of the next page, None if this is the last one.
+        """
+
+        try:
+            return self.paginator.paginate_storage(
+                self.data_storage,
+                'get_all',
+                account_id = account_id,
+                cursor = cursor,
+                limit = limit,
+                fields = fields
+            )
+
+        except PaginationCursorException:
+            raise ApplicationException(WhitelistErrorCode.NON_VALID_CURSOR, WhitelistErrorMessage.NON_VALID_CURSOR)
+
+        except PaginationKeyException as e:
+            self.logger.error(f'Could not paginate, a document has no `{e}`')
+
+            raise ApplicationException(WhitelistErrorCode.GENERIC, WhitelistErrorMessage.GENERIC, e)
+
+        except WhitelistStorageGetException as e:
+            self.logger.error(f'Cannot get all the whitelist items')
+
+            raise ApplicationException(WhitelistErrorCode.GENERIC, WhitelistErrorMessage.GENERIC, e)
+
     def _schedule_task(self):
         pass
 
@@ -54,3 +92,5 @@ class WhitelistGetAllService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = WhitelistStorage()
+
+        self.paginator = KeysetPaginator(key = ('value',))
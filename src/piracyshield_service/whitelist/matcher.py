@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+from piracyshield_data_model.whitelist.genre.model import WhitelistGenreModel
+
+from piracyshield_service import packed
+
+import ipaddress
+
+class CIDRMatcher:
+
+    """
+    Longest prefix match over a set of networks of the same IP version.
+
+    Networks are stored in a path-compressed binary trie (Patricia) over the packed addresses,
+    so a lookup costs at most one step per prefix bit, regardless of the number of networks.
+    """
+
+    bits = None
+
+    size = 0
+
+    def __init__(self, version: int, networks: list = ()):
+        """
+        :param version: 4 or 6.
+        :param networks: optional list of networks in CIDR notation.
+        """
+
+        self.version = version
+
+        self.bits = 32 if version == 4 else 128
+
+        self.root = None
+
+        for network in networks:
+            self.add(network)
+
+    def add(self, network: str) -> bool:
+        """
+        Adds a network.
+
+        :param network: a network in CIDR notation, host bits are ignored.
+        :return: true if added, false if not valid.
+        """
+
+        try:
+            network = ipaddress.ip_network(network, strict = False)
+
+        except (ValueError, TypeError):
+            return False
+
+        if network.version != self.version:
+            return False
+
+        self.root = self._insert(self.root, int(network.network_address), network.prefixlen, str(network))
+
+        self.size += 1
+
+        return True
+
+    def match(self, address: str | int) -> str | None:
+        """
+        Returns the most specific network containing the address.
+
+        :param address: an IP address or its packed integer.
+        :return: the network in CIDR notation or None.
+        """
+
+        if not isinstance(address, int):
+            try:
+                address = ipaddress.ip_address(address)
+
+            except (ValueError, TypeError):
+                return None
+
+            if address.version != self.version:
+                return None
+
+            address = int(address)
+
+        best = None
+
+        node = self.root
+
+        while node is not None:
+            (prefix, length, network, children) = node
+
+            # the address diverges from this branch
+            if (address ^ prefix) >> (self.bits - length):
+                break
+
+            if network is not None:
+                best = network
+
+            if length == self.bits:
+                break
+
+            node = children[(address >> (self.bits - 1 - length)) & 1]
+
+        return best
+
+    def __contains__(self, address: str | int) -> bool:
+        return self.match(address) is not None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _insert(self, node: list, prefix: int, length: int, network: str) -> list:
+        # nodes are [prefix, prefix length, network or None for branches, [left, right]]
+        if node is None:
+            return [prefix, length, network, [None, None]]
+
+        common = min(node[1], length, self._get_common_length(node[0], prefix))
+
+        if common == node[1]:
+            # same network
+            if length == node[1]:
+                node[2] = network
+
+                return node
+
+            # the new network is below this node
+            bit = self._get_bit(prefix, node[1])
+
+            node[3][bit] = self._insert(node[3][bit], prefix, length, network)
+
+            return node
+
+        # the new network contains this node
+        if common == length:
+            parent = [prefix, length, network, [None, None]]
+
+            parent[3][self._get_bit(node[0], length)] = node
+
+            return parent
+
+        # split on the first different bit
+        branch = [self._get_network_address(prefix, common), common, None, [None, None]]
+
+        branch[3][self._get_bit(prefix, common)] = [prefix, length, network, [None, None]]
+
+        branch[3][self._get_bit(node[0], common)] = node
+
+        return branch
+
+    def _get_common_length(self, a: int, b: int) -> int:
+        return self.bits - (a ^ b).bit_length()
+
+    def _get_bit(self, value: int, position: int) -> int:
+        return (value >> (self.bits - 1 - position)) & 1
+
+    def _get_network_address(self, value: int, length: int) -> int:
+        host_bits = self.bits - length
+
+        return (value >> host_bits) << host_bits
+
+class FQDNMatcher:
+
+    """
+    Domain match over a set of whitelisted FQDNs.
+
+    Entries are stored in a trie of reversed labels (`cdn.example.org` -> `org`, `example`, `cdn`),
+    so a lookup costs one step per label of the tested value, regardless of the number of entries:
+    - `example.org` covers itself and every subdomain;
+    - `*.example.org` covers the subdomains only.
+    """
+
+    WILDCARD = '*'
+
+    # key of the entry ending on a node, labels are never empty
+    ENTRY = ''
+
+    size = 0
+
+    def __init__(self, entries: list = ()):
+        """
+        :param entries: optional list of FQDNs, wildcard entries included.
+        """
+
+        self.root = {}
+
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: str) -> bool:
+        """
+        Adds an entry.
+
+        :param entry: a FQDN, optionally prefixed by `*.`.
+        :return: true if added, false if not valid.
+        """
+
+        labels = self._get_labels(entry)
+
+        # the wildcard is allowed only as the leftmost label of a domain
+        if not labels or len(labels) < 2 or self.WILDCARD in labels[:-1]:
+            return False
+
+        node = self.root
+
+        for label in labels:
+            node = node.setdefault(label, {})
+
+        if self.ENTRY not in node:
+            self.size += 1
+
+        node[self.ENTRY] = entry
+
+        return True
+
+    def match(self, value: str) -> str | None:
+        """
+        Returns the most specific entry covering a FQDN.
+
+        :param value: the FQDN.
+        :return: the whitelisted entry or None.
+        """
+
+        labels = self._get_labels(value)
+
+        if not labels:
+            return None
+
+        best = None
+
+        node = self.root
+
+        for position, label in enumerate(labels):
+            # the wildcard only covers what's below it
+            wildcard = node.get(self.WILDCARD)
+
+            if wildcard is not None and self.ENTRY in wildcard:
+                best = wildcard[self.ENTRY]
+
+            node = node.get(label)
+
+            if node is None:
+                break
+
+            if self.ENTRY in node:
+                best = node[self.ENTRY]
+
+        return best
+
+    def __contains__(self, value: str) -> bool:
+        return self.match(value) is not None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _get_labels(self, value: str) -> list | None:
+        if not isinstance(value, str):
+            return None
+
+        value = value.lower().rstrip('.')
+
+        if not value:
+            return None
+
+        labels = value.split('.')
+
+        if '' in labels:
+            return None
+
+        labels.reverse()
+
+        return labels
+
+class WhitelistMatcher:
+
+    """
+    Compiled view of the active whitelist items, used to test ticket item values.
+
+    Large lists of IP addresses are tested against the whitelisted networks in sorted integer arrays
+    when NumPy is available.
+    """
+
+    VERSIONS = {
+        WhitelistGenreModel.IPV4.value: 4,
+        WhitelistGenreModel.IPV6.value: 6
+    }
+
+    def __init__(self, whitelist: dict):
+        """
+        :param whitelist: the active whitelist items grouped by genre, as returned by `WhitelistGetActiveService`.
+        """
+
+        whitelist = whitelist or {}
+
+        self.values = {
+            WhitelistGenreModel.FQDN.value: set(whitelist.get(WhitelistGenreModel.FQDN.value) or ()),
+            WhitelistGenreModel.IPV4.value: set(whitelist.get(WhitelistGenreModel.IPV4.value) or ()),
+            WhitelistGenreModel.IPV6.value: set(whitelist.get(WhitelistGenreModel.IPV6.value) or ())
+        }
+
+        self.cidrs = {
+            WhitelistGenreModel.IPV4.value: tuple(whitelist.get(WhitelistGenreModel.CIDR_IPV4.value) or ()),
+            WhitelistGenreModel.IPV6.value: tuple(whitelist.get(WhitelistGenreModel.CIDR_IPV6.value) or ())
+        }
+
+        self.domains = FQDNMatcher(self.values.get(WhitelistGenreModel.FQDN.value))
+
+        self.networks = {genre: CIDRMatcher(self.VERSIONS.get(genre), cidrs) for genre, cidrs in self.cidrs.items()}
+
+        # built on first use
+        self.packed = {}
+
+    def is_whitelisted(self, genre: str, value: str) -> bool:
+        """
+        :param genre: the genre of the value (`fqdn`, `ipv4` or `ipv6`).
+        :param value: the value to test.
+        :return: true if the value, one of its parent domains or one of its networks is whitelisted.
+        """
+
+        if value in self.values.get(genre, ()):
+            return True
+
+        if genre == WhitelistGenreModel.FQDN.value:
+            return len(self.domains) > 0 and value in self.domains
+
+        networks = self.networks.get(genre)
+
+        return networks is not None and len(networks) > 0 and value in networks
+
+    def is_whitelisted_many(self, genre: str, values: list) -> list:
+        """
+        :param genre: the genre of the values.
+        :param values: list of values.
+        :return: list of booleans, in the same order.
+        """
+
+        existent = self.values.get(genre, ())
+
+        networks = self.networks.get(genre)
+
+        if networks is None or not len(networks) or not packed.should_vectorize(values):
+            return [self.is_whitelisted(genre, value) for value in values]
+
+        # exact values are already hashed, only the network lookups are vectorised
+        remaining = [value for value in values if value not in existent]
+
+        contained = dict(zip(remaining, self._get_packed(genre).contains_many(remaining)))
+
+        return [value in existent or contained.get(value, False) for value in values]
+
+    def get_entry(self, genre: str, value: str) -> str | None:
+        """
+        Returns the whitelist item covering a value.
+
+        :param genre: the genre of the value (`fqdn`, `ipv4` or `ipv6`).
+        :param value: the value to test.
+        :return: the value itself, the covering domain or network, or None.
+        """
+
+        if value in self.values.get(genre, ()):
+            return value
+
+        if genre == WhitelistGenreModel.FQDN.value:
+            return self.domains.match(value)
+
+        return self.get_network(genre, value)
+
+    def get_network(self, genre: str, value: str) -> str | None:
+        """
+        Returns the whitelisted network containing an IP address.
+
+        :param genre: `ipv4` or `ipv6`.
+        :param value: the IP address.
+        :return: the network in CIDR notation or None.
+        """
+
+        networks = self.networks.get(genre)
+
+        if networks is None:
+            return None
+
+        return networks.match(value)
+
+    def _get_packed(self, genre: str) -> packed.PackedNetworkSet:
+        if genre not in self.packed:
+            self.packed[genre] = packed.PackedNetworkSet(self.VERSIONS.get(genre), self.cidrs.get(genre))
+
+        return self.packed[genre]
@@ -6,6 +6,11 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.whitelist.storage import WhitelistStorage, WhitelistStorageRemoveException
 
+from piracyshield_service.ticket.relation.cache import ActiveItemCache
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 from piracyshield_service.whitelist.errors import WhitelistErrorCode, WhitelistErrorMessage
 
 class WhitelistRemoveService(BaseService):
@@ -16,6 +21,8 @@ class WhitelistRemoveService(BaseService):
 
     data_storage = None
 
+    provider_blocklist = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -35,6 +42,12 @@ class WhitelistRemoveService(BaseService):
             if not affected_rows:
                 raise ApplicationException(WhitelistErrorCode.CANNOT_REMOVE, WhitelistErrorMessage.CANNOT_REMOVE)
 
+            ActiveItemCache.publish_invalidate(ActiveItemCache.WHITELIST)
+
+            self.provider_blocklist.invalidate()
+
+            TicketItemListCache.invalidate()
+
             # NOTE: should we consider a task to mark all the pre existent items as non whitelisted anymore?
 
         except WhitelistStorageRemoveException as e:
@@ -53,3 +66,5 @@ class WhitelistRemoveService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = WhitelistStorage()
+
+        self.provider_blocklist = ProviderBlocklist()
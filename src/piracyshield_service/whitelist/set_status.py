@@ -6,6 +6,11 @@ from piracyshield_component.exception import ApplicationException
 
 from piracyshield_data_storage.whitelist.storage import WhitelistStorage, WhitelistStorageUpdateException
 
+from piracyshield_service.ticket.relation.cache import ActiveItemCache
+
+from piracyshield_service.ticket.item.blocklist import ProviderBlocklist
+from piracyshield_service.ticket.item.list_cache import TicketItemListCache
+
 from piracyshield_service.whitelist.errors import WhitelistErrorCode, WhitelistErrorMessage
 
 class WhitelistSetStatusService(BaseService):
@@ -16,6 +21,8 @@ class WhitelistSetStatusService(BaseService):
 
     data_storage = None
 
+    provider_blocklist = None
+
     def __init__(self):
         """
         Inizialize logger and required modules.
@@ -42,6 +49,12 @@ class WhitelistSetStatusService(BaseService):
 
             raise ApplicationException(WhitelistErrorCode.GENERIC, WhitelistErrorMessage.GENERIC, e)
 
+        ActiveItemCache.publish_invalidate(ActiveItemCache.WHITELIST)
+
+        self.provider_blocklist.invalidate()
+
+        TicketItemListCache.invalidate()
+
         return True
 
     def _schedule_task(self):
@@ -55,3 +68,5 @@ class WhitelistSetStatusService(BaseService):
 
     def _prepare_modules(self):
         self.data_storage = WhitelistStorage()
+
+        self.provider_blocklist = ProviderBlocklist()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from piracyshield_component.log.logger import Logger
+
+from piracyshield_service.connection import ConnectionRegistry
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from redis.exceptions import RedisError
+
+import itertools
+import threading
+import time
+
+def insert_documents(storage: object, documents: list) -> None:
+    """
+    Inserts a list of documents with a single `insert_many()` when the storage has it, one `insert()` at a time otherwise.
+
+    :param storage: the storage instance.
+    :param documents: the documents to insert.
+    """
+
+    insert_many = getattr(storage, 'insert_many', None)
+
+    if insert_many is not None:
+        insert_many(documents)
+
+        return
+
+    for document in documents:
+        storage.insert(document)
+
+class ChunkedWriter:
+
+    """
+    Writes a stream of documents in chunks, keeping at most a few chunks in memory.
+
+    The chunk size adapts to the observed insert latency: it doubles while the inserts are faster
+    than half of `target_latency` and halves when they are slower, within `min_chunk_size` and `max_chunk_size`.
+    With more than one worker, up to `workers` chunks are inserted concurrently.
+
+    Each job runs in its own work-horse process, so a named writer keeps the learned chunk size in Redis:
+    it's read before each write and stored after it, shared by every worker and job writing to the same place.
+    """
+
+    key_prefix = 'chunked_writer'
+
+    # seconds before a learned chunk size is dropped and the configured one is used again
+    max_age = 86400
+
+    name = None
+
+    chunk_size = None
+
+    min_chunk_size = None
+
+    max_chunk_size = None
+
+    # seconds
+    target_latency = None
+
+    workers = None
+
+    def __init__(
+        self,
+        insert: callable,
+        chunk_size: int = 1000,
+        min_chunk_size: int = 100,
+        max_chunk_size: int = 10000,
+        target_latency: float = 0.5,
+        workers: int = 1,
+        name: str = None
+    ):
+        """
+        :param insert: a function receiving a list of documents.
+        :param chunk_size: initial number of documents per insert.
+        :param min_chunk_size: lower bound of the adaptive chunk size.
+        :param max_chunk_size: upper bound of the adaptive chunk size.
+        :param target_latency: desired duration of a single insert, in seconds.
+        :param workers: number of concurrent inserts.
+        :param name: identifies the learned chunk size in Redis, kept only by this instance when not set.
+        """
+
+        self.insert = insert
+
+        self.min_chunk_size = max(1, min_chunk_size)
+
+        self.max_chunk_size = max(self.min_chunk_size, max_chunk_size)
+
+        self.chunk_size = min(max(chunk_size, self.min_chunk_size), self.max_chunk_size)
+
+        self.target_latency = target_latency
+
+        self.workers = max(1, workers)
+
+        self.name = name
+
+        self.logger = None
+
+        self._lock = threading.Lock()
+
+    def write(self, documents: iter) -> int:
+        """
+        Consumes the documents and inserts them.
+        On failure the in-flight inserts are awaited and the first error is raised, the caller must roll back.
+
+        :param documents: an iterable of documents.
+        :return: the number of written documents.
+        """
+
+        documents = iter(documents)
+
+        self._load_chunk_size()
+
+        try:
+            if self.workers == 1:
+                written = 0
+
+                for chunk in self._iterate_chunks(documents):
+                    written += self._insert(chunk)
+
+                return written
+
+            return self._write_concurrently(documents)
+
+        # the latencies observed by a failed write are still worth keeping
+        finally:
+            self._store_chunk_size()
+
+    def _write_concurrently(self, documents: iter) -> int:
+        written = 0
+
+        pending = set()
+
+        with ThreadPoolExecutor(max_workers = self.workers) as executor:
+            try:
+                for chunk in self._iterate_chunks(documents):
+                    # bounded memory, don't read ahead more than one chunk per worker
+                    if len(pending) >= self.workers:
+                        (done, pending) = wait(pending, return_when = FIRST_COMPLETED)
+
+                        for future in done:
+                            written += future.result()
+
+                    pending.add(executor.submit(self._insert, chunk))
+
+            finally:
+                (done, _) = wait(pending)
+
+            for future in done:
+                written += future.result()
+
+        return written
+
+    def _iterate_chunks(self, documents: iter) -> iter:
+        while True:
+            # the size is read again for each chunk as it changes with the latency
+            chunk = list(itertools.islice(documents, self.chunk_size))
+
+            if not chunk:
+                return
+
+            yield chunk
+
+    def _insert(self, chunk: list) -> int:
+        start = time.monotonic()
+
+        self.insert(chunk)
+
+        self._adapt(time.monotonic() - start)
+
+        return len(chunk)
+
+    def _adapt(self, latency: float) -> None:
+        with self._lock:
+            if latency > self.target_latency:
+                self.chunk_size = max(self.min_chunk_size, self.chunk_size // 2)
+
+            elif latency < self.target_latency / 2:
+                self.chunk_size = min(self.max_chunk_size, self.chunk_size * 2)
+
+    def _load_chunk_size(self) -> None:
+        if self.name is None:
+            return
+
+        try:
+            chunk_size = ConnectionRegistry.get_task_redis().get(self._get_key())
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not read the chunk size of `{self.name}`: {e}')
+
+            return
+
+        # the bounds may have changed since it was stored
+        if chunk_size is not None:
+            self.chunk_size = min(max(int(chunk_size), self.min_chunk_size), self.max_chunk_size)
+
+    def _store_chunk_size(self) -> None:
+        if self.name is None:
+            return
+
+        try:
+            ConnectionRegistry.get_task_redis().set(self._get_key(), self.chunk_size, ex = self.max_age)
+
+        except RedisError as e:
+            self._get_logger().error(f'Could not store the chunk size of `{self.name}`: {e}')
+
+    def _get_key(self) -> str:
+        return f'{self.key_prefix}:{self.name}'
+
+    def _get_logger(self) -> Logger:
+        if self.logger is None:
+            self.logger = Logger('service')
+
+        return self.logger